@@ -1,7 +1,9 @@
 from online_shopping_cart.shop.shop_search_and_purchase import search_and_purchase_product
+from online_shopping_cart.checkout.checkout_process import preload
 
 
 def assignment_one_online_shopping_cart_app():
+    preload()  # Load products before the first prompt
     search_and_purchase_product()  # Run program
 
 
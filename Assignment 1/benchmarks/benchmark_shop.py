@@ -0,0 +1,164 @@
+import os
+import sys
+
+if __name__ == '__main__' and not __package__:  # Run by path, which puts benchmarks/ and not the project on the path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from online_shopping_cart.product.product_search import display_filtered_table
+from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.product.product_snapshot import get_snapshot_file_name
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.user.user_authentication import UserAuthenticator
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.data.data_generator import generate_products, generate_users, write_products_file, \
+    write_users_file
+from contextlib import redirect_stdout
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+import platform
+import random
+import json
+
+#######################
+# BENCHMARK CONSTANTS #
+#######################
+
+
+DEFAULT_SIZES: list[int] = [1_000, 100_000]
+DEFAULT_OPERATIONS: int = 1_000
+DEFAULT_OUTPUT_FILE_NAME: str = 'benchmark_results.json'
+BENCHMARK_SEED: int = 1234
+
+
+#######################
+# BENCHMARK FUNCTIONS #
+#######################
+
+
+def summarize(latencies: list[float]) -> dict[str, float | int]:
+    latencies = sorted(latencies)
+    total_seconds: float = sum(latencies)
+    return {
+        'operations': len(latencies),
+        'ops_per_second': len(latencies) / total_seconds if total_seconds else 0.0,
+        'p50_seconds': latencies[int(0.50 * (len(latencies) - 1))],
+        'p99_seconds': latencies[int(0.99 * (len(latencies) - 1))]
+    }
+
+
+def measure(operation: Callable[[int], object], operations: int) -> dict[str, float | int]:
+    latencies: list[float] = list()
+    for i in range(operations):
+        start_time: float = perf_counter()
+        operation(i)
+        latencies.append(perf_counter() - start_time)
+    return summarize(latencies=latencies)
+
+
+def run_benchmarks(size: int, operations: int, work_directory: str) -> dict[str, dict[str, float | int]]:
+    """
+    Run every benchmark against a catalog and a user file of the given size
+    """
+    randomizer: random.Random = random.Random(BENCHMARK_SEED)
+    products_file_name: str = os.path.join(work_directory, f'products_{size}.csv')
+    users_file_name: str = os.path.join(work_directory, f'users_{size}.json')
+    write_products_file(file_name=products_file_name, count=size, seed=BENCHMARK_SEED)
+    write_users_file(file_name=users_file_name, count=size, seed=BENCHMARK_SEED)
+    names: list[str] = [name for name, _, _ in generate_products(count=size, seed=BENCHMARK_SEED)]
+    passwords: dict[str, str] = {
+        user['username']: user['password'] for user in generate_users(count=size, seed=BENCHMARK_SEED)
+    }
+    usernames: list[str] = list(passwords)
+    results: dict[str, dict[str, float | int]] = dict()
+
+    def load_products_from_csv(_) -> None:
+        if os.path.exists(get_snapshot_file_name(csv_file_name=products_file_name)):
+            os.remove(get_snapshot_file_name(csv_file_name=products_file_name))
+        get_products(file_name=products_file_name)
+
+    # Catalog loads are expensive at scale, so they are measured a few times only
+    results['get_products_csv'] = measure(load_products_from_csv, operations=3)
+    results['get_products_snapshot'] = measure(lambda _: get_products(file_name=products_file_name), operations=3)
+
+    queries: list[str] = [randomizer.choice(names).lower() for _ in range(operations)]
+    with open(os.devnull, mode='w') as devnull, redirect_stdout(devnull):
+        display_filtered_table(csv_file_name=products_file_name, search_target=queries[0])  # Build the index
+        results['display_filtered_table'] = measure(
+            lambda i: display_filtered_table(csv_file_name=products_file_name, search_target=queries[i]),
+            operations=operations
+        )
+
+    cart: ShoppingCart = ShoppingCart()
+    cart_products: list[Product] = [Product(name=name, price=1.5, units=1) for name in names]
+    results['cart_add_item'] = measure(lambda i: cart.add_item(product=cart_products[i % size]), operations=size)
+    results['cart_get_total_price'] = measure(lambda _: cart.get_total_price(), operations=operations)
+    results['cart_remove_item'] = measure(lambda i: cart.remove_item(product=cart_products[i % size]), operations=size)
+
+    user_file_name: str = UserDataManager.USER_FILE_PATHNAME
+    UserDataManager.USER_FILE_PATHNAME = users_file_name
+    try:
+        logins: list[str] = [randomizer.choice(usernames) for _ in range(operations)]
+        with open(os.devnull, mode='w') as devnull, redirect_stdout(devnull):
+            UserDataManager.load_users()  # Load the store once, as a running shop would have
+            results['user_login'] = measure(
+                lambda i: UserAuthenticator.login(logins[i], passwords[logins[i]], UserDataManager.load_users()),
+                operations=operations
+            )
+        results['update_wallet'] = measure(
+            lambda i: UserDataManager.update_wallet(logins[i], float(i)),
+            operations=operations
+        )
+    finally:
+        UserDataManager.USER_FILE_PATHNAME = user_file_name
+    return results
+
+
+def compare_results(previous: dict, current: dict) -> None:
+    """
+    Print how the throughput of every benchmark changed since a previous run
+    """
+    for size, benchmarks in current['results'].items():
+        for name, result in benchmarks.items():
+            previous_result: dict | None = previous.get('results', {}).get(size, {}).get(name)
+            if previous_result and previous_result['ops_per_second']:
+                ratio: float = result['ops_per_second'] / previous_result['ops_per_second']
+                print(f'{size:>10} {name:<24} {ratio:6.2f}x ops/s')
+
+
+def benchmark_shop():
+    parser: ArgumentParser = ArgumentParser(description='Benchmark the shop hot paths at several data sizes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='products and users per run')
+    parser.add_argument('--operations', type=int, default=DEFAULT_OPERATIONS, help='operations per benchmark')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_FILE_NAME, help='JSON file the results are written to')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    arguments = parser.parse_args()
+
+    report: dict = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'operations': arguments.operations,
+        'results': dict()
+    }
+    with TemporaryDirectory() as work_directory:
+        for size in arguments.sizes:
+            report['results'][str(size)] = run_benchmarks(
+                size=size, operations=arguments.operations, work_directory=work_directory
+            )
+            for name, result in report['results'][str(size)].items():
+                print(f"{size:>10} {name:<24} {result['ops_per_second']:>14.1f} ops/s  "
+                      f"p50 {result['p50_seconds'] * 1e6:>10.1f}us  p99 {result['p99_seconds'] * 1e6:>10.1f}us")
+
+    with open(file=arguments.output, mode='w') as file:
+        json.dump(report, file, indent=2)
+    if arguments.compare:
+        with open(file=arguments.compare, mode='r') as file:
+            compare_results(previous=json.load(file), current=report)
+
+
+if __name__ == '__main__':
+    benchmark_shop()
@@ -0,0 +1,80 @@
+from online_shopping_cart.shop.shop_search_and_purchase import search_and_purchase_product
+from online_shopping_cart.user.user_input_source import ScriptInputSource
+from online_shopping_cart.user.user_interface import UserInterface
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.metrics.metrics_registry import METRICS
+from contextlib import redirect_stdout
+from argparse import ArgumentParser
+from time import perf_counter
+import os
+
+
+def get_percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(percentile / 100 * len(sorted_values)))]
+
+
+def run_headless_sessions(script_file_name: str) -> dict[str, int | float]:
+    """
+    Replay the recorded sessions of a script through the shop until the script runs out
+    """
+    input_source: ScriptInputSource = ScriptInputSource(file_name=script_file_name)
+    UserInterface.set_input_source(input_source=input_source)
+    checkout_process.preload()
+
+    session_seconds: list[float] = list()
+    incomplete_sessions: int = 0
+    start_time: float = perf_counter()
+    while True:
+        session_start_time: float = perf_counter()
+        session_start_inputs: int = input_source.read_count
+        try:
+            search_and_purchase_product()
+        except SystemExit:  # The session logged out or quit
+            session_seconds.append(perf_counter() - session_start_time)
+        except EOFError:  # The script ran out, possibly in the middle of a session
+            if input_source.read_count > session_start_inputs:
+                incomplete_sessions += 1
+            break
+    total_seconds: float = perf_counter() - start_time
+
+    session_seconds.sort()
+    return {
+        'sessions': len(session_seconds),
+        'incomplete_sessions': incomplete_sessions,
+        'inputs': input_source.read_count,
+        'total_seconds': total_seconds,
+        'sessions_per_second': len(session_seconds) / total_seconds if total_seconds else 0.0,
+        'p50_session_seconds': get_percentile(sorted_values=session_seconds, percentile=50),
+        'p99_session_seconds': get_percentile(sorted_values=session_seconds, percentile=99)
+    }
+
+
+def headless_online_shopping_cart_app():
+    parser: ArgumentParser = ArgumentParser(description='Replay scripted shop sessions without a terminal')
+    parser.add_argument('script', help='JSON-lines file with one answer (or a list of answers) per line')
+    parser.add_argument('--verbose', action='store_true', help='show the shop output instead of discarding it')
+    parser.add_argument('--metrics', help='file to write the metrics to (run with SHOP_METRICS=1), '
+                                          'in Prometheus text format if it ends with .prom, otherwise JSON')
+    arguments = parser.parse_args()
+
+    if arguments.verbose:
+        summary: dict[str, int | float] = run_headless_sessions(script_file_name=arguments.script)
+    else:
+        with open(os.devnull, mode='w') as devnull, redirect_stdout(devnull):
+            summary: dict[str, int | float] = run_headless_sessions(script_file_name=arguments.script)
+
+    print(f"Sessions: {summary['sessions']} ({summary['incomplete_sessions']} incomplete, {summary['inputs']} inputs) "
+          f"in {summary['total_seconds']:.3f}s")
+    print(f"Throughput: {summary['sessions_per_second']:.1f} sessions/s")
+    print(f"Session latency: p50 {summary['p50_session_seconds'] * 1000:.3f}ms, "
+          f"p99 {summary['p99_session_seconds'] * 1000:.3f}ms")
+
+    if arguments.metrics:
+        with open(file=arguments.metrics, mode='w') as file:
+            file.write(METRICS.to_prometheus() if arguments.metrics.endswith('.prom') else METRICS.to_json())
+
+
+if __name__ == '__main__':
+    headless_online_shopping_cart_app()
@@ -1,18 +1,46 @@
+from online_shopping_cart.metrics.metrics_registry import METRICS, timed
 from online_shopping_cart.checkout.shopping_cart import ShoppingCart
-from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.checkout.session_manager import Session, SessionManager
+from online_shopping_cart.product.product_data import PRODUCTS_FILE_PATHNAME, get_products
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_autocomplete import ProductAutocomplete
+from online_shopping_cart.product.product_inventory import ProductInventory
+from online_shopping_cart.product.product_range_index import ProductRangeIndex
+from online_shopping_cart.product.product_journal import InventoryJournal
+from online_shopping_cart.product.product_shared_memory import SharedProductCatalog, SharedSalesJournal
 from online_shopping_cart.user.user_interface import UserInterface
 from online_shopping_cart.product.product import Product
 from online_shopping_cart.user.user_logout import logout
 from online_shopping_cart.user.user import User
 from online_shopping_cart.user.user_data import UserDataManager
+from threading import Lock
+
+##############################
+# CHECKOUT PROCESS CONSTANTS #
+##############################
+
+
+CHECKOUT_EMPTY_CART: str = 'empty_cart'
+CHECKOUT_INSUFFICIENT_FUNDS: str = 'insufficient_funds'
+CHECKOUT_OUT_OF_STOCK: str = 'out_of_stock'
+CHECKOUT_COMPLETED: str = 'completed'
+
 
 ############################
 # CHECKOUT PROCESS GLOBALS #
 ############################
 
 
-global_products: list[Product] = get_products()  # Load products from CSV
-global_cart: ShoppingCart = ShoppingCart()
+global_products: ProductCatalog | None = None  # Loaded from CSV on first use
+global_products_lock: Lock = Lock()
+global_journal: InventoryJournal | SharedSalesJournal | None = None  # Persists the units sold from the global products
+global_inventory: ProductInventory | None = None  # Reservations over the global products
+global_autocomplete: ProductAutocomplete | None = None  # Name completions over the global products
+global_range_index: ProductRangeIndex | None = None  # Price and units ranges over the global products
+global_cart: ShoppingCart = ShoppingCart()  # Used when checking out without a session
+global_session_manager: SessionManager = SessionManager(
+    on_evict=lambda session: get_global_inventory().release_all(owner=session.session_id)
+)
 
 
 ##############################
@@ -20,24 +48,146 @@ global_cart: ShoppingCart = ShoppingCart()
 ##############################
 
 
-def checkout(user, cart) -> None:
+def get_global_products() -> ProductCatalog:
     """
-    Complete the checkout process
+    Retrieve the global products, loading them from CSV the first time they are needed
     """
-    global global_products
+    global global_products, global_journal
 
-    if not cart.items:
-        print('Your basket is empty. Please add items before checking out.')
-        return
+    if global_products is None:
+        with global_products_lock:
+            if global_products is None:  # Another thread may have loaded them while waiting for the lock
+                products: ProductCatalog = get_products()
+                journal: InventoryJournal = InventoryJournal(csv_file_name=PRODUCTS_FILE_PATHNAME)
+                journal.replay(catalog=products)  # Sales not yet written into the CSV file
+                global_journal = journal
+                global_products = products
+    return global_products
+
+
+def get_global_inventory() -> ProductInventory:
+    """
+    Retrieve the inventory over the global products, starting a new one when the global products are replaced
+    """
+    global global_inventory
+
+    products: ProductCatalog = get_global_products()
+    inventory: ProductInventory | None = global_inventory
+    if inventory is None or inventory.catalog is not products:
+        with global_products_lock:
+            if global_inventory is None or global_inventory.catalog is not products:
+                journal: InventoryJournal | None = global_journal
+                global_inventory = ProductInventory(
+                    catalog=products,
+                    journal=journal if journal is not None and journal.catalog is products else None
+                )
+            inventory = global_inventory
+    return inventory
+
+
+def get_global_autocomplete() -> ProductAutocomplete:
+    """
+    Retrieve the name completions over the global products, building them again when the global products are replaced
+    or another process changed their stock
+    """
+    global global_autocomplete
+
+    products: ProductCatalog = get_global_products()
+    autocomplete: ProductAutocomplete | None = global_autocomplete
+    if autocomplete is None or autocomplete.catalog is not products or autocomplete.is_outdated():
+        with global_products_lock:
+            if global_autocomplete is None or global_autocomplete.catalog is not products or \
+                    global_autocomplete.is_outdated():
+                if global_autocomplete is not None:
+                    global_autocomplete.close()
+                global_autocomplete = ProductAutocomplete(catalog=products)
+            autocomplete = global_autocomplete
+    return autocomplete
+
+
+def get_global_range_index() -> ProductRangeIndex:
+    """
+    Retrieve the price and units index over the global products, building it again when the global products are replaced
+    or another process changed their stock
+    """
+    global global_range_index
+
+    products: ProductCatalog = get_global_products()
+    range_index: ProductRangeIndex | None = global_range_index
+    if range_index is None or range_index.catalog is not products or range_index.is_outdated():
+        with global_products_lock:
+            if global_range_index is None or global_range_index.catalog is not products or \
+                    global_range_index.is_outdated():
+                if global_range_index is not None:
+                    global_range_index.close()
+                global_range_index = ProductRangeIndex(catalog=products)
+            range_index = global_range_index
+    return range_index
+
+
+def preload() -> None:
+    """
+    Load the global products ahead of their first use
+    """
+    get_global_products()
+
+
+def use_global_products(products: ProductCatalog) -> None:
+    """
+    Serve the shop from a given catalog, such as a shared catalog in a worker process. The sales are journaled only
+    through a shared catalog created with a journal, which sends them to the process that created it.
+    """
+    global global_products, global_journal
+
+    with global_products_lock:
+        global_products = products
+        global_journal = products.sales_journal if isinstance(products, SharedProductCatalog) else None
+
+
+def complete_purchase(user, cart, inventory: ProductInventory | None = None, owner: str | None = None) -> str:
+    """
+    Charge the user for the cart and clear it without printing anything, and return the checkout outcome.
+
+    The units reserved under the owner, the user's name unless given, are sold from the given inventory, or from the
+    global inventory once the global products are loaded. Without either the cart holds no reservations, so nothing
+    is loaded just to check out.
+    """
+    if cart.is_empty():
+        METRICS.increment(name='checkout_empty_cart_total')
+        return CHECKOUT_EMPTY_CART
 
     total_price: float = cart.get_total_price()
     if total_price > user.wallet:
-        print(f"You don't have enough money to complete the purchase. Please try again!")
-        return
+        METRICS.increment(name='checkout_insufficient_funds_total')
+        return CHECKOUT_INSUFFICIENT_FUNDS
+    if inventory is None and global_products is not None:
+        inventory = get_global_inventory()
+    if inventory is not None and not inventory.commit(
+            owner=user.name if owner is None else owner,
+            items=cart.retrieve_items()
+    ):
+        METRICS.increment(name='checkout_out_of_stock_total')
+        return CHECKOUT_OUT_OF_STOCK
     user.wallet -= total_price  # Deduct the total price from the user's wallet
     cart.clear_items()  # Clear the cart
+    METRICS.increment(name='checkout_completed_total')
+    return CHECKOUT_COMPLETED
 
-    print(f'Thank you for your purchase, {user.name}! Your remaining balance is {user.wallet}')
+
+@timed('checkout_seconds')
+def checkout(user, cart) -> None:
+    """
+    Complete the checkout process
+    """
+    outcome: str = complete_purchase(user=user, cart=cart)
+    if outcome == CHECKOUT_EMPTY_CART:
+        print('Your basket is empty. Please add items before checking out.')
+    elif outcome == CHECKOUT_INSUFFICIENT_FUNDS:
+        print(f"You don't have enough money to complete the purchase. Please try again!")
+    elif outcome == CHECKOUT_OUT_OF_STOCK:
+        print('Sorry, some items in your cart are no longer in stock.')
+    else:
+        print(f'Thank you for your purchase, {user.name}! Your remaining balance is {user.wallet}')
 
 
 def display_cart_items(cart) -> None:
@@ -50,9 +200,6 @@ def check_cart(user, cart) -> None | bool:
     """
     Print the cart and prompt user for proceeding to checkout
     """
-    global global_products
-    
-
     display_cart_items(cart)
 
     # Iteratively ask the user if they want to check out or remove an item from the cart, and if neither break from loop
@@ -73,7 +220,7 @@ def check_cart(user, cart) -> None | bool:
             elif user_input.isdigit() and 1 <= int(user_input) <= len(cart.retrieve_items()):
                 selected_item: Product = cart.retrieve_items()[int(user_input) - 1]
                 cart.remove_item(product=selected_item)
-                [product.add_product_unit() for product in global_products if product.name == selected_item.name]
+                get_global_inventory().release(owner=user.name, name=selected_item.name)  # Restock the removed unit
                 return False
             else:
                 print('Invalid input. Please try again.')
@@ -85,23 +232,27 @@ def display_products_available_for_purchase() -> None:
     """
     Display available products in the global_products list
     """
-    global global_products
-
+    get_global_inventory().expire_reservations()  # Show the units of expired reservations as available again
     print('\nAvailable products for purchase:')
-    for i, product in enumerate(global_products):
+    for i, product in enumerate(get_global_products()):
         print(f'{i + 1}. {str(product)}')
 
 
-def checkout_and_payment(login_info) -> None:
+def checkout_and_payment(login_info, session: Session | None = None) -> None:
     """
-    Main function for the shopping and checkout process
+    Main function for the shopping and checkout process, using the cart of the session if there is one
     """
-    global global_products, global_cart
+    global global_cart
 
-    user: User = User(
-        name=login_info['username'],
-        wallet=login_info['wallet']
-    )
+    if session is None:
+        user: User = User(
+            name=login_info['username'],
+            wallet=login_info['wallet']
+        )
+        cart: ShoppingCart = global_cart
+    else:
+        user: User = session.user
+        cart: ShoppingCart = session.cart
 
     # Get user input for either selecting a product by its number, checking their cart, or logging out
     while True:
@@ -114,7 +265,7 @@ def checkout_and_payment(login_info) -> None:
         elif choice.startswith('c'):
             wallet_before = user.wallet
             
-            cart_checked_out = check_cart(user=user, cart=global_cart)
+            cart_checked_out = check_cart(user=user, cart=cart)
             
             if wallet_before > user.wallet:
                 UserDataManager.update_wallet(user.name, user.wallet)
@@ -127,12 +278,14 @@ def checkout_and_payment(login_info) -> None:
                 continue  
            
         elif choice.startswith('l'):
-            if logout(cart=global_cart):
+            if logout(cart=cart):
+                get_global_inventory().release_all(owner=user.name)  # Return the reserved units to the catalog
                 exit(0)  # The user has logged out
-        elif choice.isdigit() and 1 <= int(choice) <= len(global_products):
-            selected_product: Product = global_products[int(choice) - 1]
-            if selected_product.units > 0:
-                global_cart.add_item(product=selected_product.get_product_unit())  # Add selected product to the cart
+        elif choice.isdigit() and 1 <= int(choice) <= len(get_global_products()):
+            selected_product: Product = get_global_products()[int(choice) - 1]
+            unit: Product | None = get_global_inventory().reserve(owner=user.name, product=selected_product)
+            if unit is not None:
+                cart.add_item(product=unit)  # Add the reserved unit to the cart
                 print(f'{selected_product.name} added to your cart.')
             else:
                 print(f'Sorry, {selected_product.name} is out of stock.')
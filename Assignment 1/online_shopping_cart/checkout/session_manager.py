@@ -0,0 +1,139 @@
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.user.user import User
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable
+
+#############################
+# SESSION MANAGER CONSTANTS #
+#############################
+
+
+DEFAULT_MAX_SESSIONS: int = 10_000
+DEFAULT_IDLE_TIMEOUT_SECONDS: float = 30 * 60
+
+
+###########################
+# SESSION MANAGER CLASSES #
+###########################
+
+
+class Session:
+    """
+    Session class to represent one shopper with their own cart
+    """
+
+    def __init__(self, session_id: str, user: User, last_access_time: float) -> None:
+        self.session_id: str = session_id
+        self.user: User = user
+        self.cart: ShoppingCart = ShoppingCart()
+        self.last_access_time: float = last_access_time
+        self.is_open: bool = True
+
+
+class SessionManager:
+    """
+    SessionManager class to map session IDs to their sessions.
+
+    Sessions are kept in least recently used order. Sessions idle for longer than the idle timeout are evicted,
+    and so are the least recently used ones when the number of sessions or of cart lines goes over its cap. The
+    session being opened or retrieved is never evicted for the caps. The carts report their line changes, so the
+    number of cart lines is kept as a running count rather than summed over every session.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS, max_cart_lines: int | None = None,
+                 on_evict: Callable[[Session], None] | None = None, clock: Callable[[], float] = monotonic) -> None:
+        self.max_sessions: int = max_sessions
+        self.idle_timeout: float = idle_timeout
+        self.max_cart_lines: int | None = max_cart_lines
+        self.on_evict: Callable[[Session], None] | None = on_evict
+        self.clock: Callable[[], float] = clock
+        self.__sessions: OrderedDict[str, Session] = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__cart_lines: int = 0
+        self.__cart_lines_lock: Lock = Lock()  # Carts change outside the session lock
+
+    def __len__(self) -> int:
+        return len(self.__sessions)
+
+    @property
+    def cart_lines(self) -> int:
+        return self.__cart_lines
+
+    def __count_cart_lines(self, session: Session, delta: int) -> None:
+        with self.__cart_lines_lock:
+            if session.is_open:  # Lines of a removed session were already taken off the count
+                self.__cart_lines += delta
+
+    def __remove_session(self, session_id: str) -> Session:
+        session: Session = self.__sessions.pop(session_id)
+        with self.__cart_lines_lock:
+            session.is_open = False
+            self.__cart_lines -= len(session.cart.retrieve_items())
+        if self.on_evict is not None:
+            self.on_evict(session)
+        return session
+
+    def __is_over_caps(self) -> bool:
+        return len(self.__sessions) > self.max_sessions or (
+            self.max_cart_lines is not None and self.__cart_lines > self.max_cart_lines
+        )
+
+    def __evict(self, now: float) -> None:
+        while self.__sessions:
+            session_id, session = next(iter(self.__sessions.items()))  # Least recently used first
+            if now - session.last_access_time > self.idle_timeout:
+                self.__remove_session(session_id=session_id)
+            else:
+                break
+
+        # The most recently used session is kept, so the session just opened or retrieved is never evicted
+        while len(self.__sessions) > 1 and self.__is_over_caps():
+            self.__remove_session(session_id=next(iter(self.__sessions)))
+
+    def open_session(self, login_info: dict[str, str | float], session_id: str | None = None) -> Session:
+        """
+        Open a session for a logged-in user, or resume the session already open under the same ID
+        """
+        session_id = login_info['username'] if session_id is None else session_id
+        with self.__lock:
+            now: float = self.clock()
+            session: Session | None = self.__sessions.get(session_id)
+            if session is None:
+                session = Session(
+                    session_id=session_id,
+                    user=User(name=login_info['username'], wallet=login_info['wallet']),
+                    last_access_time=now
+                )
+                session.cart.on_line_count_change = lambda delta: self.__count_cart_lines(session=session, delta=delta)
+                self.__sessions[session_id] = session
+            self.__touch(session=session, now=now)
+            self.__evict(now=now)
+            return session
+
+    def __touch(self, session: Session, now: float) -> None:
+        session.last_access_time = now
+        self.__sessions.move_to_end(session.session_id)
+
+    def get_session(self, session_id: str) -> Session | None:
+        """
+        Retrieve an open session and mark it as used, or None if it was closed or evicted
+        """
+        with self.__lock:
+            now: float = self.clock()
+            session: Session | None = self.__sessions.get(session_id)
+            if session is not None and now - session.last_access_time <= self.idle_timeout:
+                self.__touch(session=session, now=now)  # Touched first, so evicting for the caps keeps it
+            self.__evict(now=now)
+            return session if session is not None and session.is_open else None
+
+    def close_session(self, session_id: str) -> None:
+        with self.__lock:
+            if session_id in self.__sessions:
+                self.__remove_session(session_id=session_id)
+
+    def evict_idle_sessions(self) -> None:
+        with self.__lock:
+            self.__evict(now=self.clock())
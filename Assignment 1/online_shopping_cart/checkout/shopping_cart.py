@@ -1,60 +1,140 @@
+from online_shopping_cart.metrics.metrics_registry import timed
 from online_shopping_cart.product.product import Product
+from collections.abc import Sequence
+from typing import Callable
 
 ##################################
 # CHECKOUT SHOPPING CART CLASSES #
 ##################################
 
 
+class CartItems(Sequence):
+    """
+    CartItems class to read the lines of a cart in order without copying them into a list.
+
+    The view follows the cart as it changes. Each line is read as a copy of the cart's own product, so changing
+    what was read cannot put the cart out of step with its running total. Reading by position lists the lines once
+    and keeps the list until lines are added or removed, so each positional read after the first is O(1).
+    """
+
+    def __init__(self, items: dict[str, Product]) -> None:
+        self.__items: dict[str, Product] = items
+        self.__lines: list[Product] | None = None  # The cart's own products in order, for reads by position
+
+    def forget_lines(self) -> None:
+        """
+        Drop the listed lines after lines were added to or removed from the cart
+        """
+        self.__lines = None
+
+    def __get_lines(self) -> list[Product]:
+        if self.__lines is None:
+            self.__lines = list(self.__items.values())
+        return self.__lines
+
+    @staticmethod
+    def __copy(product: Product) -> Product:
+        return Product(name=product.name, price=product.price, units=product.units)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.__copy(product=product) for product in self.__get_lines()[position]]
+        if position < 0:
+            position += len(self.__items)
+        if not 0 <= position < len(self.__items):
+            raise IndexError('cart index out of range')
+        return self.__copy(product=self.__get_lines()[position])
+
+    def __iter__(self):
+        return (self.__copy(product=product) for product in self.__items.values())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, CartItems)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'CartItems({list(self)!r})'
+
+
 class ShoppingCart:
     """
-    ShoppingCart class to represent the user's shopping cart
+    ShoppingCart class to represent the user's shopping cart, optionally reporting how its number of lines changes
     """
 
-    def __init__(self) -> None:
-        self.items: list[Product] = list()
+    def __init__(self, on_line_count_change: Callable[[int], None] | None = None) -> None:
+        self.on_line_count_change: Callable[[int], None] | None = on_line_count_change
+        self.__items: dict[str, Product] = dict()  # Insertion-ordered, keyed by product name
+        self.__total_price: float = 0
+        self.__view: CartItems = CartItems(items=self.__items)
 
-    def __get_product_by_name(self, product_search: Product) -> [Product]:
-        return [product_i for product_i in self.items if product_i.name == product_search.name]
+    @property
+    def items(self) -> CartItems:
+        return self.__view
 
+    @timed('cart_add_item_seconds')
     def add_item(self, product) -> None:
         """
         Add a product to the cart if not already there, otherwise increment the number of units
         """
-        product_in_items: [Product] = self.__get_product_by_name(product)
-        if not product_in_items:
-            self.items.append(product)
+        product_in_items: Product | None = self.__items.get(product.name)
+        if product_in_items is None:
+            # The cart keeps its own copy, changes to the added product do not reach the running total
+            self.__items[product.name] = Product(name=product.name, price=product.price, units=product.units)
+            self.__total_price += product.price * product.units
+            self.__change_line_count(delta=1)
         else:
-            product_in_items[0].units += 1
+            product_in_items.units += 1
+            self.__total_price += product_in_items.price
 
+    @timed('cart_remove_item_seconds')
     def remove_item(self, product: Product) -> None:
         """
         Remove a product from the cart
         """
-        product_in_items: [Product] = self.__get_product_by_name(product)
-        product_in_items[0].units -= 1
-        if product_in_items[0].units == 0:
-            self.items.remove(product)
+        product_in_items: Product = self.__items[product.name]
+        product_in_items.units -= 1
+        self.__total_price -= product_in_items.price
+        if product_in_items.units == 0:
+            del self.__items[product.name]
+            self.__change_line_count(delta=-1)
+        if not self.__items:
+            self.__total_price = 0  # Do not carry floating point residue over to an empty cart
 
-    def retrieve_items(self) -> list[Product]:
+    def retrieve_items(self) -> CartItems:
         """
-        Retrieve the items in the cart
+        Retrieve a view of the items in the cart
         """
         return self.items
 
+    @timed('cart_clear_items_seconds')
     def clear_items(self) -> None:
         """
         Clear all items from the cart
         """
-        self.items = list()
+        line_count: int = len(self.__items)
+        self.__items.clear()  # In place, so views of the items stay attached to the cart
+        self.__total_price = 0
+        if line_count:
+            self.__change_line_count(delta=-line_count)
+
+    def __change_line_count(self, delta: int) -> None:
+        self.__view.forget_lines()
+        if self.on_line_count_change is not None:
+            self.on_line_count_change(delta)
 
     def is_empty(self) -> bool:
         """
         Checks if the cart is empty
         """
-        return self.items == []
+        return not self.__items
 
+    @timed('cart_get_total_price_seconds')
     def get_total_price(self) -> float:
         """
         Calculate the total price of items in the cart
         """
-        return sum(item.price * item.units for item in self.items)
+        return self.__total_price
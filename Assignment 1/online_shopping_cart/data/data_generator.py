@@ -0,0 +1,104 @@
+from argparse import ArgumentParser
+from typing import Iterator
+import random
+import json
+
+############################
+# DATA GENERATOR CONSTANTS #
+############################
+
+
+DEFAULT_SEED: int = 0
+PRODUCT_ADJECTIVES: list[str] = [
+    'Organic', 'Fresh', 'Large', 'Small', 'Premium', 'Classic', 'Family', 'Travel', 'Deluxe', 'Budget', 'Smart',
+    'Wireless', 'Frozen', 'Spicy', 'Sweet', 'Green', 'Red', 'Golden', 'Mini', 'Ultra'
+]
+PRODUCT_NOUNS: list[str] = [
+    'Apple', 'Banana', 'Orange', 'Grapes', 'Carrot', 'Tomato', 'Milk', 'Cheese', 'Bread', 'Coffee', 'Tea', 'Juice',
+    'Cereal', 'Soap', 'Shampoo', 'Towel', 'Laptop', 'Headphones', 'Speaker', 'Toaster', 'Blender', 'Backpack',
+    'Sunglasses', 'Umbrella', 'Notebook', 'Pens', 'Yoga Mat', 'Running Shoes', 'Light Bulbs', 'Batteries'
+]
+USER_NAMES: list[str] = [
+    'Ramanathan', 'Samantha', 'Maximus', 'Aria', 'Phoenix', 'Luna', 'Rover', 'Felix', 'Nova', 'Orion', 'Iris',
+    'Atlas', 'Ember', 'Jasper', 'Willow', 'Kai'
+]
+PASSWORD_SYMBOLS: str = '!@#$%^&*'
+CREDIT_CARDS_PER_USER: int = 2
+
+
+############################
+# DATA GENERATOR FUNCTIONS #
+############################
+
+
+def generate_products(count: int, seed: int = DEFAULT_SEED) -> Iterator[tuple[str, float, int]]:
+    """
+    Yield unique product names with a price and a number of units, the same ones for the same seed
+    """
+    randomizer: random.Random = random.Random(seed)
+    for i in range(count):
+        name: str = f'{randomizer.choice(PRODUCT_ADJECTIVES)} {randomizer.choice(PRODUCT_NOUNS)} {i}'
+        yield name, round(randomizer.uniform(0.25, 999.0), 2), randomizer.randint(0, 100)
+
+
+def generate_users(count: int, seed: int = DEFAULT_SEED) -> Iterator[dict[str, str | float | list]]:
+    """
+    Yield unique users with a valid password, a wallet and some credit cards, the same ones for the same seed
+    """
+    randomizer: random.Random = random.Random(seed)
+    for i in range(count):
+        username: str = f'{randomizer.choice(USER_NAMES)}{i}'
+        yield {
+            'username': username,
+            'password': f'{username}{randomizer.randint(1000, 9999)}{randomizer.choice(PASSWORD_SYMBOLS)}',
+            'wallet': round(randomizer.uniform(0.0, 1000.0), 2),
+            'credit_cards': [
+                {
+                    'card_number': ''.join(str(randomizer.randint(0, 9)) for _ in range(16)),
+                    'expiry_date': f'{randomizer.randint(1, 12):02d}/{randomizer.randint(25, 35)}',
+                    'name_on_card': username,
+                    'cvv': f'{randomizer.randint(0, 999):03d}'
+                }
+                for _ in range(randomizer.randint(0, CREDIT_CARDS_PER_USER))
+            ]
+        }
+
+
+def write_products_file(file_name: str, count: int, seed: int = DEFAULT_SEED) -> None:
+    """
+    Write a products CSV file in the format read by get_products, one row at a time
+    """
+    with open(file=file_name, mode='w', newline='') as file:
+        file.write('Product,Price,Units\n')
+        for name, price, units in generate_products(count=count, seed=seed):
+            file.write(f'{name},{price:g},{units}\n')
+
+
+def write_users_file(file_name: str, count: int, seed: int = DEFAULT_SEED) -> None:
+    """
+    Write a users JSON file in the format read by UserDataManager.load_users, one record at a time
+    """
+    with open(file=file_name, mode='w') as file:
+        file.write('[')
+        for i, user in enumerate(generate_users(count=count, seed=seed)):
+            file.write(',\n  ' if i else '\n  ')
+            file.write(json.dumps(user, indent=2).replace('\n', '\n  '))
+        file.write('\n]\n' if count else ']\n')
+
+
+def generate_data_files():
+    parser: ArgumentParser = ArgumentParser(description='Generate synthetic product and user files')
+    parser.add_argument('kind', choices=['products', 'users'], help='which file to generate')
+    parser.add_argument('file_name', help='file to write')
+    parser.add_argument('--count', type=int, required=True, help='number of products or users')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='seed for reproducible data')
+    arguments = parser.parse_args()
+
+    if arguments.kind == 'products':
+        write_products_file(file_name=arguments.file_name, count=arguments.count, seed=arguments.seed)
+    else:
+        write_users_file(file_name=arguments.file_name, count=arguments.count, seed=arguments.seed)
+
+
+if __name__ == '__main__':
+    generate_data_files()
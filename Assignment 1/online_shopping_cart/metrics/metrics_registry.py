@@ -0,0 +1,188 @@
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable
+import json
+import os
+
+##############################
+# METRICS REGISTRY CONSTANTS #
+##############################
+
+
+METRICS_ENVIRONMENT_VARIABLE: str = 'SHOP_METRICS'
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0
+)
+
+
+############################
+# METRICS REGISTRY CLASSES #
+############################
+
+
+class Counter:
+    """
+    Counter class to count how many times something happened
+    """
+
+    def __init__(self) -> None:
+        self.value: int = 0
+        self.__lock: Lock = Lock()
+
+    def increment(self, amount: int = 1) -> None:
+        with self.__lock:
+            self.value += amount
+
+
+class Histogram:
+    """
+    Histogram class to count observations, such as latencies in seconds, into cumulative buckets
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = buckets
+        self.bucket_counts: list[int] = [0] * (len(buckets) + 1)  # The last bucket is +Inf
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.__lock: Lock = Lock()
+
+    def observe(self, value: float) -> None:
+        with self.__lock:
+            self.bucket_counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def get_quantile(self, quantile: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in
+        """
+        rank: float = quantile * self.count
+        seen: int = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and seen:
+                return bound
+        return 0.0
+
+
+class MetricsRegistry:
+    """
+    MetricsRegistry class to hold the counters and histograms of a process.
+
+    Recording is skipped while the registry is disabled, which it is unless the SHOP_METRICS environment
+    variable is set or enable() is called.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self.counters: dict[str, Counter] = dict()
+        self.histograms: dict[str, Histogram] = dict()
+        self.__lock: Lock = Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.counters = dict()
+            self.histograms = dict()
+
+    def get_counter(self, name: str) -> Counter:
+        counter: Counter | None = self.counters.get(name)
+        if counter is None:
+            with self.__lock:
+                counter = self.counters.setdefault(name, Counter())
+        return counter
+
+    def get_histogram(self, name: str) -> Histogram:
+        histogram: Histogram | None = self.histograms.get(name)
+        if histogram is None:
+            with self.__lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        return histogram
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        if self.enabled:
+            self.get_counter(name=name).increment(amount=amount)
+
+    def observe(self, name: str, value: float) -> None:
+        if self.enabled:
+            self.get_histogram(name=name).observe(value=value)
+
+    def get_snapshot(self) -> dict[str, dict]:
+        """
+        Retrieve the current value of every metric
+        """
+        return {
+            'counters': {name: counter.value for name, counter in sorted(self.counters.items())},
+            'histograms': {
+                name: {
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'p50': histogram.get_quantile(quantile=0.50),
+                    'p99': histogram.get_quantile(quantile=0.99),
+                    'buckets': dict(zip([str(bound) for bound in histogram.buckets] + ['+Inf'],
+                                        histogram.bucket_counts))
+                }
+                for name, histogram in sorted(self.histograms.items())
+            }
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.get_snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format
+        """
+        lines: list[str] = list()
+        for name, counter in sorted(self.counters.items()):
+            lines += [f'# TYPE {name} counter', f'{name} {counter.value}']
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f'# TYPE {name} histogram')
+            cumulative_count: int = 0
+            for bound, bucket_count in zip([repr(bound) for bound in histogram.buckets] + ['+Inf'],
+                                           histogram.bucket_counts):
+                cumulative_count += bucket_count
+                lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative_count}')
+            lines += [f'{name}_sum {histogram.sum!r}', f'{name}_count {histogram.count}']
+        return '\n'.join(lines) + '\n'
+
+
+############################
+# METRICS REGISTRY GLOBALS #
+############################
+
+
+METRICS: MetricsRegistry = MetricsRegistry(enabled=bool(os.environ.get(METRICS_ENVIRONMENT_VARIABLE)))
+
+
+##############################
+# METRICS REGISTRY FUNCTIONS #
+##############################
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorate a function so that its latency in seconds is recorded in the named histogram.
+
+    The registry is checked on every call, so enabling it later starts timing functions decorated at import, and
+    while it is disabled a call costs one flag check.
+    """
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return function(*args, **kwargs)
+            start_time: float = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                METRICS.observe(name=name, value=perf_counter() - start_time)
+        return wrapper
+    return decorator
@@ -5,20 +5,30 @@
 
 class Product:
     """
-    Product class to represent product information
+    Product class to represent product information, along with the catalog holding it if it was added to one
     """
 
+    __slots__ = ('name', 'price', 'units', 'catalog', 'position')
+
     def __init__(self, name: str, price: float, units: int) -> None:
         self.name: str = name
         self.price: float = price
         self.units: int = units
+        self.catalog = None  # Set by the ProductCatalog the product is added to
+        self.position: int | None = None
 
     def __str__(self) -> str:
         return f'{self.name} - ${self.price} - Units: {self.units}'
 
     def get_product_unit(self):
-        self.units -= 1
+        if self.catalog is None:
+            self.units -= 1
+        else:
+            self.catalog.change_units(product=self, units=-1)  # Through the catalog, so its listeners hear about it
         return Product(name=self.name, price=self.price, units=1)
 
     def add_product_unit(self) -> None:
-        self.units += 1
+        if self.catalog is None:
+            self.units += 1
+        else:
+            self.catalog.change_units(product=self, units=1)
@@ -0,0 +1,183 @@
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from array import array
+from bisect import bisect_left
+from heapq import heappush, heappop, merge
+from threading import Lock
+
+##################################
+# PRODUCT AUTOCOMPLETE CONSTANTS #
+##################################
+
+
+DEFAULT_SUGGESTION_COUNT: int = 5
+NO_UNITS: int = -1  # Ranks below any product, used for the padding of the ranking tree
+
+
+################################
+# PRODUCT AUTOCOMPLETE CLASSES #
+################################
+
+
+class ProductAutocomplete:
+    """
+    ProductAutocomplete class to complete product name prefixes with the products that have the most units.
+
+    The lower-cased names are kept sorted, so the names starting with a prefix form one range found by bisection.
+    The units of the names are kept in a max segment tree over that order, and the best units of a range are
+    found by expanding the tree nodes covering it best first, so a suggestion costs O((k + log n) log n)
+    whatever the number of names sharing the prefix. Unit changes reach the tree through the change
+    listeners of the catalog. The names are sorted on the first suggestion, and products added to the catalog
+    since are sorted on their own and merged in as one batch on the next one.
+    """
+
+    def __init__(self, catalog: ProductCatalog) -> None:
+        self.catalog: ProductCatalog = catalog
+        self.foreign_change_count: int = catalog.get_foreign_change_count()  # Before the units are read
+        self.__keys: list[str] = list()
+        self.__names: list[str] = list()
+        self.__indexed_count: int = 0  # Catalog positions whose names are in the sorted names
+        self.__tree: array = array('q')
+        self.__size: int = 0
+        self.__is_stale: bool = True
+        self.__lock: Lock = Lock()
+        catalog.add_change_listener(listener=self.refresh_product)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            self.__index_new_products()
+            return len(self.__names)
+
+    def close(self) -> None:
+        """
+        Stop following product changes
+        """
+        self.catalog.remove_change_listener(listener=self.refresh_product)
+
+    def is_outdated(self) -> bool:
+        """
+        Whether other processes changed the catalog since the completions were made, which their listeners did not
+        hear about
+        """
+        return self.catalog.get_foreign_change_count() != self.foreign_change_count
+
+    def __get_catalog_units(self) -> dict[str, int]:
+        """
+        Read the units of every name in the catalog, the first product of a name wins as in the catalog index
+        """
+        if isinstance(self.catalog, CompactProductCatalog):
+            products = zip(self.catalog.names, self.catalog.units)  # Skip creating a view per product
+        else:
+            products = ((product.name, product.units) for product in self.catalog)
+        units: dict[str, int] = dict()
+        for name, product_units in products:
+            units.setdefault(name, product_units)
+        return units
+
+    def __build_tree(self) -> None:
+        self.__size = 1
+        while self.__size < len(self.__names):
+            self.__size *= 2
+        tree: array = array('q', [NO_UNITS]) * (2 * self.__size)
+        catalog_units: dict[str, int] = self.__get_catalog_units()
+        for position, name in enumerate(self.__names):
+            tree[self.__size + position] = catalog_units.get(name, NO_UNITS)
+        for node in range(self.__size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.__tree = tree
+        self.__is_stale = False
+
+    def __find_position(self, name: str) -> int | None:
+        key: str = name.lower()
+        position: int = bisect_left(self.__keys, key)
+        while position < len(self.__keys) and self.__keys[position] == key:
+            if self.__names[position] == name:
+                return position
+            position += 1
+        return None
+
+    def __index_new_products(self) -> None:
+        """
+        Sort in the names of the products added to the catalog since the last suggestion in one merge, the ranking
+        tree is then rebuilt once
+        """
+        count: int = len(self.catalog)
+        if count == self.__indexed_count:
+            return
+        if not self.__indexed_count:
+            self.__set_entries(entries=sorted((name.lower(), name) for name in self.__get_catalog_units()))
+        else:
+            new_names: set[str] = {self.catalog[position].name for position in range(self.__indexed_count, count)}
+            new_entries: list[tuple[str, str]] = sorted(
+                (name.lower(), name) for name in new_names if self.__find_position(name=name) is None
+            )
+            if new_entries:  # Names already indexed leave the suggestions as they are
+                self.__set_entries(entries=list(merge(zip(self.__keys, self.__names), new_entries)))
+        self.__indexed_count = count
+
+    def __set_entries(self, entries: list[tuple[str, str]]) -> None:
+        self.__keys = [key for key, _ in entries]
+        self.__names = [name for _, name in entries]
+        self.__is_stale = True
+
+    def refresh_product(self, position: int) -> None:
+        """
+        Rank the product at a catalog position again after its units changed, used as a change listener
+        """
+        with self.__lock:
+            if self.__is_stale or position >= self.__indexed_count:
+                return  # The units are all read again when the tree is rebuilt
+            product: Product = self.catalog[position]
+            if self.catalog.get_position_by_name(name=product.name) != position:
+                return  # Only the first product of a name is suggested, as in the catalog index
+            name_position: int | None = self.__find_position(name=product.name)
+            if name_position is None:
+                return
+            node: int = self.__size + name_position
+            self.__tree[node] = product.units
+            node //= 2
+            while node:
+                self.__tree[node] = max(self.__tree[2 * node], self.__tree[2 * node + 1])
+                node //= 2
+
+    def suggest(self, prefix: str, k: int = DEFAULT_SUGGESTION_COUNT) -> list[str]:
+        """
+        Retrieve up to k names starting with a prefix, ignoring case, most units first and alphabetically on ties
+        """
+        with self.__lock:
+            self.__index_new_products()
+            if self.__is_stale:
+                self.__build_tree()
+            key: str = prefix.lower()
+            start: int = bisect_left(self.__keys, key)
+            end: int = bisect_left(self.__keys, key + '\U0010ffff', lo=start)  # Past every key starting with the prefix
+
+            # Best first expansion from the nodes covering [start, end), ties go to the leftmost node
+            candidates: list[tuple[int, int, int]] = list()  # Negated units, leftmost position, node
+            low: int = start + self.__size
+            high: int = end + self.__size
+            while low < high:
+                if low & 1:
+                    self.__push_node(candidates=candidates, node=low)
+                    low += 1
+                if high & 1:
+                    high -= 1
+                    self.__push_node(candidates=candidates, node=high)
+                low //= 2
+                high //= 2
+
+            suggestions: list[str] = list()
+            while candidates and len(suggestions) < k:
+                negated_units, _, node = heappop(candidates)
+                if -negated_units == NO_UNITS:
+                    break  # Only padding or products gone from the catalog are left
+                if node >= self.__size:
+                    suggestions.append(self.__names[node - self.__size])
+                else:
+                    self.__push_node(candidates=candidates, node=2 * node)
+                    self.__push_node(candidates=candidates, node=2 * node + 1)
+            return suggestions
+
+    def __push_node(self, candidates: list[tuple[int, int, int]], node: int) -> None:
+        leftmost_node: int = node << (self.__size.bit_length() - node.bit_length())
+        heappush(candidates, (-self.__tree[node], leftmost_node - self.__size, node))
@@ -0,0 +1,271 @@
+from online_shopping_cart.product.product import Product
+from array import array
+from typing import Callable
+
+#############################
+# PRODUCT CATALOG CONSTANTS #
+#############################
+
+
+EMPTY_SLOT: int = -1
+MINIMUM_INDEX_CAPACITY: int = 8
+
+
+###########################
+# PRODUCT CATALOG CLASSES #
+###########################
+
+
+class ProductCatalog:
+    """
+    ProductCatalog class to keep the products in display order along with a name index for constant-time lookups.
+
+    Listeners added to a catalog are told the position of every product of its own whose units or price change.
+    """
+
+    def __init__(self, products=None) -> None:
+        self.products: list[Product] = list()
+        self.__index: dict[str, int] = dict()  # Name -> position
+        self.change_listeners: list[Callable[[int], None]] = list()
+        for product in products or []:
+            self.add_product(product=product)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __getitem__(self, position):
+        return self.products[position]
+
+    def __iter__(self):
+        return iter(self.products)
+
+    def __contains__(self, name) -> bool:
+        return name in self.__index
+
+    def add_product(self, product: Product) -> None:
+        """
+        Append a product to the catalog, the first product registered under a name is the one indexed. A product
+        another catalog holds, such as a ProductView, is added as a copy.
+        """
+        if product.catalog is not None and product.catalog is not self:
+            product = Product(name=product.name, price=product.price, units=product.units)
+        product.catalog, product.position = self, len(self.products)
+        self.products.append(product)
+        self.__index.setdefault(product.name, product.position)
+
+    def get_position_by_name(self, name: str) -> int | None:
+        """
+        Retrieve the position of the product a name resolves to, or None if the catalog does not hold it
+        """
+        return self.__index.get(name)
+
+    def get_product_by_name(self, name: str) -> Product | None:
+        """
+        Retrieve a product by its name, or None if the catalog does not hold it
+        """
+        position: int | None = self.__index.get(name)
+        return None if position is None else self.products[position]
+
+    def get_position(self, product: Product) -> int | None:
+        """
+        Retrieve the position of a product, so products sharing a name are told apart, products from elsewhere are
+        found by name
+        """
+        if product.catalog is self:
+            return product.position
+        return self.get_position_by_name(name=product.name)
+
+    def take_units(self, product: Product, units: int = 1) -> bool:
+        """
+        Take units of a catalog product out of stock, or return False and leave the stock as it is if it is short
+        """
+        if product.units < units:
+            return False
+        product.units -= units
+        self.__notify_product(product=product)
+        return True
+
+    def return_units(self, product: Product, units: int = 1) -> None:
+        """
+        Put units of a catalog product back in stock
+        """
+        product.units += units
+        self.__notify_product(product=product)
+
+    def change_units(self, product: Product, units: int) -> None:
+        """
+        Add units to a catalog product, or remove them when negative, whatever its stock
+        """
+        product.units += units
+        self.__notify_product(product=product)
+
+    def get_foreign_change_count(self) -> int:
+        """
+        Count the changes made to the catalog by other processes, which the change listeners do not hear about, none
+        for a catalog held by one process
+        """
+        return 0
+
+    def __notify_product(self, product: Product) -> None:
+        position: int | None = self.get_position(product=product)
+        if position is not None:
+            self.notify_changed(position=position)
+
+    def add_change_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Call a listener with the position of every product of the catalog whose units or price change
+        """
+        self.change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[int], None]) -> None:
+        self.change_listeners.remove(listener)
+
+    def notify_changed(self, position: int) -> None:
+        """
+        Tell the change listeners of the catalog that the units or price of the product at a position changed
+        """
+        for listener in self.change_listeners:
+            listener(position)
+
+
+class CompactProductCatalog(ProductCatalog):
+    """
+    CompactProductCatalog class to hold very large catalogs in parallel arrays instead of one object per product.
+
+    Prices and units live in typed arrays next to a table of names, and products are handed out as
+    ProductView objects reading from and writing to those arrays. The name index is an open addressing table of
+    positions kept in an array as well, so a product costs a few machine words on top of its name.
+    """
+
+    def __init__(self, products=None) -> None:
+        self.names: list[str] = list()
+        self.prices: array = array('d')
+        self.units: array = array('q')
+        self.__index: array = array('q', [EMPTY_SLOT]) * MINIMUM_INDEX_CAPACITY
+        self.change_listeners: list[Callable[[int], None]] = list()
+        for product in products or []:
+            self.add_product(product=product)
+
+    @classmethod
+    def from_arrays(cls, names: list[str], prices: array, units: array):
+        """
+        Build a catalog directly from already parsed columns
+        """
+        catalog: CompactProductCatalog = cls()
+        catalog.names = names
+        catalog.prices = prices
+        catalog.units = units
+        catalog.__rebuild_index()
+        return catalog
+
+    def __find_slot(self, name: str) -> int:
+        """
+        Probe the index for the slot holding the name, or the empty slot where it would go
+        """
+        mask: int = len(self.__index) - 1
+        slot: int = hash(name) & mask
+        while True:
+            position: int = self.__index[slot]
+            if position == EMPTY_SLOT or self.names[position] == name:
+                return slot
+            slot = (slot + 1) & mask
+
+    def __rebuild_index(self) -> None:
+        capacity: int = MINIMUM_INDEX_CAPACITY
+        while capacity < 2 * len(self.names):
+            capacity *= 2
+        self.__index = array('q', [EMPTY_SLOT]) * capacity
+        for position, name in enumerate(self.names):
+            slot: int = self.__find_slot(name=name)
+            if self.__index[slot] == EMPTY_SLOT:
+                self.__index[slot] = position
+
+    @property
+    def products(self) -> list[Product]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [ProductView(catalog=self, position=i) for i in range(len(self.names))[position]]
+        if position < 0:
+            position += len(self.names)
+        if not 0 <= position < len(self.names):
+            raise IndexError('catalog index out of range')
+        return ProductView(catalog=self, position=position)
+
+    def __iter__(self):
+        return (ProductView(catalog=self, position=position) for position in range(len(self.names)))
+
+    def __contains__(self, name) -> bool:
+        return self.__index[self.__find_slot(name=name)] != EMPTY_SLOT
+
+    def add_product(self, product: Product) -> None:
+        """
+        Append a product to the catalog, the first product registered under a name is the one indexed
+        """
+        name: str = product.name
+        self.prices.append(product.price)
+        self.units.append(product.units)
+        self.names.append(name)
+        if 2 * len(self.names) > len(self.__index):
+            self.__rebuild_index()
+        else:
+            slot: int = self.__find_slot(name=name)
+            if self.__index[slot] == EMPTY_SLOT:
+                self.__index[slot] = len(self.names) - 1
+
+    def get_position_by_name(self, name: str) -> int | None:
+        """
+        Retrieve the position of the product a name resolves to, or None if the catalog does not hold it
+        """
+        position: int = self.__index[self.__find_slot(name=name)]
+        return None if position == EMPTY_SLOT else position
+
+    def get_product_by_name(self, name: str) -> Product | None:
+        """
+        Retrieve a product by its name, or None if the catalog does not hold it
+        """
+        position: int = self.__index[self.__find_slot(name=name)]
+        return None if position == EMPTY_SLOT else ProductView(catalog=self, position=position)
+
+    def set_units(self, position: int, units: int) -> None:
+        """
+        Write the units of the product at a position, used by its ProductView
+        """
+        self.units[position] = units
+
+
+class ProductView(Product):
+    """
+    ProductView class to represent a product stored in a CompactProductCatalog
+    """
+
+    __slots__ = ()  # The catalog and position slots of Product locate the arrays to read from
+
+    def __init__(self, catalog: CompactProductCatalog, position: int) -> None:
+        self.catalog: CompactProductCatalog = catalog
+        self.position: int = position
+
+    @property
+    def name(self) -> str:
+        return self.catalog.names[self.position]
+
+    @property
+    def price(self) -> float:
+        return self.catalog.prices[self.position]
+
+    @price.setter
+    def price(self, price: float) -> None:
+        self.catalog.prices[self.position] = price
+
+    @property
+    def units(self) -> int:
+        return self.catalog.units[self.position]
+
+    @units.setter
+    def units(self, units: int) -> None:
+        self.catalog.set_units(position=self.position, units=units)
+
@@ -0,0 +1,108 @@
+from online_shopping_cart.metrics.metrics_registry import timed
+from online_shopping_cart.product.product_catalog import CompactProductCatalog
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from csv import reader
+from io import StringIO
+import os
+
+################################
+# PRODUCT CSV LOADER CONSTANTS #
+################################
+
+
+PARALLEL_LOAD_MINIMUM_SIZE: int = 64 * 1024 * 1024  # Smaller files are parsed faster on one core
+MINIMUM_CHUNK_SIZE: int = 4 * 1024 * 1024
+CHUNKS_PER_WORKER: int = 4  # Several chunks per worker keep the workers busy when chunks parse unevenly
+
+
+################################
+# PRODUCT CSV LOADER FUNCTIONS #
+################################
+
+
+def read_header(csv_file_name: str) -> tuple[list[str], int]:
+    """
+    Read the header of a CSV file along with the byte offset of the first product row
+    """
+    with open(file=csv_file_name, mode='rb') as csv_file:
+        header_line: bytes = csv_file.readline()
+        return next(reader([header_line.decode('utf-8-sig')]), []), csv_file.tell()
+
+
+def get_chunk_ranges(csv_file_name: str, start: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split the rows of a CSV file from a byte offset into byte ranges of about chunk_size, each ending on a line boundary
+    """
+    file_size: int = os.path.getsize(csv_file_name)
+    chunk_ranges: list[tuple[int, int]] = list()
+    with open(file=csv_file_name, mode='rb') as csv_file:
+        while start < file_size:
+            csv_file.seek(min(start + chunk_size, file_size))
+            csv_file.readline()  # Run on to the end of the line the chunk would have cut through
+            end: int = min(csv_file.tell(), file_size)
+            chunk_ranges.append((start, end))
+            start = end
+    return chunk_ranges
+
+
+def _parse_chunk(csv_file_name: str, start: int, end: int, columns: tuple[int, int, int]) -> tuple[
+        list[str], array, array]:
+    """
+    Parse the product rows within a byte range into names, prices and units, run in a worker process
+    """
+    with open(file=csv_file_name, mode='rb') as csv_file:
+        csv_file.seek(start)
+        chunk: str = csv_file.read(end - start).decode('utf-8')
+
+    name_column, price_column, units_column = columns
+    names: list[str] = list()
+    prices: array = array('d')
+    units: array = array('q')
+    for row in reader(StringIO(chunk, newline='')):
+        if not row:
+            continue  # Blank lines, which the single-core path skips as well
+        names.append(row[name_column])
+        prices.append(float(row[price_column]))
+        units.append(int(row[units_column]))
+    return names, prices, units
+
+
+@timed('product_load_products_parallel_seconds')
+def load_products_parallel(csv_file_name: str, max_workers: int | None = None,
+                           chunk_size: int | None = None) -> CompactProductCatalog:
+    """
+    Parse a large CSV file of products on several cores.
+
+    The rows are split into byte ranges aligned to line boundaries, every range is parsed in a worker process and
+    the columns are joined back in file order. Rows are expected to fit on one line, as the generated and exported
+    catalogs do, since a chunk cannot tell whether it starts inside a quoted field.
+    """
+    header, start = read_header(csv_file_name=csv_file_name)
+    try:
+        columns: tuple[int, int, int] = header.index('Product'), header.index('Price'), header.index('Units')
+    except ValueError:
+        raise ValueError(f'{csv_file_name} is missing a Product, Price or Units column')
+
+    worker_count: int = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MINIMUM_CHUNK_SIZE, os.path.getsize(csv_file_name) // (worker_count * CHUNKS_PER_WORKER))
+    chunk_ranges: list[tuple[int, int]] = get_chunk_ranges(csv_file_name=csv_file_name, start=start,
+                                                           chunk_size=chunk_size)
+
+    names: list[str] = list()
+    prices: array = array('d')
+    units: array = array('q')
+    with ProcessPoolExecutor(max_workers=min(worker_count, max(len(chunk_ranges), 1))) as executor:
+        chunks = executor.map(
+            _parse_chunk,
+            [csv_file_name] * len(chunk_ranges),
+            [chunk_start for chunk_start, _ in chunk_ranges],
+            [chunk_end for _, chunk_end in chunk_ranges],
+            [columns] * len(chunk_ranges)
+        )
+        for chunk_names, chunk_prices, chunk_units in chunks:  # Results come back in submission order
+            names.extend(chunk_names)
+            prices.extend(chunk_prices)
+            units.extend(chunk_units)
+    return CompactProductCatalog.from_arrays(names=names, prices=prices, units=units)
@@ -1,5 +1,10 @@
+from online_shopping_cart.metrics.metrics_registry import timed
+from online_shopping_cart.product.product_snapshot import get_csv_signature, read_snapshot, write_snapshot
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from online_shopping_cart.product.product_csv_loader import PARALLEL_LOAD_MINIMUM_SIZE, load_products_parallel
 from online_shopping_cart.product.product import Product
 from csv import DictReader, reader
+from typing import Iterator
 
 ##########################
 # PRODUCT DATA CONSTANTS #
@@ -14,8 +19,14 @@ PRODUCTS_FILE_PATHNAME: str = './files/products.csv'
 ##########################
 
 
-def get_csv_data(csv_file_name=PRODUCTS_FILE_PATHNAME, is_dict=False) -> (list[dict[str, str | float]] |
-                                                                         tuple[list[str], list[reader]]):
+def _stream_rows(csv_file, csv_reader) -> Iterator:
+    with csv_file:  # The file stays open until the rows are exhausted or the generator is closed
+        yield from csv_reader
+
+
+@timed('product_get_csv_data_seconds')
+def _read_csv_data(csv_file_name: str, is_dict: bool) -> (
+        list[dict[str, str | float]] | tuple[list[str], list[reader]]):
     with open(file=csv_file_name, mode='r', newline='') as csv_file:
         if is_dict:
             return list(DictReader(csv_file))
@@ -23,15 +34,63 @@ def get_csv_data(csv_file_name=PRODUCTS_FILE_PATHNAME, is_dict=False) -> (list[d
         return next(csv_reader), list(csv_reader)
 
 
-def get_products(file_name=PRODUCTS_FILE_PATHNAME) -> list[Product]:
+def get_csv_data(csv_file_name=PRODUCTS_FILE_PATHNAME, is_dict=False, is_stream=False) -> (
+        list[dict[str, str | float]] | tuple[list[str], list[reader]] |
+        Iterator[dict[str, str]] | tuple[list[str], Iterator[list[str]]]):
     """
-    Load products from a CSV file
+    Read a CSV file, either fully or lazily one row at a time when streaming.
+
+    Only full reads are timed, as the time of a stream goes into iterating it.
     """
-    products: list[Product] = []
-    for row in get_csv_data(csv_file_name=file_name, is_dict=True):
-        products.append(Product(
+    if is_stream:
+        csv_file = open(file=csv_file_name, mode='r', newline='')
+        if is_dict:
+            return _stream_rows(csv_file=csv_file, csv_reader=DictReader(csv_file))
+        csv_reader: reader = reader(csv_file)
+        try:
+            header: list[str] = next(csv_reader)
+        except BaseException:
+            csv_file.close()
+            raise
+        return header, _stream_rows(csv_file=csv_file, csv_reader=csv_reader)
+
+    return _read_csv_data(csv_file_name=csv_file_name, is_dict=is_dict)
+
+
+def _stream_products(file_name) -> Iterator[Product]:
+    for row in get_csv_data(csv_file_name=file_name, is_dict=True, is_stream=True):
+        yield Product(
             name=row['Product'],
             price=float(row['Price']),
             units=int(row['Units'])
-        ))
+        )
+
+
+def get_products(file_name=PRODUCTS_FILE_PATHNAME, is_stream=False) -> ProductCatalog | Iterator[Product]:
+    """
+    Load products from a CSV file, or yield them one at a time when streaming.
+
+    A full load is served from the binary snapshot of the file while the file keeps the same modification time
+    and size, otherwise the file is parsed and a fresh snapshot is written for the next load. Large files are parsed
+    in chunks on several cores. Only full loads are timed, as the time of a stream goes into iterating it.
+    """
+    if is_stream:
+        return _stream_products(file_name=file_name)
+    return _load_products(file_name=file_name)
+
+
+@timed('product_get_products_seconds')
+def _load_products(file_name: str) -> ProductCatalog:
+    csv_signature: tuple[int, int] = get_csv_signature(csv_file_name=file_name)
+    products: ProductCatalog | None = read_snapshot(csv_file_name=file_name, csv_signature=csv_signature)
+    if products is not None:
+        return products
+
+    if csv_signature[1] >= PARALLEL_LOAD_MINIMUM_SIZE:
+        products = load_products_parallel(csv_file_name=file_name)
+    else:
+        products = CompactProductCatalog()
+        for product in _stream_products(file_name=file_name):
+            products.add_product(product=product)
+    write_snapshot(csv_file_name=file_name, csv_signature=csv_signature, products=products)
     return products
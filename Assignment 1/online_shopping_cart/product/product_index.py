@@ -0,0 +1,97 @@
+from online_shopping_cart.product.product_data import get_csv_data, PRODUCTS_FILE_PATHNAME
+from re import search, IGNORECASE
+from collections import Counter
+from os import stat
+
+###########################
+# PRODUCT INDEX CONSTANTS #
+###########################
+
+
+PRODUCT_HEADER_INDEX: str = 'Product'
+GRAM_LENGTH: int = 3
+REGEX_SPECIAL_CHARACTERS: frozenset[str] = frozenset('.^$*+?{}[]\\|()')
+
+
+#########################
+# PRODUCT INDEX CLASSES #
+#########################
+
+
+class ProductSearchIndex:
+    """
+    ProductSearchIndex class to answer product name queries from memory instead of re-reading the CSV file.
+
+    A row matches a search target when its product name occurs in the target, ignoring case. Every name is
+    filed under its rarest trigram (or the whole name when shorter than a trigram), so a query only has to
+    look up the grams of the search target and verify the few rows filed under them.
+    """
+
+    def __init__(self, header: list[str], rows) -> None:
+        self.header: list[str] = header
+        self.rows: list[list[str]] = list(rows)
+        self.__grams: dict[str, list[int]] = dict()
+        self.__regex_positions: list[int] = list()  # Names that are regex patterns, matched as before
+        self.__condition_index: int = header.index(PRODUCT_HEADER_INDEX)
+        self.__names: list[str] = [row[self.__condition_index].lower() for row in self.rows]
+
+        gram_counts: Counter = Counter(
+            gram for name in self.__names for gram in set(self.__get_name_grams(name=name))
+        )
+        for position, name in enumerate(self.__names):
+            if not name or REGEX_SPECIAL_CHARACTERS.intersection(name):
+                self.__regex_positions.append(position)
+                continue
+            grams: list[str] = self.__get_name_grams(name=name)
+            self.__grams.setdefault(min(grams, key=gram_counts.__getitem__), []).append(position)
+
+    @staticmethod
+    def __get_name_grams(name: str) -> list[str]:
+        if len(name) <= GRAM_LENGTH:
+            return [name]
+        return [name[i:i + GRAM_LENGTH] for i in range(len(name) - GRAM_LENGTH + 1)]
+
+    def search(self, search_target: str) -> list[list[str]]:
+        """
+        Retrieve the rows whose product name is found in the search target, in file order
+        """
+        target: str = search_target.lower()
+        positions: set[int] = set()
+        for start in range(len(target)):
+            for length in range(1, GRAM_LENGTH + 1):
+                if start + length > len(target):
+                    break
+                for position in self.__grams.get(target[start:start + length], ()):
+                    if self.__names[position] in target:
+                        positions.add(position)
+
+        for position in self.__regex_positions:
+            if search(pattern=self.rows[position][self.__condition_index], string=search_target.capitalize(),
+                      flags=IGNORECASE):
+                positions.add(position)
+        return [self.rows[position] for position in sorted(positions)]
+
+
+###########################
+# PRODUCT INDEX FUNCTIONS #
+###########################
+
+
+_search_indexes: dict[str, tuple[tuple[int, int], ProductSearchIndex]] = dict()
+
+
+def get_search_index(csv_file_name=PRODUCTS_FILE_PATHNAME) -> ProductSearchIndex:
+    """
+    Retrieve the search index of a CSV file, building it again only when the file has changed on disk
+    """
+    file_stat = stat(csv_file_name)
+    file_signature: tuple[int, int] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    cached: tuple[tuple[int, int], ProductSearchIndex] | None = _search_indexes.get(csv_file_name)
+    if cached is not None and cached[0] == file_signature:
+        return cached[1]
+
+    header, csv_reader = get_csv_data(csv_file_name=csv_file_name, is_stream=True)
+    search_index: ProductSearchIndex = ProductSearchIndex(header=header, rows=csv_reader)
+    _search_indexes[csv_file_name] = (file_signature, search_index)
+    return search_index
@@ -0,0 +1,208 @@
+from online_shopping_cart.metrics.metrics_registry import METRICS
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_journal import InventoryJournal
+from collections import deque
+from contextlib import ExitStack
+from heapq import heappush, heappop
+from threading import Lock
+from time import monotonic
+from typing import Callable, Iterable
+
+###############################
+# PRODUCT INVENTORY CONSTANTS #
+###############################
+
+
+DEFAULT_RESERVATION_TTL_SECONDS: float = 15 * 60
+DEFAULT_STRIPE_COUNT: int = 64
+
+
+#############################
+# PRODUCT INVENTORY CLASSES #
+#############################
+
+
+class InventoryStripe:
+    """
+    InventoryStripe class to hold the lock and reservations of the products whose names hash to it
+    """
+
+    def __init__(self) -> None:
+        self.lock: Lock = Lock()
+        # Owner -> name -> expiry time and catalog product of each unit
+        self.reservations: dict[str, dict[str, deque[tuple[float, Product]]]] = dict()
+        self.expiry_heap: list[tuple[float, str, str]] = list()  # Expiry time, owner, name
+
+
+class ProductInventory:
+    """
+    ProductInventory class to reserve catalog stock for carts.
+
+    Adding a product to a cart takes a unit out of the catalog as a reservation held by the cart owner. Reservations
+    go back to the catalog when they are released or when they expire, and become sales when they are committed at
+    checkout, which are recorded in the journal if there is one. Products are spread over lock stripes by name, so
+    shoppers only contend on products sharing a stripe.
+    """
+
+    def __init__(self, catalog: ProductCatalog, reservation_ttl: float = DEFAULT_RESERVATION_TTL_SECONDS,
+                 stripe_count: int = DEFAULT_STRIPE_COUNT, clock: Callable[[], float] = monotonic,
+                 journal: InventoryJournal | None = None) -> None:
+        self.catalog: ProductCatalog = catalog
+        self.journal: InventoryJournal | None = journal
+        self.reservation_ttl: float = reservation_ttl
+        self.clock: Callable[[], float] = clock
+        self.__stripes: list[InventoryStripe] = [InventoryStripe() for _ in range(stripe_count)]
+
+    def __get_stripe_index(self, name: str) -> int:
+        return hash(name) % len(self.__stripes)
+
+    def __restock(self, reserved_units: Iterable[tuple[float, Product]]) -> int:
+        """
+        Return reserved units to the catalog products they were taken from, and return how many there were
+        """
+        units_by_product: dict[int, list] = dict()  # Products sharing a name are restocked separately
+        for _, product in reserved_units:
+            units_by_product.setdefault(id(product), [product, 0])[1] += 1
+        for product, units in units_by_product.values():
+            self.catalog.return_units(product=product, units=units)
+        return sum(units for _, units in units_by_product.values())
+
+    def __expire_reservations(self, stripe: InventoryStripe, now: float) -> None:
+        """
+        Return the units of the expired reservations of a stripe to the catalog, the stripe lock must be held
+        """
+        while stripe.expiry_heap and stripe.expiry_heap[0][0] <= now:
+            _, owner, name = heappop(stripe.expiry_heap)
+            owner_reservations: dict[str, deque[tuple[float, Product]]] | None = stripe.reservations.get(owner)
+            if owner_reservations is None or name not in owner_reservations:
+                continue  # Already released or committed
+            reserved_units: deque[tuple[float, Product]] = owner_reservations[name]
+            expired_units: list[tuple[float, Product]] = list()
+            while reserved_units and reserved_units[0][0] <= now:
+                expired_units.append(reserved_units.popleft())
+            if expired_units:
+                self.__restock(reserved_units=expired_units)
+                METRICS.increment(name='inventory_expired_units_total', amount=len(expired_units))
+            self.__drop_if_empty(stripe=stripe, owner=owner, name=name)
+
+    @staticmethod
+    def __drop_if_empty(stripe: InventoryStripe, owner: str, name: str) -> None:
+        owner_reservations: dict[str, deque[tuple[float, Product]]] = stripe.reservations[owner]
+        if not owner_reservations[name]:
+            del owner_reservations[name]
+            if not owner_reservations:
+                del stripe.reservations[owner]
+
+    def reserve(self, owner: str, product: Product) -> Product | None:
+        """
+        Take a unit of a catalog product for an owner, or None if the product is out of stock
+        """
+        stripe: InventoryStripe = self.__stripes[self.__get_stripe_index(name=product.name)]
+        with stripe.lock:
+            now: float = self.clock()
+            self.__expire_reservations(stripe=stripe, now=now)
+            if not self.catalog.take_units(product=product):  # Under the lock so two shoppers cannot take the last unit
+                return None
+            unit: Product = Product(name=product.name, price=product.price, units=1)
+            expiry_time: float = now + self.reservation_ttl
+            stripe.reservations.setdefault(owner, dict()).setdefault(product.name, deque()).append(
+                (expiry_time, product)
+            )
+            heappush(stripe.expiry_heap, (expiry_time, owner, product.name))
+            return unit
+
+    def release(self, owner: str, name: str, units: int = 1) -> int:
+        """
+        Return units reserved by an owner to the catalog, and return how many were still reserved
+        """
+        stripe: InventoryStripe = self.__stripes[self.__get_stripe_index(name=name)]
+        with stripe.lock:
+            self.__expire_reservations(stripe=stripe, now=self.clock())
+            reserved_units: deque[tuple[float, Product]] | None = stripe.reservations.get(owner, dict()).get(name)
+            if reserved_units is None:
+                return 0
+            released_units: int = self.__restock(
+                reserved_units=[reserved_units.pop() for _ in range(min(units, len(reserved_units)))]
+            )  # The most recent units go back first
+            self.__drop_if_empty(stripe=stripe, owner=owner, name=name)
+            return released_units
+
+    def release_all(self, owner: str) -> int:
+        """
+        Return every unit reserved by an owner to the catalog, and return how many there were
+        """
+        released_units: int = 0
+        for stripe in self.__stripes:
+            with stripe.lock:
+                self.__expire_reservations(stripe=stripe, now=self.clock())
+                for reserved_units in stripe.reservations.pop(owner, dict()).values():
+                    released_units += self.__restock(reserved_units=reserved_units)
+        return released_units
+
+    def expire_reservations(self) -> None:
+        """
+        Return the units of every expired reservation to the catalog
+        """
+        for stripe in self.__stripes:
+            with stripe.lock:
+                self.__expire_reservations(stripe=stripe, now=self.clock())
+
+    def get_reserved_units(self, owner: str, name: str) -> int:
+        stripe: InventoryStripe = self.__stripes[self.__get_stripe_index(name=name)]
+        with stripe.lock:
+            self.__expire_reservations(stripe=stripe, now=self.clock())
+            return len(stripe.reservations.get(owner, dict()).get(name, ()))
+
+    def commit(self, owner: str, items: list[Product]) -> bool:
+        """
+        Turn the reservations of an owner for the items of a cart into sales.
+
+        Units whose reservation expired are taken from the catalog again. If there is no longer enough stock for
+        them nothing is committed and False is returned. Items that are not in the catalog are not stocked here.
+        """
+        stripe_indexes: list[int] = sorted({self.__get_stripe_index(name=item.name) for item in items})
+        with ExitStack() as stack:
+            for stripe_index in stripe_indexes:  # Always locked in the same order so commits cannot deadlock
+                stack.enter_context(self.__stripes[stripe_index].lock)
+            now: float = self.clock()
+            for stripe_index in stripe_indexes:
+                self.__expire_reservations(stripe=self.__stripes[stripe_index], now=now)
+
+            missing_units: list[tuple[Product, int]] = list()
+            sold_units: dict[int, int] = dict()  # By catalog position, as products sharing a name are sold separately
+            for item in items:
+                stripe: InventoryStripe = self.__stripes[self.__get_stripe_index(name=item.name)]
+                reserved_units: deque[tuple[float, Product]] = stripe.reservations.get(owner, dict()).get(
+                    item.name, deque()
+                )
+                product: Product | None = self.catalog.get_product_by_name(name=item.name)
+                if product is None:
+                    continue
+                for _, reserved_product in list(reserved_units)[:item.units]:  # The units kept, the rest go back
+                    position: int = self.catalog.get_position(product=reserved_product)
+                    sold_units[position] = sold_units.get(position, 0) - 1
+                if item.units > len(reserved_units):
+                    missing_units.append((product, item.units - len(reserved_units)))
+                    position: int = self.catalog.get_position(product=product)
+                    sold_units[position] = sold_units.get(position, 0) - (item.units - len(reserved_units))
+
+            for taken, (product, units) in enumerate(missing_units):
+                if not self.catalog.take_units(product=product, units=units):
+                    for taken_product, taken_units in missing_units[:taken]:  # Nothing is committed
+                        self.catalog.return_units(product=taken_product, units=taken_units)
+                    return False
+            for item in items:
+                stripe: InventoryStripe = self.__stripes[self.__get_stripe_index(name=item.name)]
+                owner_reservations: dict[str, deque[tuple[float, Product]]] = stripe.reservations.get(owner, dict())
+                reserved_units: deque[tuple[float, Product]] = owner_reservations.get(item.name, deque())
+                if len(reserved_units) > item.units:  # Reserved but not bought, the most recent units go back
+                    self.__restock(reserved_units=list(reserved_units)[item.units:])
+                if item.name in owner_reservations:
+                    del owner_reservations[item.name]
+                    if not owner_reservations:
+                        del stripe.reservations[owner]
+
+        if self.journal is not None:
+            self.journal.record(deltas=sold_units)
+        return True
@@ -0,0 +1,229 @@
+from online_shopping_cart.metrics.metrics_registry import METRICS
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_snapshot import get_csv_signature
+from csv import reader, writer
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Callable
+import json
+import os
+
+#############################
+# PRODUCT JOURNAL CONSTANTS #
+#############################
+
+
+JOURNAL_FILE_SUFFIX: str = '.journal'
+DEFAULT_FLUSH_COUNT: int = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS: float = 30.0
+
+
+###########################
+# PRODUCT JOURNAL CLASSES #
+###########################
+
+
+class InventoryJournal:
+    """
+    InventoryJournal class to persist the units sold without rewriting the CSV file on every purchase.
+
+    Every purchase appends its unit deltas, keyed by catalog position so products sharing a name stay apart, to a
+    journal next to the CSV file. Once enough purchases are recorded,
+    or enough time went by since the first one, a background thread writes the deltas into the CSV file as a whole,
+    aside and renamed over it, and starts the journal over with the purchases recorded in the meantime. Recording
+    never waits for the CSV file to be written. The journal begins with the signature of the CSV file it applies
+    to, so a journal left behind by a rewrite that was interrupted before the journal was reset is never applied
+    twice.
+    """
+
+    def __init__(self, csv_file_name: str, flush_count: int = DEFAULT_FLUSH_COUNT,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS, clock: Callable[[], float] = monotonic) -> None:
+        self.csv_file_name: str = csv_file_name
+        self.file_name: str = csv_file_name + JOURNAL_FILE_SUFFIX
+        self.flush_count: int = flush_count
+        self.flush_interval: float = flush_interval
+        self.clock: Callable[[], float] = clock
+        self.catalog: ProductCatalog | None = None  # The catalog the journal was replayed over
+        self.__pending_deltas: dict[int, int] = dict()  # Units per catalog position not yet written into the CSV file
+        self.__pending_records: int = 0
+        self.__first_pending_time: float | None = None
+        self.__is_started: bool = False  # Whether the journal file begins with the current CSV signature
+        self.__is_flushing: bool = False
+        self.__is_closed: bool = False
+        self.__lock: Lock = Lock()
+        self.__changed: Condition = Condition(self.__lock)
+        self.__flush_lock: Lock = Lock()  # Held while the CSV file is rewritten, without blocking records
+        self.__flusher: Thread | None = None
+
+    def __get_header(self, csv_file_name: str | None = None) -> bytes:
+        csv_signature: tuple[int, int] = get_csv_signature(csv_file_name=csv_file_name or self.csv_file_name)
+        return json.dumps({'csv_signature': list(csv_signature)}).encode() + b'\n'
+
+    @staticmethod
+    def __encode_deltas(deltas: dict[int, int]) -> bytes:
+        return json.dumps({'position_deltas': deltas}).encode('utf-8') + b'\n'
+
+    @staticmethod
+    def __decode_deltas(line: bytes, catalog: ProductCatalog) -> dict[int, int]:
+        record: dict = json.loads(line)
+        if 'position_deltas' in record:
+            return {int(position): delta for position, delta in record['position_deltas'].items()}
+        deltas: dict[int, int] = dict()  # Written by name before deltas were kept by position
+        for name, delta in record['deltas'].items():
+            position: int | None = catalog.get_position_by_name(name=name)
+            if position is not None:
+                deltas[position] = deltas.get(position, 0) + delta
+        return deltas
+
+    def __start_journal(self, header: bytes, deltas: dict[int, int]) -> None:
+        temporary_file_name: str = f'{self.file_name}.{os.getpid()}.tmp'
+        with open(file=temporary_file_name, mode='wb') as file:
+            file.write(header)
+            if deltas:
+                file.write(self.__encode_deltas(deltas=deltas))
+        os.replace(temporary_file_name, self.file_name)
+        self.__is_started = True
+
+    def replay(self, catalog: ProductCatalog) -> int:
+        """
+        Apply the deltas recorded since the CSV file was last written to a catalog loaded from it, and return how many
+        purchases were replayed
+        """
+        with self.__lock:
+            self.catalog = catalog
+            try:
+                with open(file=self.file_name, mode='rb') as file:
+                    if file.readline() != self.__get_header():
+                        return 0  # Left over from before the CSV file was rewritten, and already part of it
+                    self.__is_started = True
+                    for line in file:
+                        if not line.endswith(b'\n'):
+                            break  # Cut short by a crash while it was being written
+                        deltas: dict[int, int] = self.__decode_deltas(line=line, catalog=catalog)
+                        for position, delta in deltas.items():
+                            if position < len(catalog):
+                                catalog.change_units(product=catalog[position], units=delta)
+                        self.__add_pending(deltas=deltas)
+            except FileNotFoundError:
+                pass
+            return self.__pending_records
+
+    def __add_pending(self, deltas: dict[int, int]) -> None:
+        for position, delta in deltas.items():
+            self.__pending_deltas[position] = self.__pending_deltas.get(position, 0) + delta
+        self.__pending_records += 1
+        if self.__first_pending_time is None:
+            self.__first_pending_time = self.clock()
+
+    def record(self, deltas: dict[int, int]) -> None:
+        """
+        Append the unit deltas of a purchase by catalog position, the background thread writes them into the CSV file
+        once a threshold is reached
+        """
+        if not deltas:
+            return
+        with self.__lock:
+            if not self.__is_started:
+                self.__start_journal(header=self.__get_header(), deltas=self.__pending_deltas)
+            with open(file=self.file_name, mode='ab') as file:
+                file.write(self.__encode_deltas(deltas=deltas))
+            self.__add_pending(deltas=deltas)
+            if self.__flusher is None and not self.__is_closed:
+                self.__flusher = Thread(target=self.__run_flusher, name='inventory-journal-flusher', daemon=True)
+                self.__flusher.start()
+            self.__changed.notify_all()
+
+    def __get_flush_delay(self) -> float | None:
+        """
+        Seconds until the pending deltas are due to be written, 0 when they are due and None when nothing is pending
+        """
+        if not self.__pending_records or self.__is_flushing:
+            return None
+        if self.__pending_records >= self.flush_count:
+            return 0
+        return max(0.0, self.flush_interval - (self.clock() - self.__first_pending_time))
+
+    def __run_flusher(self) -> None:
+        while True:
+            with self.__lock:
+                while not self.__is_closed and self.__get_flush_delay() != 0:
+                    self.__changed.wait(timeout=self.__get_flush_delay())
+                if self.__is_closed:
+                    return
+            self.flush()
+
+    def wait_for_flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until no write of the pending deltas is due or under way, and return whether it happened in time
+        """
+        with self.__lock:
+            return self.__changed.wait_for(
+                lambda: not self.__is_flushing and self.__get_flush_delay() != 0,
+                timeout=timeout
+            )
+
+    def flush(self) -> None:
+        """
+        Write the pending deltas into the CSV file now
+        """
+        with self.__flush_lock:
+            with self.__lock:
+                if not self.__pending_records:
+                    return
+                self.__is_flushing = True
+                flushed_deltas: dict[int, int] = self.__pending_deltas
+                flushed_records: int = self.__pending_records
+                self.__pending_deltas = dict()
+                self.__pending_records = 0
+                self.__first_pending_time = None
+            try:
+                temporary_file_name: str = self.__write_csv(deltas=flushed_deltas)
+            except BaseException:
+                with self.__lock:  # Keep the deltas pending, they are still in the journal
+                    for position, delta in self.__pending_deltas.items():
+                        flushed_deltas[position] = flushed_deltas.get(position, 0) + delta
+                    self.__pending_deltas = flushed_deltas
+                    self.__pending_records += flushed_records
+                    self.__first_pending_time = self.clock()
+                    self.__is_flushing = False
+                    self.__changed.notify_all()
+                raise
+            with self.__lock:
+                header: bytes = self.__get_header(csv_file_name=temporary_file_name)  # Renaming keeps the signature
+                os.replace(temporary_file_name, self.csv_file_name)
+                # Against the new CSV signature, which drops the flushed deltas and keeps the ones recorded meanwhile
+                self.__start_journal(header=header, deltas=self.__pending_deltas)
+                self.__is_flushing = False
+                self.__changed.notify_all()
+            METRICS.increment(name='inventory_journal_flushes_total')
+
+    def __write_csv(self, deltas: dict[int, int]) -> str:
+        temporary_file_name: str = f'{self.csv_file_name}.{os.getpid()}.tmp'
+        with open(file=self.csv_file_name, mode='r', newline='') as csv_file, \
+                open(file=temporary_file_name, mode='w', newline='') as temporary_file:
+            csv_reader: reader = reader(csv_file)
+            csv_writer: writer = writer(temporary_file)
+            header: list[str] = next(csv_reader)
+            units_index: int = header.index('Units')
+            csv_writer.writerow(header)
+            position: int = 0
+            for row in csv_reader:
+                if row:  # Blank lines hold no product, as when the catalog is loaded
+                    delta: int | None = deltas.get(position)
+                    if delta is not None:
+                        row[units_index] = str(int(row[units_index]) + delta)
+                    position += 1
+                csv_writer.writerow(row)
+        return temporary_file_name
+
+    def close(self) -> None:
+        """
+        Stop the background thread and write the pending deltas into the CSV file
+        """
+        with self.__lock:
+            self.__is_closed = True
+            self.__changed.notify_all()
+            flusher: Thread | None = self.__flusher
+        if flusher is not None:
+            flusher.join()
+        self.flush()
@@ -0,0 +1,165 @@
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from math import inf
+from threading import Lock
+from typing import Iterator
+
+#################################
+# PRODUCT RANGE INDEX CONSTANTS #
+#################################
+
+
+BUCKET_SIZE: int = 1024  # Keys per bucket of a sorted key list, split at twice this size
+
+
+###############################
+# PRODUCT RANGE INDEX CLASSES #
+###############################
+
+
+class SortedKeyList:
+    """
+    SortedKeyList class to keep keys sorted in buckets, so a key moves in O(log n + bucket size) rather than O(n)
+    """
+
+    def __init__(self, keys=()) -> None:
+        sorted_keys: list = sorted(keys)
+        self.__buckets: list[list] = [
+            sorted_keys[start:start + BUCKET_SIZE] for start in range(0, len(sorted_keys), BUCKET_SIZE)
+        ]
+        self.__maxima: list = [bucket[-1] for bucket in self.__buckets]  # Largest key of every bucket
+        self.__length: int = len(sorted_keys)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def add(self, key) -> None:
+        if not self.__buckets:
+            self.__buckets.append([key])
+            self.__maxima.append(key)
+        else:
+            bucket_index: int = min(bisect_left(self.__maxima, key), len(self.__buckets) - 1)
+            bucket: list = self.__buckets[bucket_index]
+            insort(bucket, key)
+            self.__maxima[bucket_index] = bucket[-1]
+            if len(bucket) > 2 * BUCKET_SIZE:
+                self.__buckets[bucket_index:bucket_index + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+                self.__maxima[bucket_index:bucket_index + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+        self.__length += 1
+
+    def remove(self, key) -> None:
+        """
+        Remove a key, raising ValueError if it is not in the list
+        """
+        bucket_index: int = bisect_left(self.__maxima, key)
+        if bucket_index == len(self.__buckets):
+            raise ValueError(f'{key!r} is not in the list')
+        bucket: list = self.__buckets[bucket_index]
+        position: int = bisect_left(bucket, key)
+        if position == len(bucket) or bucket[position] != key:
+            raise ValueError(f'{key!r} is not in the list')
+        del bucket[position]
+        if bucket:
+            self.__maxima[bucket_index] = bucket[-1]
+        else:
+            del self.__buckets[bucket_index]
+            del self.__maxima[bucket_index]
+        self.__length -= 1
+
+    def irange(self, low, high) -> Iterator:
+        """
+        Yield the keys from low to high, both included, in order
+        """
+        bucket_index: int = bisect_left(self.__maxima, low)
+        if bucket_index == len(self.__buckets):
+            return
+        position: int = bisect_left(self.__buckets[bucket_index], low)
+        while bucket_index < len(self.__buckets):
+            bucket: list = self.__buckets[bucket_index]
+            end: int = bisect_right(bucket, high, lo=position)
+            yield from bucket[position:end]
+            if end < len(bucket):
+                return
+            bucket_index += 1
+            position = 0
+
+
+class ProductRangeIndex:
+    """
+    ProductRangeIndex class to find the products of a catalog by price range or units range.
+
+    Prices and units are kept in sorted key lists of (value, position) pairs, so a range query takes O(log n + k).
+    The index follows the change listeners of the catalog, moving a product's keys when its units or price change,
+    and picks up products added to the catalog on the next query.
+    """
+
+    def __init__(self, catalog: ProductCatalog) -> None:
+        self.catalog: ProductCatalog = catalog
+        self.foreign_change_count: int = catalog.get_foreign_change_count()  # Before the values are read
+        if isinstance(catalog, CompactProductCatalog):
+            self.__indexed_prices: array = array('d', catalog.prices)  # Values the keys were made from
+            self.__indexed_units: array = array('q', catalog.units)
+        else:
+            self.__indexed_prices: array = array('d', (product.price for product in catalog))
+            self.__indexed_units: array = array('q', (product.units for product in catalog))
+        self.__prices: SortedKeyList = SortedKeyList(keys=zip(self.__indexed_prices, range(len(catalog))))
+        self.__units: SortedKeyList = SortedKeyList(keys=zip(self.__indexed_units, range(len(catalog))))
+        self.__lock: Lock = Lock()
+        catalog.add_change_listener(listener=self.refresh_product)
+
+    def close(self) -> None:
+        """
+        Stop following product changes
+        """
+        self.catalog.remove_change_listener(listener=self.refresh_product)
+
+    def is_outdated(self) -> bool:
+        """
+        Whether other processes changed the catalog since the index was built, which its listeners did not hear about
+        """
+        return self.catalog.get_foreign_change_count() != self.foreign_change_count
+
+    def __index_new_products(self) -> None:
+        for position in range(len(self.__indexed_units), len(self.catalog)):
+            product: Product = self.catalog[position]
+            self.__indexed_prices.append(product.price)
+            self.__indexed_units.append(product.units)
+            self.__prices.add((product.price, position))
+            self.__units.add((product.units, position))
+
+    def refresh_product(self, position: int) -> None:
+        """
+        Move the keys of the product at a position after its units or price changed, used as a change listener
+        """
+        with self.__lock:
+            if position >= len(self.__indexed_units):
+                return  # Indexed along with the other new products on the next query
+            product: Product = self.catalog[position]
+            if product.units != self.__indexed_units[position]:
+                self.__units.remove((self.__indexed_units[position], position))
+                self.__units.add((product.units, position))
+                self.__indexed_units[position] = product.units
+            if product.price != self.__indexed_prices[position]:
+                self.__prices.remove((self.__indexed_prices[position], position))
+                self.__prices.add((product.price, position))
+                self.__indexed_prices[position] = product.price
+
+    def __get_range(self, keys: SortedKeyList, low: float, high: float) -> list[Product]:
+        with self.__lock:
+            self.__index_new_products()
+            positions: list[int] = [position for _, position in keys.irange(low=(low, -1), high=(high, inf))]
+        return [self.catalog[position] for position in positions]
+
+    def get_products_by_price(self, low: float = -inf, high: float = inf) -> list[Product]:
+        """
+        Retrieve the products priced from low to high, both included, cheapest first
+        """
+        return self.__get_range(keys=self.__prices, low=low, high=high)
+
+    def get_products_by_units(self, low: float = -inf, high: float = inf) -> list[Product]:
+        """
+        Retrieve the products with from low to high units, both included, fewest first
+        """
+        return self.__get_range(keys=self.__units, low=low, high=high)
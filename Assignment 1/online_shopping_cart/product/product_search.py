@@ -1,12 +1,102 @@
-from online_shopping_cart.product.product_data import get_csv_data, PRODUCTS_FILE_PATHNAME
-from re import search, IGNORECASE
+from online_shopping_cart.metrics.metrics_registry import METRICS, timed
+from online_shopping_cart.product.product_index import get_search_index, ProductSearchIndex
+from online_shopping_cart.product.product_data import PRODUCTS_FILE_PATHNAME
+from online_shopping_cart.product.product_snapshot import get_csv_signature
+from collections import OrderedDict
+from threading import Lock
 
 ############################
 # PRODUCT SEARCH CONSTANTS #
 ############################
 
 
-PRODUCT_HEADER_INDEX: str = 'Product'
+DEFAULT_SEARCH_CACHE_CAPACITY: int = 256
+ALL_PRODUCTS_SEARCH_TARGET: None = None  # Cache key of the whole table
+
+
+##########################
+# PRODUCT SEARCH CLASSES #
+##########################
+
+
+class SearchResultCache:
+    """
+    SearchResultCache class to keep the most recently used search results, keyed by CSV file and search target.
+
+    The rows are read from the CSV file, so results are dropped only when the file they were read from changes.
+    Stock changes in a loaded catalog reach the rows once they are written into the file.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SEARCH_CACHE_CAPACITY) -> None:
+        self.capacity: int = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+        # Search key -> CSV signature, header and rows
+        self.__entries: OrderedDict[tuple[str, str | None], tuple[tuple[int, int], list[str], list[list[str]]]] = \
+            OrderedDict()
+        self.__lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, csv_file_name: str, search_target: str | None,
+            csv_signature: tuple[int, int]) -> tuple[list[str], list[list[str]]] | None:
+        """
+        Retrieve the header and rows cached for a search of a CSV file, or None if they are missing or outdated
+        """
+        key: tuple[str, str | None] = (csv_file_name, search_target)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] == csv_signature:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                METRICS.increment(name='search_cache_hits_total')
+                return entry[1], entry[2]
+            if entry is not None:
+                del self.__entries[key]  # Read from the CSV file before it changed
+                self.invalidations += 1
+            self.misses += 1
+            METRICS.increment(name='search_cache_misses_total')
+            return None
+
+    def put(self, csv_file_name: str, search_target: str | None, csv_signature: tuple[int, int], header: list[str],
+            rows: list[list[str]]) -> None:
+        key: tuple[str, str | None] = (csv_file_name, search_target)
+        with self.__lock:
+            self.__entries[key] = (csv_signature, header, rows)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.capacity:
+                self.__entries.popitem(last=False)  # Least recently used first
+                self.evictions += 1
+                METRICS.increment(name='search_cache_evictions_total')
+
+    def clear(self) -> None:
+        """
+        Drop every cached result and start the stats over
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            'size': len(self.__entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+
+
+##########################
+# PRODUCT SEARCH GLOBALS #
+##########################
+
+
+search_result_cache: SearchResultCache = SearchResultCache()
 
 
 ############################
@@ -14,16 +104,43 @@ PRODUCT_HEADER_INDEX: str = 'Product'
 ############################
 
 
+def _get_search_results(csv_file_name: str, search_target: str | None) -> tuple[list[str], list[list[str]]]:
+    csv_signature: tuple[int, int] = get_csv_signature(csv_file_name=csv_file_name)
+    results: tuple[list[str], list[list[str]]] | None = search_result_cache.get(
+        csv_file_name=csv_file_name,
+        search_target=search_target,
+        csv_signature=csv_signature
+    )
+    if results is not None:
+        return results
+
+    search_index: ProductSearchIndex = get_search_index(csv_file_name=csv_file_name)
+    if search_target is ALL_PRODUCTS_SEARCH_TARGET:
+        rows: list[list[str]] = search_index.rows  # Shared with the index rather than copied
+    else:
+        rows: list[list[str]] = search_index.search(search_target=search_target)
+    search_result_cache.put(
+        csv_file_name=csv_file_name,
+        search_target=search_target,
+        csv_signature=csv_signature,
+        header=search_index.header,
+        rows=rows
+    )
+    return search_index.header, rows
+
+
+@timed('product_display_csv_as_table_seconds')
 def display_csv_as_table(csv_file_name=PRODUCTS_FILE_PATHNAME) -> None:
     """
     Display all the products row by row, starting with the header
     """
-    header, csv_reader = get_csv_data(csv_file_name=csv_file_name)
+    header, rows = _get_search_results(csv_file_name=csv_file_name, search_target=ALL_PRODUCTS_SEARCH_TARGET)
     print(f'\n{header}')
-    for row in csv_reader:
+    for row in rows:
         print(row)
 
 
+@timed('product_display_filtered_table_seconds')
 def display_filtered_table(csv_file_name=PRODUCTS_FILE_PATHNAME, search_target=None) -> None:
     """
     Display products filtered by name row by row, starting with the header
@@ -31,10 +148,7 @@ def display_filtered_table(csv_file_name=PRODUCTS_FILE_PATHNAME, search_target=N
     if search_target is None:
         display_csv_as_table(csv_file_name=csv_file_name)
     else:
-        header, csv_reader = get_csv_data(csv_file_name=csv_file_name)
+        header, rows = _get_search_results(csv_file_name=csv_file_name, search_target=search_target.lower())
         print(f'\n{header}')
-
-        condition_index: int = header.index(PRODUCT_HEADER_INDEX)
-        for i, row in enumerate(csv_reader):
-            if search(pattern=row[condition_index], string=search_target.capitalize(), flags=IGNORECASE):
-                print(row)
+        for row in rows:
+            print(row)
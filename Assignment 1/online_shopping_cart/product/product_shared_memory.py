@@ -0,0 +1,208 @@
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog, ProductView
+from online_shopping_cart.product.product_journal import InventoryJournal
+from multiprocessing import Lock, get_context
+from multiprocessing.queues import SimpleQueue
+from multiprocessing.shared_memory import SharedMemory
+from threading import Thread
+
+###################################
+# PRODUCT SHARED MEMORY CONSTANTS #
+###################################
+
+
+DEFAULT_LOCK_COUNT: int = 64
+WORD_SIZE: int = 8  # Units, prices, name offsets and change counts are all 8-byte values
+
+
+#################################
+# PRODUCT SHARED MEMORY CLASSES #
+#################################
+
+
+class SharedNameTable:
+    """
+    SharedNameTable class to read the product names packed in shared memory, the table cannot be changed
+    """
+
+    def __init__(self, offsets: memoryview, encoded_names: memoryview) -> None:
+        self.__offsets: memoryview = offsets
+        self.__encoded_names: memoryview = encoded_names
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        return bytes(self.__encoded_names[self.__offsets[position]:self.__offsets[position + 1]]).decode('utf-8')
+
+    def __iter__(self):
+        return (self[position] for position in range(len(self)))
+
+    def release(self) -> None:
+        self.__offsets.release()
+        self.__encoded_names.release()
+
+
+class SharedSalesJournal:
+    """
+    SharedSalesJournal class to forward the units sold in any process to the journal of the process that created the
+    shared catalog
+    """
+
+    def __init__(self, sales: SimpleQueue, catalog: ProductCatalog) -> None:
+        self.sales: SimpleQueue = sales
+        self.catalog: ProductCatalog = catalog  # The shared catalog the sales are taken from
+
+    def record(self, deltas: dict[int, int]) -> None:
+        if deltas:
+            self.sales.put(deltas)
+
+
+class SharedProductCatalog(CompactProductCatalog):
+    """
+    SharedProductCatalog class to sell from one stock across the worker processes of a host.
+
+    The units, prices and names of the products live in one shared memory block laid out as units, prices, name
+    offsets, change counts per lock, then the UTF-8 encoded names. Units are taken and returned under a process lock
+    picked by product position, so two processes cannot take the last unit. Handing the catalog to a worker process,
+    for example as a ProcessPoolExecutor initializer argument, attaches the worker to the same block. The process that
+    created the catalog unlinks the block once every process closed it. The set of products is fixed at creation.
+
+    Given a journal at creation, the units sold in every process are sent to the creating process, which records them
+    in the journal. Change listeners only hear about changes made in their own process, so indexes derived from the
+    catalog compare get_foreign_change_count with the count they were built at to tell when to build again.
+    """
+
+    @classmethod
+    def create(cls, products: ProductCatalog, lock_count: int = DEFAULT_LOCK_COUNT,
+               journal: InventoryJournal | None = None):
+        """
+        Copy the products of a catalog into a new shared memory block, recording the units sold in the journal if
+        given
+        """
+        encoded_names: list[bytes] = [product.name.encode('utf-8') for product in products]
+        count: int = len(encoded_names)
+        names_start: int = WORD_SIZE * (3 * count + 1 + lock_count)
+        shared_memory: SharedMemory = SharedMemory(
+            create=True,
+            size=names_start + sum(len(encoded_name) for encoded_name in encoded_names)
+        )
+        with memoryview(shared_memory.buf) as buffer:
+            with buffer[:WORD_SIZE * count].cast('q') as units, \
+                    buffer[WORD_SIZE * count:WORD_SIZE * 2 * count].cast('d') as prices, \
+                    buffer[WORD_SIZE * 2 * count:WORD_SIZE * (3 * count + 1)].cast('q') as offsets:
+                offset: int = 0
+                offsets[0] = 0
+                for position, product in enumerate(products):
+                    units[position] = product.units
+                    prices[position] = product.price
+                    offsets[position + 1] = offset = offset + len(encoded_names[position])
+            buffer[WORD_SIZE * (3 * count + 1):names_start] = bytes(WORD_SIZE * lock_count)
+            buffer[names_start:names_start + offset] = b''.join(encoded_names)
+        catalog: SharedProductCatalog = cls.__attach(
+            shared_memory=shared_memory,
+            count=count,
+            locks=[Lock() for _ in range(lock_count)],
+            sales=None if journal is None else SimpleQueue(ctx=get_context())
+        )
+        catalog.journal = journal
+        if journal is not None:
+            catalog.sales_recorder = Thread(target=catalog.__record_sales, name='shared-sales-recorder', daemon=True)
+            catalog.sales_recorder.start()
+        return catalog
+
+    @classmethod
+    def _attach(cls, shared_memory_name: str, count: int, locks: list, sales: SimpleQueue | None):
+        return cls.__attach(shared_memory=SharedMemory(name=shared_memory_name), count=count, locks=locks, sales=sales)
+
+    @classmethod
+    def __attach(cls, shared_memory: SharedMemory, count: int, locks: list, sales: SimpleQueue | None):
+        buffer: memoryview = shared_memory.buf
+        names_start: int = WORD_SIZE * (3 * count + 1 + len(locks))
+        catalog: SharedProductCatalog = cls.from_arrays(
+            names=SharedNameTable(
+                offsets=buffer[WORD_SIZE * 2 * count:WORD_SIZE * (3 * count + 1)].cast('q').toreadonly(),
+                encoded_names=buffer[names_start:].toreadonly()
+            ),
+            prices=buffer[WORD_SIZE * count:WORD_SIZE * 2 * count].cast('d'),
+            units=buffer[:WORD_SIZE * count].cast('q')
+        )
+        catalog.shared_memory = shared_memory
+        catalog.locks = locks
+        catalog.change_counts = buffer[WORD_SIZE * (3 * count + 1):names_start].cast('q')
+        catalog.local_change_counts = [0] * len(locks)  # Changes made by this process, which its listeners heard about
+        catalog.sales = sales
+        catalog.sales_journal = None if sales is None else SharedSalesJournal(sales=sales, catalog=catalog)
+        catalog.journal = None
+        catalog.sales_recorder = None
+        return catalog
+
+    def __reduce__(self):
+        return SharedProductCatalog._attach, (self.shared_memory.name, len(self), self.locks, self.sales)
+
+    def __record_sales(self) -> None:
+        while (deltas := self.sales.get()) is not None:
+            self.journal.record(deltas=deltas)
+
+    def close(self) -> None:
+        """
+        Detach this process from the shared memory block, the catalog cannot be used afterwards. The creating process
+        records the sales still on their way first, so it closes once the workers are done selling.
+        """
+        if self.sales_recorder is not None:
+            self.sales.put(None)
+            self.sales_recorder.join()
+        self.names.release()
+        self.prices.release()
+        self.units.release()
+        self.change_counts.release()
+        self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory block once every process closed it, called by the process that created it
+        """
+        self.shared_memory.unlink()
+
+    def __get_position(self, product: Product) -> int:
+        if isinstance(product, ProductView) and product.catalog is self:
+            return product.position
+        position: int | None = self.get_position_by_name(name=product.name)
+        if position is None:
+            raise KeyError(f'{product.name} is not in the shared catalog')
+        return position
+
+    def get_foreign_change_count(self) -> int:
+        return sum(self.change_counts) - sum(self.local_change_counts)
+
+    def add_product(self, product: Product) -> None:
+        raise TypeError('Products cannot be added to a shared product catalog')
+
+    def __change_units(self, product: Product, units: int, is_checked: bool) -> bool:
+        position: int = self.__get_position(product=product)
+        lock_index: int = position % len(self.locks)
+        with self.locks[lock_index]:
+            if is_checked and self.units[position] + units < 0:
+                return False
+            self.units[position] += units
+            self.change_counts[lock_index] += 1
+            self.local_change_counts[lock_index] += 1
+        self.notify_changed(position=position)
+        return True
+
+    def set_units(self, position: int, units: int) -> None:
+        lock_index: int = position % len(self.locks)
+        with self.locks[lock_index]:
+            self.units[position] = units
+            self.change_counts[lock_index] += 1
+            self.local_change_counts[lock_index] += 1
+        self.notify_changed(position=position)
+
+    def take_units(self, product: Product, units: int = 1) -> bool:
+        return self.__change_units(product=product, units=-units, is_checked=True)
+
+    def return_units(self, product: Product, units: int = 1) -> None:
+        self.__change_units(product=product, units=units, is_checked=False)
+
+    def change_units(self, product: Product, units: int) -> None:
+        self.__change_units(product=product, units=units, is_checked=False)
@@ -0,0 +1,111 @@
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from array import array
+from mmap import mmap, ACCESS_READ
+from struct import Struct, error as StructError
+import os
+
+##############################
+# PRODUCT SNAPSHOT CONSTANTS #
+##############################
+
+
+SNAPSHOT_FILE_SUFFIX: str = '.snapshot'
+SNAPSHOT_MAGIC: bytes = b'OSCSNAP1'
+SNAPSHOT_HEADER: Struct = Struct('=8sqqq')  # Magic, CSV mtime (ns), CSV size, number of products
+
+
+##############################
+# PRODUCT SNAPSHOT FUNCTIONS #
+##############################
+
+
+def get_snapshot_file_name(csv_file_name: str) -> str:
+    return csv_file_name + SNAPSHOT_FILE_SUFFIX
+
+
+def get_csv_signature(csv_file_name: str) -> tuple[int, int]:
+    """
+    Retrieve the modification time and size the snapshot of a CSV file is validated against
+    """
+    file_stat = os.stat(csv_file_name)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def write_snapshot(csv_file_name: str, csv_signature: tuple[int, int], products: ProductCatalog) -> bool:
+    """
+    Pack the products parsed from a CSV file into a binary snapshot next to it.
+
+    The layout is the header, then the name offsets, prices and units as native 8-byte arrays, then the UTF-8
+    encoded names back to back. The file is written aside and renamed so readers never see a partial snapshot.
+    """
+    snapshot_file_name: str = get_snapshot_file_name(csv_file_name=csv_file_name)
+    temporary_file_name: str = f'{snapshot_file_name}.{os.getpid()}.tmp'
+    try:
+        if isinstance(products, CompactProductCatalog):
+            names: list[str] = products.names
+            prices: array = products.prices
+            units: array = products.units
+        else:
+            names: list[str] = [product.name for product in products]
+            prices: array = array('d', (product.price for product in products))
+            units: array = array('q', (product.units for product in products))
+
+        name_offsets: array = array('q', [0])
+        encoded_names: list[bytes] = list()
+        for name in names:
+            encoded_name: bytes = name.encode('utf-8')
+            encoded_names.append(encoded_name)
+            name_offsets.append(name_offsets[-1] + len(encoded_name))
+
+        with open(file=temporary_file_name, mode='wb') as snapshot_file:
+            snapshot_file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, *csv_signature, len(prices)))
+            name_offsets.tofile(snapshot_file)
+            prices.tofile(snapshot_file)
+            units.tofile(snapshot_file)
+            snapshot_file.write(b''.join(encoded_names))
+        os.replace(temporary_file_name, snapshot_file_name)
+        return True
+    except (OSError, OverflowError, TypeError):
+        # A snapshot is only a cache, the catalog is still served from the CSV file
+        try:
+            os.remove(temporary_file_name)
+        except OSError:
+            pass
+        return False
+
+
+def _read_array(snapshot: mmap, typecode: str, position: int, count: int) -> array:
+    values: array = array(typecode)
+    values.frombytes(snapshot[position:position + values.itemsize * count])
+    if len(values) != count:
+        raise ValueError('Truncated snapshot')
+    return values
+
+
+def read_snapshot(csv_file_name: str, csv_signature: tuple[int, int]) -> CompactProductCatalog | None:
+    """
+    Load the products from the snapshot of a CSV file, or None if there is no snapshot matching the file
+    """
+    try:
+        with open(file=get_snapshot_file_name(csv_file_name=csv_file_name), mode='rb') as snapshot_file, \
+                mmap(snapshot_file.fileno(), 0, access=ACCESS_READ) as snapshot:
+            magic, mtime_ns, size, count = SNAPSHOT_HEADER.unpack_from(snapshot)
+            if magic != SNAPSHOT_MAGIC or (mtime_ns, size) != csv_signature:
+                return None
+
+            position: int = SNAPSHOT_HEADER.size
+            name_offsets: array = _read_array(snapshot=snapshot, typecode='q', position=position, count=count + 1)
+            position += name_offsets.itemsize * len(name_offsets)
+            prices: array = _read_array(snapshot=snapshot, typecode='d', position=position, count=count)
+            position += prices.itemsize * len(prices)
+            units: array = _read_array(snapshot=snapshot, typecode='q', position=position, count=count)
+            position += units.itemsize * len(units)
+            names: bytes = snapshot[position:position + name_offsets[count]]
+
+            return CompactProductCatalog.from_arrays(
+                names=[names[name_offsets[i]:name_offsets[i + 1]].decode('utf-8') for i in range(count)],
+                prices=prices,
+                units=units
+            )
+    except (OSError, ValueError, IndexError, StructError):
+        return None
@@ -0,0 +1,93 @@
+from online_shopping_cart.server.shop_server import DEFAULT_HOST, DEFAULT_PORT
+from argparse import ArgumentParser
+import asyncio
+import json
+import shlex
+import sys
+
+#######################
+# SHOP CLIENT CLASSES #
+#######################
+
+
+class ShopClient:
+    """
+    ShopClient class to talk to a shop server, one request at a time
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.__reader: asyncio.StreamReader = reader
+        self.__writer: asyncio.StreamWriter = writer
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> 'ShopClient':
+        reader, writer = await asyncio.open_connection(host=host, port=port)
+        return cls(reader=reader, writer=writer)
+
+    async def request(self, action: str, **fields) -> dict:
+        """
+        Send a request and wait for its response
+        """
+        self.__writer.write(json.dumps({'action': action, **fields}).encode('utf-8') + b'\n')
+        await self.__writer.drain()
+        line: bytes = await self.__reader.readline()
+        if not line:
+            raise ConnectionError('The shop server closed the connection.')
+        return json.loads(line)
+
+    async def close(self) -> None:
+        self.__writer.close()
+        await self.__writer.wait_closed()
+
+    async def __aenter__(self) -> 'ShopClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+#########################
+# SHOP CLIENT FUNCTIONS #
+#########################
+
+
+def parse_command(command: str) -> tuple[str, dict[str, str]]:
+    """
+    Parse a command such as 'add name="Gaming Mouse"' into its action and fields
+    """
+    action, *arguments = shlex.split(command)
+    fields: dict[str, str] = dict()
+    for argument in arguments:
+        field, separator, value = argument.partition('=')
+        if not separator:
+            raise ValueError(f'Expected field=value, got {argument!r}.')
+        fields[field] = value
+    return action, fields
+
+
+async def run_client(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    async with await ShopClient.connect(host=host, port=port) as client:
+        for command in sys.stdin:
+            if not command.strip():
+                continue
+            try:
+                action, fields = parse_command(command=command)
+            except ValueError as error:
+                print(error)
+                continue
+            print(json.dumps(await client.request(action, **fields)))
+
+
+def shop_client_app() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description='Send commands such as "login username=Ramanathan password=Notaproblem23*" to a shop server, '
+                    'one per line on standard input'
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    arguments = parser.parse_args()
+    asyncio.run(run_client(host=arguments.host, port=arguments.port))
+
+
+if __name__ == '__main__':
+    shop_client_app()
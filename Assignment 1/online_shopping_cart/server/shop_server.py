@@ -0,0 +1,320 @@
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.checkout.session_manager import Session, SessionManager
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.metrics.metrics_registry import METRICS
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_data import PRODUCTS_FILE_PATHNAME
+from online_shopping_cart.product.product_index import ProductSearchIndex, get_search_index
+from online_shopping_cart.user.user_authentication import UserAuthenticator
+from online_shopping_cart.user.user_data import UserDataManager
+from argparse import ArgumentParser
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from uuid import uuid4
+import asyncio
+import json
+import logging
+
+#########################
+# SHOP SERVER CONSTANTS #
+#########################
+
+
+DEFAULT_HOST: str = '127.0.0.1'
+DEFAULT_PORT: int = 8765
+INTERNAL_ERROR_MESSAGE: str = 'The shop could not handle the request.'
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+
+#######################
+# SHOP SERVER CLASSES #
+#######################
+
+
+class ShopRequestError(Exception):
+    """
+    ShopRequestError class for requests the shop server refuses, the message is sent back to the client
+    """
+
+
+class ShopConnection:
+    """
+    ShopConnection class to hold the state of one client connection, whose session is keyed by the connection
+    """
+
+    def __init__(self) -> None:
+        self.connection_id: str = uuid4().hex
+        self.session: Session | None = None
+
+
+class ShopServer:
+    """
+    ShopServer class to serve the shop over a line protocol.
+
+    Every request and response is a JSON object on its own line. Requests name an action (login, search, products,
+    add, remove, cart, checkout or logout) along with its fields, and responses carry "ok" and either the result or
+    an "error". Handlers that read files, write files, walk the catalog or take inventory locks run on a thread pool so
+    the event loop keeps serving other clients. Every connection has its own session and reservations, even when several
+    connections log in as the same user, and they are closed along with the connection.
+    """
+
+    def __init__(self, session_manager: SessionManager | None = None, executor: Executor | None = None,
+                 csv_file_name: str = PRODUCTS_FILE_PATHNAME) -> None:
+        self.session_manager: SessionManager = (  # An empty session manager is falsy
+            checkout_process.global_session_manager if session_manager is None else session_manager
+        )
+        self.executor: Executor = executor or ThreadPoolExecutor()
+        self.csv_file_name: str = csv_file_name
+        self.__handlers = {
+            'login': self.__login,
+            'search': self.__search,
+            'products': self.__products,
+            'add': self.__add,
+            'remove': self.__remove,
+            'cart': self.__cart,
+            'checkout': self.__checkout,
+            'logout': self.__logout
+        }
+
+    @staticmethod
+    def __call_blocking(function, **kwargs):
+        try:
+            return function(**kwargs)
+        except SystemExit as error:  # Such as exit(1) on an unreadable users file, which must not stop the server
+            raise RuntimeError(f'{function.__name__} exited with status {error.code}') from None
+
+    async def __run_blocking(self, function, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            partial(self.__call_blocking, function, **kwargs)
+        )
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.Server:
+        """
+        Start listening for clients, port 0 picks a free port
+        """
+        await self.__run_blocking(function=checkout_process.preload)
+        return await asyncio.start_server(self.__handle_connection, host=host, port=port)
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection: ShopConnection = ShopConnection()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ShopRequestError('Requests must be JSON objects.')
+                    response: dict = {'ok': True, **await self.handle_request(request=request, connection=connection)}
+                except (ValueError, ShopRequestError) as error:  # Including malformed JSON
+                    response: dict = {'ok': False, 'error': str(error)}
+                except Exception:
+                    _logger.exception('Failed to handle a shop request')
+                    response: dict = {'ok': False, 'error': INTERNAL_ERROR_MESSAGE}
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass  # The client went away
+        finally:
+            if connection.session is not None:  # No other connection can resume the session, return its reservations
+                self.session_manager.close_session(session_id=connection.session.session_id)
+            writer.close()
+
+    async def handle_request(self, request: dict, connection: ShopConnection) -> dict:
+        """
+        Run the handler of a request and return its result
+        """
+        handler = self.__handlers.get(request.get('action'))
+        if handler is None:
+            raise ShopRequestError(f"Unknown action {request.get('action')!r}.")
+        METRICS.increment(name=f"server_{request['action']}_requests_total")
+        return await handler(request=request, connection=connection)
+
+    @staticmethod
+    def __get_field(request: dict, field: str) -> str:
+        value = request.get(field)
+        if not isinstance(value, str):
+            raise ShopRequestError(f'Missing {field}.')
+        return value
+
+    def __get_session(self, connection: ShopConnection) -> Session:
+        session: Session | None = None
+        if connection.session is not None:
+            session = self.session_manager.get_session(session_id=connection.session.session_id)
+        if session is None:
+            connection.session = None  # Logged out or evicted while idle
+            raise ShopRequestError('Please log in first.')
+        return session
+
+    @staticmethod
+    def __describe_cart(cart: ShoppingCart) -> dict:
+        return {
+            'items': [
+                {'name': item.name, 'price': item.price, 'units': item.units} for item in cart.retrieve_items()
+            ],
+            'total_price': cart.get_total_price()
+        }
+
+    @staticmethod
+    def __authenticate(username: str, password: str) -> dict[str, str | float] | None:
+        # The store is loaded once and kept while the file is unchanged, so each login is an index lookup
+        user: dict[str, str | float] | None = UserDataManager.load_users().find_user(username=username)
+        return UserAuthenticator.authenticate(username=username, password=password, data=[] if user is None else [user])
+
+    async def __login(self, request: dict, connection: ShopConnection) -> dict:
+        username: str = self.__get_field(request=request, field='username')
+        password: str = self.__get_field(request=request, field='password')
+        login_info: dict[str, str | float] | None = await self.__run_blocking(
+            function=self.__authenticate,
+            username=username,
+            password=password
+        )
+        if login_info is None:
+            raise ShopRequestError('Login failed.')
+        if connection.session is not None:  # Logging in again on the same connection starts over
+            self.session_manager.close_session(session_id=connection.session.session_id)
+        connection.session = self.session_manager.open_session(
+            login_info=login_info,
+            session_id=connection.connection_id
+        )
+        return {'username': connection.session.user.name, 'wallet': connection.session.user.wallet}
+
+    def __find_rows(self, search_target: str) -> dict:
+        search_index: ProductSearchIndex = get_search_index(csv_file_name=self.csv_file_name)
+        rows: list[list[str]] = search_index.rows if search_target == 'all' else search_index.search(
+            search_target=search_target
+        )
+        return {'header': search_index.header, 'rows': rows}
+
+    async def __search(self, request: dict, connection: ShopConnection) -> dict:
+        search_target: str = self.__get_field(request=request, field='query').lower()
+        return await self.__run_blocking(function=self.__find_rows, search_target=search_target)
+
+    @staticmethod
+    def __get_range(request: dict, field: str) -> tuple[float, float] | None:
+        low, high = request.get(f'min_{field}'), request.get(f'max_{field}')
+        if low is None and high is None:
+            return None
+        try:
+            return float('-inf' if low is None else low), float('inf' if high is None else high)
+        except (TypeError, ValueError):
+            raise ShopRequestError(f'Invalid {field} range.')
+
+    async def __products(self, request: dict, connection: ShopConnection) -> dict:
+        return await self.__run_blocking(
+            function=self.__list_products,
+            price_range=self.__get_range(request=request, field='price'),
+            units_range=self.__get_range(request=request, field='units')
+        )
+
+    @staticmethod
+    def __list_products(price_range: tuple[float, float] | None, units_range: tuple[float, float] | None) -> dict:
+        checkout_process.get_global_inventory().expire_reservations()
+        if price_range is not None:
+            products: list[Product] = checkout_process.get_global_range_index().get_products_by_price(
+                low=price_range[0],
+                high=price_range[1]
+            )
+            if units_range is not None:
+                products = [product for product in products if units_range[0] <= product.units <= units_range[1]]
+        elif units_range is not None:
+            products: list[Product] = checkout_process.get_global_range_index().get_products_by_units(
+                low=units_range[0],
+                high=units_range[1]
+            )
+        else:
+            products: list[Product] = list(checkout_process.get_global_products())
+        return {
+            'products': [
+                {'name': product.name, 'price': product.price, 'units': product.units} for product in products
+            ]
+        }
+
+    async def __add(self, request: dict, connection: ShopConnection) -> dict:
+        session: Session = self.__get_session(connection=connection)
+        name: str = self.__get_field(request=request, field='name')
+        return await self.__run_blocking(function=self.__add_to_cart, session=session, name=name)
+
+    @staticmethod
+    def __add_to_cart(session: Session, name: str) -> dict:
+        product: Product | None = checkout_process.get_global_products().get_product_by_name(name=name)
+        if product is None:
+            raise ShopRequestError(f'Unknown product {name!r}.')
+        unit: Product | None = checkout_process.get_global_inventory().reserve(
+            owner=session.session_id,
+            product=product
+        )
+        if unit is None:
+            raise ShopRequestError(f'Sorry, {name} is out of stock.')
+        session.cart.add_item(product=unit)
+        return ShopServer.__describe_cart(cart=session.cart)
+
+    async def __remove(self, request: dict, connection: ShopConnection) -> dict:
+        session: Session = self.__get_session(connection=connection)
+        name: str = self.__get_field(request=request, field='name')
+        return await self.__run_blocking(function=self.__remove_from_cart, session=session, name=name)
+
+    @staticmethod
+    def __remove_from_cart(session: Session, name: str) -> dict:
+        for item in session.cart.retrieve_items():
+            if item.name == name:
+                session.cart.remove_item(product=item)
+                checkout_process.get_global_inventory().release(owner=session.session_id, name=name)
+                return ShopServer.__describe_cart(cart=session.cart)
+        raise ShopRequestError(f'{name} is not in your cart.')
+
+    async def __cart(self, request: dict, connection: ShopConnection) -> dict:
+        session: Session = self.__get_session(connection=connection)
+        return {'wallet': session.user.wallet, **self.__describe_cart(cart=session.cart)}
+
+    async def __checkout(self, request: dict, connection: ShopConnection) -> dict:
+        session: Session = self.__get_session(connection=connection)
+        outcome: str = await self.__run_blocking(function=self.__complete_checkout, session=session)
+        if outcome != checkout_process.CHECKOUT_COMPLETED:
+            raise ShopRequestError(f'Checkout failed: {outcome}.')
+        return {'wallet': session.user.wallet}
+
+    @staticmethod
+    def __complete_checkout(session: Session) -> str:
+        """
+        Commit the reservations of a session and save the wallet it paid from, which journals the sale and writes files
+        """
+        wallet_before: float = session.user.wallet
+        outcome: str = checkout_process.complete_purchase(
+            user=session.user,
+            cart=session.cart,
+            owner=session.session_id
+        )
+        if outcome == checkout_process.CHECKOUT_COMPLETED and wallet_before > session.user.wallet:
+            UserDataManager.update_wallet(username=session.user.name, new_value=session.user.wallet)
+        return outcome
+
+    async def __logout(self, request: dict, connection: ShopConnection) -> dict:
+        session: Session = self.__get_session(connection=connection)
+        self.session_manager.close_session(session_id=session.session_id)  # Also returns its reservations
+        connection.session = None
+        return dict()
+
+
+#########################
+# SHOP SERVER FUNCTIONS #
+#########################
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    server: asyncio.Server = await ShopServer().start(host=host, port=port)
+    print(f"Serving the shop on {', '.join(str(socket.getsockname()) for socket in server.sockets)}")
+    async with server:
+        await server.serve_forever()
+
+
+def shop_server_app() -> None:
+    parser: ArgumentParser = ArgumentParser(description='Serve the shop to many clients over a JSON-lines protocol')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    arguments = parser.parse_args()
+    asyncio.run(serve(host=arguments.host, port=arguments.port))
+
+
+if __name__ == '__main__':
+    shop_server_app()
@@ -0,0 +1,209 @@
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_data import PRODUCTS_FILE_PATHNAME, get_products
+from online_shopping_cart.product.product_inventory import ProductInventory
+from online_shopping_cart.product.product_journal import InventoryJournal
+from online_shopping_cart.user.user import User
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_store import UserStore
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from csv import DictReader
+from itertools import groupby
+from time import perf_counter
+from typing import Iterator
+from zlib import crc32
+import json
+import os
+
+##########################
+# ORDER REPLAY CONSTANTS #
+##########################
+
+
+ORDER_UNKNOWN_USER: str = 'unknown_user'
+ORDER_UNKNOWN_PRODUCT: str = 'unknown_product'
+
+
+##########################
+# ORDER REPLAY FUNCTIONS #
+##########################
+
+
+def read_orders(file_name: str) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+    """
+    Read orders as username and product lines, from a CSV file with one line per row (Order, Username, Product,
+    Units) or from a JSON-lines file with one order per line ({"username": ..., "items": {product: units}})
+    """
+    with open(file=file_name, mode='r', newline='') as file:
+        if file_name.endswith('.csv'):
+            for _, rows in groupby(DictReader(file), key=lambda row: row['Order']):
+                rows: list[dict[str, str]] = list(rows)
+                yield rows[0]['Username'], [(row['Product'], int(row['Units'])) for row in rows]
+        else:
+            for line in file:
+                if line.strip():
+                    order: dict = json.loads(line)
+                    yield order['username'], [(name, int(units)) for name, units in order['items'].items()]
+
+
+def get_shard(username: str, shard_count: int) -> int:
+    return crc32(username.encode('utf-8')) % shard_count
+
+
+def load_catalog(products_file_name: str) -> tuple[ProductCatalog, InventoryJournal]:
+    """
+    Load the products along with the units sold since the products file was last written, and the journal they are in
+    """
+    catalog: ProductCatalog = get_products(file_name=products_file_name)
+    journal: InventoryJournal = InventoryJournal(csv_file_name=products_file_name)
+    journal.replay(catalog=catalog)
+    return catalog, journal
+
+
+def replay_shard(orders: list[tuple[str, list[tuple[str, int]]]], wallets: dict[str, float],
+                 products_file_name: str = PRODUCTS_FILE_PATHNAME) -> dict:
+    """
+    Check out the orders of a shard in order against its own copy of the catalog, and return the final wallets of its
+    users, the units sold by catalog position and the number of orders per outcome
+    """
+    catalog, _ = load_catalog(products_file_name=products_file_name)
+    inventory: ProductInventory = ProductInventory(catalog=catalog)  # Without a journal, the results are merged
+    initial_units: list[int] = [product.units for product in catalog]
+    users: dict[str, User] = dict()
+    outcomes: dict[str, int] = dict()
+
+    for username, lines in orders:
+        if username not in wallets:
+            outcome: str = ORDER_UNKNOWN_USER
+        else:
+            user: User = users.setdefault(username, User(name=username, wallet=wallets[username]))
+            units_by_name: dict[str, int] = dict()  # A product may be on several lines of an order
+            for name, units in lines:
+                units_by_name[name] = units_by_name.get(name, 0) + units
+            cart: ShoppingCart = ShoppingCart()
+            for name, units in units_by_name.items():
+                product: Product | None = catalog.get_product_by_name(name=name)
+                if product is None:
+                    outcome: str = ORDER_UNKNOWN_PRODUCT
+                    break
+                cart.add_item(product=Product(name=product.name, price=product.price, units=units))
+            else:
+                outcome: str = checkout_process.complete_purchase(user=user, cart=cart, inventory=inventory)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    unit_deltas: dict[int, int] = dict()
+    for position, (product, units) in enumerate(zip(catalog, initial_units)):
+        if product.units != units:
+            unit_deltas[position] = product.units - units
+    return {
+        'wallets': {username: user.wallet for username, user in users.items()},
+        'unit_deltas': unit_deltas,
+        'outcomes': outcomes
+    }
+
+
+def replay_orders(orders_file_name: str, products_file_name: str = PRODUCTS_FILE_PATHNAME,
+                  max_workers: int | None = None, is_apply: bool = False) -> dict:
+    """
+    Replay orders through checkout, sharded by username over a process pool, and merge the results.
+
+    Each user's orders stay in file order on a single shard, so wallets are exact. Stock is checked against each
+    shard's own copy of the catalog, so products sold out across shards are reported as oversold. With is_apply the
+    wallets are saved and the units sold are written into the products file, unless a product is oversold, in which
+    case nothing is applied as the orders checked out against stock that was not there.
+    """
+    start_time: float = perf_counter()
+    shard_count: int = max_workers or os.cpu_count() or 1
+    user_store: UserStore = UserDataManager.load_users()
+    shards: list[list[tuple[str, list[tuple[str, int]]]]] = [list() for _ in range(shard_count)]
+    shard_wallets: list[dict[str, float]] = [dict() for _ in range(shard_count)]
+    for username, lines in read_orders(file_name=orders_file_name):
+        shard: int = get_shard(username=username, shard_count=shard_count)
+        shards[shard].append((username, lines))
+        user: dict[str, str | float] | None = user_store.find_user(username=username)
+        if user is not None and user['username'] == username:
+            shard_wallets[shard][username] = user['wallet']
+    read_seconds: float = perf_counter() - start_time
+
+    if shard_count == 1:
+        results: list[dict] = [replay_shard(shards[0], shard_wallets[0], products_file_name)]
+    else:
+        with ProcessPoolExecutor(max_workers=shard_count) as executor:
+            results: list[dict] = list(executor.map(
+                replay_shard, shards, shard_wallets, [products_file_name] * shard_count
+            ))
+
+    wallets: dict[str, float] = dict()
+    position_deltas: dict[int, int] = dict()
+    outcomes: dict[str, int] = dict()
+    for result in results:
+        wallets.update(result['wallets'])  # Shards never share a user
+        for position, delta in result['unit_deltas'].items():
+            position_deltas[position] = position_deltas.get(position, 0) + delta
+        for outcome, count in result['outcomes'].items():
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+    catalog, journal = load_catalog(products_file_name=products_file_name)
+    unit_deltas: dict[str, int] = dict()
+    for position, delta in position_deltas.items():
+        unit_deltas[catalog[position].name] = unit_deltas.get(catalog[position].name, 0) + delta
+    oversold: list[str] = [
+        catalog[position].name for position, delta in position_deltas.items() if catalog[position].units + delta < 0
+    ]
+
+    is_applied: bool = is_apply and not oversold
+    if is_applied:
+        for username, wallet in wallets.items():
+            user_store.find_user(username=username)['wallet'] = wallet
+        UserDataManager.save_users(data=user_store)
+        journal.record(deltas=position_deltas)  # Along with the sales already in the journal
+        journal.close()
+
+    total_seconds: float = perf_counter() - start_time
+    orders: int = sum(outcomes.values())
+    return {
+        'orders': orders,
+        'outcomes': outcomes,
+        'shards': shard_count,
+        'wallets': wallets,
+        'unit_deltas': unit_deltas,
+        'oversold': oversold,
+        'is_applied': is_applied,
+        'read_seconds': read_seconds,
+        'total_seconds': total_seconds,
+        'orders_per_second': orders / total_seconds if total_seconds else 0.0
+    }
+
+
+def order_replay_app() -> None:
+    parser: ArgumentParser = ArgumentParser(description='Replay historical orders through checkout in bulk')
+    parser.add_argument('orders', help='orders as CSV (Order,Username,Product,Units) or JSON lines')
+    parser.add_argument('--products', default=PRODUCTS_FILE_PATHNAME, help='products CSV file')
+    parser.add_argument('--users', default=UserDataManager.USER_FILE_PATHNAME, help='users JSON file')
+    parser.add_argument('--workers', type=int, help='number of shards and worker processes (default: CPU count)')
+    parser.add_argument('--apply', action='store_true', help='save the wallets and write the units sold')
+    arguments = parser.parse_args()
+
+    UserDataManager.USER_FILE_PATHNAME = arguments.users
+    summary: dict = replay_orders(
+        orders_file_name=arguments.orders,
+        products_file_name=arguments.products,
+        max_workers=arguments.workers,
+        is_apply=arguments.apply
+    )
+    print(f"Orders: {summary['orders']} over {summary['shards']} shards in {summary['total_seconds']:.3f}s "
+          f"(reading {summary['read_seconds']:.3f}s)")
+    print(f"Throughput: {summary['orders_per_second']:.1f} orders/s")
+    print('Outcomes: ' + ', '.join(f'{outcome} {count}' for outcome, count in sorted(summary['outcomes'].items())))
+    print(f"Users: {len(summary['wallets'])}, products sold: {len(summary['unit_deltas'])}, "
+          f"oversold: {len(summary['oversold'])}")
+    if not arguments.apply:
+        print('Dry run, run with --apply to save the results.')
+    elif not summary['is_applied']:
+        print('Not applied, oversold products: ' + ', '.join(summary['oversold']))
+
+
+if __name__ == '__main__':
+    order_replay_app()
@@ -1,5 +1,7 @@
 from online_shopping_cart.product.product_search import display_csv_as_table, display_filtered_table
-from online_shopping_cart.checkout.checkout_process import checkout_and_payment
+from online_shopping_cart.checkout.checkout_process import checkout_and_payment, global_session_manager, \
+    get_global_autocomplete, get_global_products
+from online_shopping_cart.checkout.session_manager import Session
 from online_shopping_cart.user.user_interface import UserInterface
 from online_shopping_cart.user.user_login import login
 
@@ -8,6 +10,15 @@ from online_shopping_cart.user.user_login import login
 ######################################
 
 
+def display_suggestions(prefix: str) -> None:
+    """
+    Display the products whose name starts with a prefix, most units first
+    """
+    print('\nSuggestions:')
+    for name in get_global_autocomplete().suggest(prefix=prefix):
+        print(str(get_global_products().get_product_by_name(name=name)))
+
+
 def search_and_purchase_product() -> None:
     """
     Search for a product and buy it
@@ -20,8 +31,12 @@ def search_and_purchase_product() -> None:
     # Search for products then begin to shop
     while True:
         search_target: str = UserInterface.get_user_input(
-            prompt="Search for products in inventory (type 'all' for the whole inventory): "
+            prompt="Search for products in inventory (type 'all' for the whole inventory, "
+                   "or end with * for suggestions): "
         ).lower()
+        if search_target.endswith('*'):
+            display_suggestions(prefix=search_target[:-1])
+            continue
         if search_target == 'all':
             display_csv_as_table()
         else:
@@ -30,4 +45,9 @@ def search_and_purchase_product() -> None:
         check: str = UserInterface.get_user_input(prompt='\nReady to shop? - y/n: ').lower()
         if check.startswith('y'):
             break
-    checkout_and_payment(login_info=login_info)
+
+    session: Session = global_session_manager.open_session(login_info=login_info)
+    try:
+        checkout_and_payment(login_info=login_info, session=session)
+    finally:
+        global_session_manager.close_session(session_id=session.session_id)  # Logged out or quit
@@ -1,4 +1,6 @@
+from online_shopping_cart.metrics.metrics_registry import timed
 from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_store import UserStore
 ###############################
 # USER AUTHENTICATION CLASSES #
 ###############################
@@ -26,35 +28,56 @@ class PasswordValidator:
 class UserAuthenticator:
 
     @staticmethod
-    def login(username, password, data) -> dict[str, str | float] | None:
-        is_user_registered: bool = False
-
+    def __find_user(username, data) -> dict[str, str | float] | None:
+        if isinstance(data, UserStore):
+            return data.find_user(username=username)  # Indexed lookup instead of a scan
         for entry in data:
             if entry['username'].lower() == username.lower():
-                is_user_registered = True
-            if is_user_registered:
-                if entry['password'].lower() == password.lower():
-                    print('Successfully logged in.')
-                    return {
-                        'username': entry['username'],
-                        'wallet': entry['wallet']
-                    }
-                break
+                return entry
+        return None
+
+    @staticmethod
+    def __get_login_info(entry, password) -> dict[str, str | float] | None:
+        if entry['password'].lower() == password.lower():
+            return {
+                'username': entry['username'],
+                'wallet': entry['wallet']
+            }
+        return None
+
+    @staticmethod
+    def authenticate(username, password, data) -> dict[str, str | float] | None:
+        """
+        Check the credentials of a user without printing anything, and return their login info or None
+        """
+        entry: dict[str, str | float] | None = UserAuthenticator.__find_user(username=username, data=data)
+        if entry is None:
+            return None
+        return UserAuthenticator.__get_login_info(entry=entry, password=password)
+
+    @staticmethod
+    @timed('user_login_seconds')
+    def login(username, password, data) -> dict[str, str | float] | None:
+        entry: dict[str, str | float] | None = UserAuthenticator.__find_user(username=username, data=data)
 
-        if not is_user_registered:
+        if entry is None:
             print('User is not registered.')
-        else:
-            print('Login failed.')
+            return None
+        login_info: dict[str, str | float] | None = UserAuthenticator.__get_login_info(entry=entry, password=password)
+        if login_info is not None:
+            print('Successfully logged in.')
+            return login_info
+        print('Login failed.')
         return None
 
     @staticmethod
+    @timed('user_register_seconds')
     def register(username, password, data) -> None:
         # TODO: Task 1: register username and password as new user to file with 0.0 wallet funds
         # Check if username already exists
-        for entry in data:
-            if entry['username'].lower() == username.lower():
-                print(f"Username '{username}' is already taken.")
-                return
+        if UserAuthenticator.__find_user(username=username, data=data) is not None:
+            print(f"Username '{username}' is already taken.")
+            return
 
         # Validate password
         if not PasswordValidator.is_valid(password):
@@ -1,4 +1,12 @@
+from online_shopping_cart.metrics.metrics_registry import METRICS, timed
+from online_shopping_cart.user.user_file_writer import GroupCommitWriter, DEFAULT_COMMIT_WINDOW_SECONDS
+from online_shopping_cart.user.user_json_stream import iter_users
+from online_shopping_cart.user.user_wallet_ledger import WalletLedger
+from online_shopping_cart.user.user_store import UserStore
+from concurrent.futures import Future
+from threading import Lock
 import json
+import os
 
 ################################
 # USER DATA MANAGEMENT CLASSES #
@@ -8,35 +16,126 @@ import json
 class UserDataManager:
 
     USER_FILE_PATHNAME: str = './files/users.json'
+    WALLET_LEDGER_SUFFIX: str = '.ledger'
+    WALLET_LEDGER_COMPACTION_SIZE: int = 1 << 20  # Fold the ledger back into the user file past this many bytes
+    USER_FILE_COMMIT_WINDOW: float = DEFAULT_COMMIT_WINDOW_SECONDS  # How long concurrent saves are gathered for
+
+    __user_store: UserStore | None = None
+    __user_store_lock: Lock = Lock()
+    __user_file_writers: dict[str, GroupCommitWriter] = dict()
+
+    @staticmethod
+    def __get_file_signature() -> tuple[str, int, int]:
+        file_stat = os.stat(UserDataManager.USER_FILE_PATHNAME)
+        return UserDataManager.USER_FILE_PATHNAME, file_stat.st_mtime_ns, file_stat.st_size
+
+    @staticmethod
+    def __get_wallet_ledger() -> WalletLedger:
+        return WalletLedger(file_name=UserDataManager.USER_FILE_PATHNAME + UserDataManager.WALLET_LEDGER_SUFFIX)
+
+    @staticmethod
+    def __get_user_file_writer() -> GroupCommitWriter:
+        with UserDataManager.__user_store_lock:
+            return UserDataManager.__user_file_writers.setdefault(
+                UserDataManager.USER_FILE_PATHNAME,
+                GroupCommitWriter(
+                    file_name=UserDataManager.USER_FILE_PATHNAME,
+                    commit_window=UserDataManager.USER_FILE_COMMIT_WINDOW
+                )
+            )
+
+    @staticmethod
+    def __write_users(data: list[dict[str, str | float]]) -> Future:
+        wallet_ledger: WalletLedger = UserDataManager.__get_wallet_ledger()
+        ledger_size: list[int] = [0]  # Size of the ledger the written contents hold every update of
+
+        def get_contents() -> bytes:
+            METRICS.increment(name='user_data_file_writes_total')
+            with UserDataManager.__user_store_lock:
+                if isinstance(data, UserStore):
+                    # Include the wallet updates recorded by other processes since the store was loaded
+                    data.ledger_offset = wallet_ledger.replay(user_store=data, offset=data.ledger_offset)
+                    ledger_size[0] = data.ledger_offset
+                    return json.dumps(obj=data.to_list(), indent=2).encode('utf-8')
+                return json.dumps(obj=data, indent=2).encode('utf-8')
+
+        def on_commit() -> None:
+            with UserDataManager.__user_store_lock:
+                if data is not UserDataManager.__user_store:
+                    UserDataManager.__user_store = None  # Reload from the new file contents on next use
+                    return
+                data.file_signature = UserDataManager.__get_file_signature()
+                if wallet_ledger.clear(size=ledger_size[0]):  # Unless updates were recorded since the file was written
+                    data.ledger_offset = 0
+
+        return UserDataManager.__get_user_file_writer().submit(
+            get_contents=get_contents,
+            on_commit=on_commit,
+            source=id(data)  # Contents are produced at write time, so the latest save of the same data holds the others
+        )
+
+    @staticmethod
+    def __load_user_store() -> UserStore:
+        file_signature: tuple[str, int, int] = UserDataManager.__get_file_signature()
+        wallet_ledger: WalletLedger = UserDataManager.__get_wallet_ledger()
+        user_store: UserStore | None = UserDataManager.__user_store
+        if user_store is None or user_store.file_signature != file_signature or \
+                wallet_ledger.get_size() < user_store.ledger_offset:
+            METRICS.increment(name='user_data_file_loads_total')
+            user_store = UserStore(
+                users=iter_users(file_name=UserDataManager.USER_FILE_PATHNAME),
+                file_signature=file_signature
+            )
+            UserDataManager.__user_store = user_store
+        # Pick up wallet updates recorded since the store was loaded, including by other processes
+        user_store.ledger_offset = wallet_ledger.replay(user_store=user_store, offset=user_store.ledger_offset)
+        return user_store
 
     @staticmethod
+    @timed('user_data_load_users_seconds')
     def load_users() -> list[dict[str, str | float]]:
+        """
+        Load the users, reusing the store already in memory while the file is unchanged on disk
+        """
         try:
-            with open(file=UserDataManager.USER_FILE_PATHNAME, mode='r') as file:
-                return json.load(fp=file)
+            with UserDataManager.__user_store_lock:
+                return UserDataManager.__load_user_store()
         except FileNotFoundError:
             print('File not found.')
             exit(1)
 
     @staticmethod
+    def submit_users(data: list[dict[str, str | float]]) -> Future:
+        """
+        Ask for the users to be saved along with the saves requested at the same time, and return a future that is
+        done once they are durable on disk
+        """
+        return UserDataManager.__write_users(data=data)
+
+    @staticmethod
+    @timed('user_data_save_users_seconds')
     def save_users(data: list[dict[str, str | float]]) -> None:
-        with open(file=UserDataManager.USER_FILE_PATHNAME, mode='w') as file:
-            json.dump(obj=data, fp=file, indent=2)
-            
-    @staticmethod
-    def update_wallet(username,new_value):
-        with open(file=UserDataManager.USER_FILE_PATHNAME,mode='r') as file:
-            data = json.load(fp=file)
-            user = {}
-            for x in data:
-                if x["username"] == username:
-                    user = x
-                    break
-            user["wallet"] = new_value
-        
-        with open(file=UserDataManager.USER_FILE_PATHNAME,mode='w') as file:
-            json.dump(data,file,indent=2)
-        
-        
-        
-            
+        """
+        Save the users and wait until they are durable on disk
+        """
+        UserDataManager.submit_users(data=data).result()
+
+    @staticmethod
+    @timed('user_data_update_wallet_seconds')
+    def update_wallet(username, new_value):
+        """
+        Record the new wallet of a user in the wallet ledger rather than rewriting the user file, the username is
+        matched regardless of case as at login
+        """
+        user_store: UserStore = UserDataManager.load_users()
+        with UserDataManager.__user_store_lock:
+            user: dict[str, str | float] | None = user_store.find_user(username=username)
+            if user is None:
+                return
+            user['wallet'] = new_value
+            ledger_size: int = UserDataManager.__get_wallet_ledger().record(
+                username=user['username'],
+                wallet=new_value
+            )
+        if ledger_size >= UserDataManager.WALLET_LEDGER_COMPACTION_SIZE:
+            UserDataManager.save_users(data=user_store)
@@ -0,0 +1,135 @@
+from online_shopping_cart.metrics.metrics_registry import METRICS
+from concurrent.futures import Future
+from collections.abc import Hashable
+from threading import Condition, Lock, Thread
+from time import sleep
+from typing import Callable
+import os
+
+##############################
+# USER FILE WRITER CONSTANTS #
+##############################
+
+
+DEFAULT_COMMIT_WINDOW_SECONDS: float = 0.002
+
+
+############################
+# USER FILE WRITER CLASSES #
+############################
+
+
+class FileWriteBatch:
+    """
+    FileWriteBatch class to hold the latest contents submitted from one source and the future its submitters wait on
+    """
+
+    def __init__(self) -> None:
+        self.future: Future = Future()
+        self.get_contents: Callable[[], bytes] | None = None
+        self.on_commit: Callable[[], None] | None = None
+        self.submissions: int = 0
+
+
+class GroupCommitWriter:
+    """
+    GroupCommitWriter class to replace a file durably, one write for many concurrent requests.
+
+    A writer thread waits for the commit window after the first request so concurrent requests can join, then for
+    every source in the batch writes the contents of its latest request to a temporary file, syncs it, renames it
+    over the file and syncs the directory. Requests from one source produce their contents at write time from the
+    same data, so the latest one holds the earlier ones and they all share its outcome. Requests without a source
+    are written on their own. Requests arriving while a batch is written form the next batch. No caller ever writes,
+    so a save returns once its own batch is durable however busy the file is.
+    """
+
+    def __init__(self, file_name: str, commit_window: float = DEFAULT_COMMIT_WINDOW_SECONDS) -> None:
+        self.file_name: str = file_name
+        self.commit_window: float = commit_window
+        self.__batches: dict[object, FileWriteBatch] = dict()  # By source, in order of their first request
+        self.__writer: Thread | None = None
+        self.__lock: Lock = Lock()
+        self.__submitted: Condition = Condition(self.__lock)
+
+    def submit(self, get_contents: Callable[[], bytes], on_commit: Callable[[], None] | None = None,
+               source: Hashable | None = None) -> Future:
+        """
+        Ask for the file to be replaced with contents produced at write time, and return a future that is done once
+        they are durable. A later request from the same source supersedes this one. The callback runs after the
+        rename, before the future is done.
+        """
+        with self.__lock:
+            if source is None:
+                source = object()  # Never superseded
+            batch: FileWriteBatch | None = self.__batches.get(source)
+            if batch is None:
+                batch = self.__batches[source] = FileWriteBatch()
+            batch.get_contents = get_contents  # The latest contents supersede the earlier ones of the same source
+            batch.on_commit = on_commit
+            batch.submissions += 1
+            if self.__writer is None:
+                self.__writer = Thread(target=self.__run_writer, name='group-commit-writer', daemon=True)
+                self.__writer.start()
+            self.__submitted.notify()
+        return batch.future
+
+    def __run_writer(self) -> None:
+        while True:
+            with self.__lock:
+                self.__submitted.wait_for(lambda: self.__batches)
+            if self.commit_window > 0:
+                sleep(self.commit_window)  # Let concurrent requests join the batch
+            with self.__lock:
+                batches: list[FileWriteBatch] = list(self.__batches.values())
+                self.__batches = dict()
+            for batch in batches:
+                self.__commit(batch=batch)
+
+    def __commit(self, batch: FileWriteBatch) -> None:
+        try:
+            self.__write(contents=batch.get_contents())
+            if batch.on_commit is not None:
+                batch.on_commit()
+        except BaseException as error:
+            batch.future.set_exception(error)
+        else:
+            METRICS.increment(name='user_file_commits_total')
+            METRICS.increment(name='user_file_commit_requests_total', amount=batch.submissions)
+            batch.future.set_result(None)
+
+    def __write(self, contents: bytes) -> None:
+        temporary_file_name: str = f'{self.file_name}.{os.getpid()}.tmp'
+        try:
+            with open(file=temporary_file_name, mode='wb') as file:
+                file.write(contents)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_file_name, self.file_name)
+        except BaseException:
+            try:
+                os.remove(temporary_file_name)
+            except OSError:
+                pass
+            raise
+        _sync_directory(directory_name=os.path.dirname(os.path.abspath(self.file_name)))
+
+
+##############################
+# USER FILE WRITER FUNCTIONS #
+##############################
+
+
+def _sync_directory(directory_name: str) -> None:
+    """
+    Make a rename in a directory durable, where the platform allows opening directories
+    """
+    try:
+        directory: int = os.open(directory_name, os.O_RDONLY)
+    except OSError:
+        return  # Windows cannot open directories, its renames are durable once the file data is
+    try:
+        os.fsync(directory)
+    except OSError:
+        pass
+    finally:
+        os.close(directory)
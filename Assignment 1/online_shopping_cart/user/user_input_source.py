@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+import json
+
+#############################
+# USER INPUT SOURCE CLASSES #
+#############################
+
+
+class InputSource(ABC):
+    """
+    InputSource class to represent where the answers to the user-interface prompts come from
+    """
+
+    @abstractmethod
+    def read(self, prompt: str) -> str:
+        """
+        Answer one prompt
+        """
+
+
+class StdinInputSource(InputSource):
+    """
+    StdinInputSource class to ask an interactive user for each answer
+    """
+
+    def read(self, prompt: str) -> str:
+        return input(prompt)
+
+
+class IteratorInputSource(InputSource):
+    """
+    IteratorInputSource class to answer the prompts from a list or an iterator, in order
+    """
+
+    def __init__(self, inputs: Iterable[str]) -> None:
+        self.inputs: Iterator[str] = iter(inputs)
+        self.read_count: int = 0
+
+    def read(self, prompt: str) -> str:
+        try:
+            answer: str = next(self.inputs)
+        except StopIteration:
+            raise EOFError('No more scripted input') from None  # Same as input() at the end of stdin
+        self.read_count += 1
+        return answer
+
+
+class ScriptInputSource(IteratorInputSource):
+    """
+    ScriptInputSource class to answer the prompts from a JSON-lines script file.
+
+    Every line holds either one answer as a JSON string or several answers as a JSON array of strings.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self.file_name: str = file_name
+        super().__init__(inputs=self.__read_script())
+
+    def __read_script(self) -> Iterator[str]:
+        with open(file=self.file_name, mode='r') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                answers: str | list[str] = json.loads(line)
+                if isinstance(answers, list):
+                    yield from (str(answer) for answer in answers)
+                else:
+                    yield str(answers)
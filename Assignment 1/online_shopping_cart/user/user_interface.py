@@ -1,3 +1,5 @@
+from online_shopping_cart.user.user_input_source import InputSource, StdinInputSource
+
 ##########################
 # USER-INTERFACE CLASSES #
 ##########################
@@ -5,6 +7,15 @@
 
 class UserInterface:
 
+    input_source: InputSource = StdinInputSource()
+
+    @staticmethod
+    def set_input_source(input_source: InputSource) -> None:
+        """
+        Replace where the answers to the prompts come from, for example by a scripted session
+        """
+        UserInterface.input_source = input_source
+
     @staticmethod
     def get_user_input(prompt) -> str:
-        return input(prompt)
+        return UserInterface.input_source.read(prompt=prompt)
@@ -0,0 +1,96 @@
+from json import JSONDecoder, JSONDecodeError
+from typing import Iterator, TextIO
+
+##############################
+# USER JSON STREAM CONSTANTS #
+##############################
+
+
+DEFAULT_CHUNK_SIZE: int = 1 << 16
+WHITESPACE: str = ' \t\n\r'
+
+
+############################
+# USER JSON STREAM CLASSES #
+############################
+
+
+class JSONArrayStream:
+    """
+    JSONArrayStream class to decode the elements of a top-level JSON array one at a time, reading the file in chunks
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.file: TextIO = file
+        self.chunk_size: int = chunk_size
+        self.__decoder: JSONDecoder = JSONDecoder()
+        self.__buffer: str = ''
+        self.__position: int = 0
+        self.__is_end_of_file: bool = False
+
+    def __read_chunk(self) -> bool:
+        if self.__is_end_of_file:
+            return False
+        chunk: str = self.file.read(self.chunk_size)
+        if not chunk:
+            self.__is_end_of_file = True
+            return False
+        self.__buffer = self.__buffer[self.__position:] + chunk  # Drop what has been decoded already
+        self.__position = 0
+        return True
+
+    def __next_character(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it, or '' at the end of the file
+        """
+        while True:
+            while self.__position < len(self.__buffer) and self.__buffer[self.__position] in WHITESPACE:
+                self.__position += 1
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self.__read_chunk():
+                return ''
+
+    def __expect(self, characters: str) -> str:
+        character: str = self.__next_character()
+        if not character or character not in characters:
+            raise JSONDecodeError(f'Expecting one of {characters!r}', self.__buffer, self.__position)
+        self.__position += 1
+        return character
+
+    def __decode_element(self):
+        self.__next_character()  # The decoder does not skip leading whitespace
+        while True:
+            try:
+                element, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+                if end < len(self.__buffer) or self.__is_end_of_file:
+                    self.__position = end
+                    return element
+                # A number at the very end of the buffer may continue in the next chunk
+            except JSONDecodeError:
+                if self.__is_end_of_file:
+                    raise
+            self.__read_chunk()  # At the end of the file this only records it, making the next attempt the last
+
+    def __iter__(self) -> Iterator:
+        self.__expect(characters='[')
+        if self.__next_character() == ']':
+            self.__position += 1
+            return
+        while True:
+            yield self.__decode_element()
+            if self.__expect(characters=',]') == ']':
+                return
+
+
+##############################
+# USER JSON STREAM FUNCTIONS #
+##############################
+
+
+def iter_users(file_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, str | float]]:
+    """
+    Yield the user records of a JSON user file one at a time without reading the whole file
+    """
+    with open(file=file_name, mode='r', encoding='utf-8') as file:
+        yield from JSONArrayStream(file=file, chunk_size=chunk_size)
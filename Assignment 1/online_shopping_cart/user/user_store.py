@@ -0,0 +1,62 @@
+from collections.abc import Sequence
+
+######################
+# USER STORE CLASSES #
+######################
+
+
+class UserStore(Sequence):
+    """
+    UserStore class to keep the user records in file order along with a case-folded username index.
+
+    The records can be read like a list, but only added through append and extend so the index always matches them.
+    """
+
+    def __init__(self, users=(), file_signature=None) -> None:
+        self.__users: list[dict[str, str | float]] = list()
+        self.__index: dict[str, dict[str, str | float]] = dict()
+        self.file_signature: tuple[str, int, int] | None = file_signature  # Path, modification time and size
+        self.ledger_offset: int = 0  # How far the wallet ledger has been applied
+        self.extend(users)
+
+    def __len__(self) -> int:
+        return len(self.__users)
+
+    def __getitem__(self, position):
+        return self.__users[position]
+
+    def __iter__(self):
+        return iter(self.__users)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, UserStore)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'UserStore({self.__users!r})'
+
+    def __index_user(self, user: dict[str, str | float]) -> None:
+        username = user.get('username')
+        if isinstance(username, str):
+            self.__index.setdefault(username.lower(), user)  # The first record wins, as with a scan
+
+    def append(self, user: dict[str, str | float]) -> None:
+        self.__users.append(user)
+        self.__index_user(user=user)
+
+    def extend(self, users) -> None:
+        for user in users:
+            self.append(user)
+
+    def to_list(self) -> list[dict[str, str | float]]:
+        """
+        Retrieve the records as a new list, such as for writing them to the user file
+        """
+        return list(self.__users)
+
+    def find_user(self, username: str) -> dict[str, str | float] | None:
+        """
+        Retrieve the record of a username regardless of case, or None if the user is not registered
+        """
+        return self.__index.get(username.lower())
@@ -0,0 +1,156 @@
+from online_shopping_cart.user.user_store import UserStore
+from contextlib import contextmanager
+from typing import Iterator
+import json
+import logging
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+################################
+# USER WALLET LEDGER CONSTANTS #
+################################
+
+
+LEDGER_LOCK_SUFFIX: str = '.lock'
+
+
+##############################
+# USER WALLET LEDGER GLOBALS #
+##############################
+
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+
+##############################
+# USER WALLET LEDGER CLASSES #
+##############################
+
+
+class WalletLedger:
+    """
+    WalletLedger class to append wallet updates to a journal instead of rewriting the whole user file.
+
+    Every line records the new wallet of one user, so replaying the journal in order over the user file
+    yields the current wallets, and replaying it twice is harmless.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self.file_name: str = file_name
+
+    @contextmanager
+    def __lock(self) -> Iterator[None]:
+        """
+        Hold the lock that appends and clears of the ledger take across processes.
+
+        The lock lives in a file of its own, since a process waiting on the ledger itself could end up appending
+        to a ledger that was removed in the meantime.
+        """
+        with open(file=self.file_name + LEDGER_LOCK_SUFFIX, mode='a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def __parse_entry(self, line: bytes) -> dict[str, str | float] | None:
+        """
+        Parse one recorded update, or log it and return None if the line is torn or malformed
+        """
+        try:
+            entry = json.loads(line)
+            if isinstance(entry, dict) and isinstance(entry.get('username'), str) and \
+                    isinstance(entry.get('wallet'), (int, float)):
+                return entry
+        except ValueError:
+            pass
+        _logger.warning('Skipping malformed wallet ledger line in %s: %r', self.file_name, line[:200])
+        return None
+
+    def get_size(self) -> int:
+        try:
+            return os.path.getsize(self.file_name)
+        except FileNotFoundError:
+            return 0
+
+    def record(self, username: str, wallet: float) -> int:
+        """
+        Append a wallet update and return the size of the ledger after it
+        """
+        update: bytes = json.dumps({'username': username, 'wallet': wallet}).encode('utf-8') + b'\n'
+        with self.__lock(), open(file=self.file_name, mode='a+b') as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell():
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b'\n':
+                    update = b'\n' + update  # Leave the torn end of a crashed write on a line of its own
+            file.write(update)
+            return file.tell()
+
+    def replay(self, user_store: UserStore, offset: int = 0) -> int:
+        """
+        Apply the wallet updates recorded from an offset onwards and return the offset reached
+        """
+        try:
+            with open(file=self.file_name, mode='rb') as file:
+                file.seek(offset)
+                for line in file:
+                    if not line.endswith(b'\n'):
+                        break  # An update still being written, picked up on the next replay
+                    offset += len(line)
+                    entry: dict[str, str | float] | None = self.__parse_entry(line=line)
+                    if entry is None:
+                        continue
+                    user: dict[str, str | float] | None = user_store.find_user(username=entry['username'])
+                    if user is not None:
+                        user['wallet'] = entry['wallet']
+        except FileNotFoundError:
+            pass
+        return offset
+
+    def find_wallet(self, username: str) -> float | None:
+        """
+        Retrieve the last wallet recorded for a user, or None if there is none
+        """
+        wallet: float | None = None
+        try:
+            with open(file=self.file_name, mode='rb') as file:
+                for line in file:
+                    if not line.endswith(b'\n'):
+                        break
+                    entry: dict[str, str | float] | None = self.__parse_entry(line=line)
+                    # Matched regardless of case, as the user store does
+                    if entry is not None and entry['username'].lower() == username.lower():
+                        wallet = entry['wallet']
+        except FileNotFoundError:
+            pass
+        return wallet
+
+    def clear(self, size: int | None = None) -> bool:
+        """
+        Drop the recorded updates once the user file holds them, and return whether they were dropped.
+
+        With a size the ledger is only dropped if nothing was appended past it. The check and the removal happen
+        under the ledger lock, so an update appended by another process meanwhile is never lost.
+        """
+        with self.__lock():
+            if size is not None and self.get_size() != size:
+                return False
+            try:
+                os.remove(self.file_name)
+            except FileNotFoundError:
+                pass
+            return True
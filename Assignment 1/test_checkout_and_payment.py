@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from online_shopping_cart.checkout.checkout_process import checkout_and_payment
 from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
 from online_shopping_cart.checkout.shopping_cart import ShoppingCart
 import logging
 
@@ -41,12 +42,12 @@ def mock_cart_with_items():
 
 @pytest.fixture
 def mock_products():
-    mock_products_list = [
+    mock_products_list = ProductCatalog([
         Product(name="Product 1", price=25, units=5),  
         Product(name="Product 2", price=20, units=3),
         Product(name="Product 3", price=15, units=5),
         Product(name="Product 4", price=20, units=0)
-    ]
+    ])
     with patch('online_shopping_cart.checkout.checkout_process.get_products', return_value=mock_products_list):
         with patch('online_shopping_cart.checkout.checkout_process.global_products', mock_products_list):
             yield mock_products_list
@@ -319,3 +320,33 @@ def test_negative_wallet_checkout(mock_cart_with_items, mock_products, mock_user
     assert mock_cart_with_items.get_total_price() == 50
     mock_print.assert_any_call("You don't have enough money to complete the purchase. Please try again!")
     mock_print.assert_any_call("You have been logged out.")
+
+#####################################
+# Test Cases for lazy product loads #
+#####################################
+
+def test_products_loaded_once_on_first_use():
+    from online_shopping_cart.checkout import checkout_process
+    from concurrent.futures import ThreadPoolExecutor
+
+    catalog = ProductCatalog([Product(name="Product 1", price=25, units=5)])
+    with patch.object(checkout_process, 'global_products', None), \
+            patch.object(checkout_process, 'global_journal', None), \
+            patch.object(checkout_process, 'get_products', return_value=catalog) as mock_get_products:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: checkout_process.get_global_products(), range(32)))
+        assert all(result is catalog for result in results)
+        mock_get_products.assert_called_once()
+
+def test_preload_products():
+    from online_shopping_cart.checkout import checkout_process
+
+    catalog = ProductCatalog()
+    with patch.object(checkout_process, 'global_products', None), \
+            patch.object(checkout_process, 'global_journal', None), \
+            patch.object(checkout_process, 'get_products', return_value=catalog) as mock_get_products:
+        checkout_process.preload()
+        assert checkout_process.global_products is catalog
+        assert checkout_process.global_journal.catalog is catalog
+        checkout_process.preload()
+        mock_get_products.assert_called_once()
@@ -0,0 +1,41 @@
+import json
+from unittest.mock import patch
+from online_shopping_cart.data.data_generator import write_products_file, write_users_file, generate_users
+from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.user.user_data import UserDataManager
+
+
+# Test Case 1: Generated catalogs are read by get_products and are reproducible
+def test_generated_products_file(tmp_path):
+    write_products_file(str(tmp_path / "a.csv"), count=500, seed=7)
+    write_products_file(str(tmp_path / "b.csv"), count=500, seed=7)
+    assert (tmp_path / "a.csv").read_text() == (tmp_path / "b.csv").read_text()
+
+    products = get_products(file_name=str(tmp_path / "a.csv"))
+    assert len(products) == 500
+    assert len({product.name for product in products}) == 500
+    assert all(product.price > 0 and product.units >= 0 for product in products)
+
+
+# Test Case 2: Generated users are read by load_users and have valid passwords
+def test_generated_users_file(tmp_path):
+    users_file = tmp_path / "users.json"
+    write_users_file(str(users_file), count=200, seed=7)
+    with patch.object(UserDataManager, 'USER_FILE_PATHNAME', str(users_file)):
+        users = UserDataManager.load_users()
+    assert users == list(generate_users(count=200, seed=7))
+    assert all(set(user) == {"username", "password", "wallet", "credit_cards"} for user in users)
+    for user in users:
+        password = user["password"]
+        assert len(password) >= 8 and any(c.isupper() for c in password) and any(c in "!@#$%^&*" for c in password)
+
+
+# Test Case 3: Different seeds give different data
+def test_generated_users_seed():
+    assert list(generate_users(count=20, seed=1)) != list(generate_users(count=20, seed=2))
+
+
+# Test Case 4: An empty user file is still valid JSON
+def test_generated_users_empty(tmp_path):
+    write_users_file(str(tmp_path / "users.json"), count=0)
+    assert json.loads((tmp_path / "users.json").read_text()) == []
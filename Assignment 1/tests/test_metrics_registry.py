@@ -0,0 +1,83 @@
+import json
+import pytest
+from online_shopping_cart.metrics import metrics_registry
+from online_shopping_cart.metrics.metrics_registry import MetricsRegistry, Histogram, timed
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = MetricsRegistry(enabled=True)
+    monkeypatch.setattr(metrics_registry, 'METRICS', registry)
+    return registry
+
+
+# Test Case 1: Counters and histograms record while enabled
+def test_registry_records(registry):
+    registry.increment("checkout_completed_total")
+    registry.increment("checkout_completed_total", amount=2)
+    registry.observe("checkout_seconds", 0.002)
+    snapshot = registry.get_snapshot()
+    assert snapshot["counters"] == {"checkout_completed_total": 3}
+    assert snapshot["histograms"]["checkout_seconds"]["count"] == 1
+    assert snapshot["histograms"]["checkout_seconds"]["p50"] == 0.005
+    assert json.loads(registry.to_json()) == snapshot
+
+
+# Test Case 2: Timed functions observe their latency
+def test_timed_function(registry):
+    @timed("work_seconds")
+    def work(value):
+        return value * 2
+
+    assert work(21) == 42
+    assert registry.histograms["work_seconds"].count == 1
+
+
+# Test Case 3: Prometheus text format has cumulative buckets
+def test_prometheus_format(registry):
+    registry.increment("logins_total")
+    registry.observe("login_seconds", 0.00002)
+    registry.observe("login_seconds", 20.0)
+    text = registry.to_prometheus()
+    assert "# TYPE logins_total counter\nlogins_total 1\n" in text
+    assert 'login_seconds_bucket{le="5e-05"} 1\n' in text
+    assert 'login_seconds_bucket{le="+Inf"} 2\n' in text
+    assert "login_seconds_count 2\n" in text
+
+
+# Test Case 4: Histogram quantiles come from the bucket bounds
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=(1.0, 2.0, 3.0))
+    for value in [0.5] * 98 + [2.5, 10.0]:
+        histogram.observe(value)
+    assert histogram.get_quantile(0.50) == 1.0
+    assert histogram.get_quantile(0.99) == 3.0
+    assert histogram.get_quantile(1.0) == float("inf")
+
+
+# Test Case 5: Functions decorated while disabled are timed once the registry is enabled
+def test_registry_enabled_after_decoration(registry):
+    registry.disable()
+
+    @timed("work_seconds")
+    def work():
+        return 1
+
+    work()
+    registry.enable()
+    assert work() == 1
+    assert registry.histograms["work_seconds"].count == 1
+
+
+# Invalid Test Case 1: Nothing is recorded while disabled
+def test_registry_disabled(registry):
+    registry.disable()
+
+    @timed("work_seconds")
+    def work():
+        return 1
+
+    assert work() == 1
+    registry.increment("checkout_completed_total")
+    registry.observe("checkout_seconds", 1.0)
+    assert registry.get_snapshot() == {"counters": {}, "histograms": {}}
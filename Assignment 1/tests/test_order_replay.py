@@ -0,0 +1,107 @@
+import json
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.product.product_journal import InventoryJournal
+from online_shopping_cart.shop.order_replay import read_orders, replay_orders
+from online_shopping_cart.user.user_data import UserDataManager
+
+USERS = [
+    {"username": "Alice", "password": "x", "wallet": 10.0},
+    {"username": "Bob", "password": "x", "wallet": 3.0},
+    {"username": "Carol", "password": "x", "wallet": 100.0}
+]
+ORDERS = [
+    {"username": "Alice", "items": {"Apple": 2, "Banana": 1}},
+    {"username": "Bob", "items": {"Apple": 2}},
+    {"username": "Alice", "items": {"Apple": 3}},
+    {"username": "Carol", "items": {"Banana": 1, "Laptop": 1}},
+    {"username": "Dave", "items": {"Apple": 1}},
+    {"username": "Carol", "items": {"Banana": 2}}
+]
+
+
+@pytest.fixture
+def shop_files(tmp_path):
+    users_file = tmp_path / "users.json"
+    users_file.write_text(json.dumps(USERS))
+    products_file = tmp_path / "products.csv"
+    products_file.write_text("Product,Price,Units\nApple,2,10\nBanana,1,2\n")
+    orders_file = tmp_path / "orders.jsonl"
+    orders_file.write_text("\n".join(json.dumps(order) for order in ORDERS) + "\n")
+    with patch.object(UserDataManager, 'USER_FILE_PATHNAME', str(users_file)):
+        yield str(orders_file), str(products_file)
+
+
+# Test Case 1: Orders are checked out per user in file order against the wallets and stock
+def test_replay_orders(shop_files):
+    orders_file, products_file = shop_files
+    summary = replay_orders(orders_file, products_file_name=products_file, max_workers=1)
+    assert summary["orders"] == 6
+    assert summary["outcomes"] == {
+        "completed": 1, "insufficient_funds": 2, "unknown_product": 1, "unknown_user": 1, "out_of_stock": 1
+    }
+    assert summary["wallets"] == {"Alice": 5.0, "Bob": 3.0, "Carol": 100.0}
+    assert summary["unit_deltas"] == {"Apple": -2, "Banana": -1}
+    assert summary["oversold"] == []
+
+
+# Test Case 2: Sharding over processes keeps wallets exact, and stock sold out across shards is reported
+def test_replay_orders_sharded(shop_files):
+    orders_file, products_file = shop_files
+    with open(orders_file, "a") as file:
+        for username in ("Bob", "Carol"):
+            file.write(json.dumps({"username": username, "items": {"Banana": 2}}) + "\n")
+    sharded = replay_orders(orders_file, products_file_name=products_file, max_workers=3)
+    assert sharded["shards"] == 3
+    assert sharded["wallets"]["Alice"] == 5.0
+    assert sharded["wallets"]["Bob"] == 3.0  # Carol took the Bananas of their shard first
+    assert sharded["oversold"] == ["Banana"]
+
+
+# Test Case 3: CSV orders group their rows by order
+def test_read_csv_orders(tmp_path):
+    orders_file = tmp_path / "orders.csv"
+    orders_file.write_text("Order,Username,Product,Units\n1,Alice,Apple,2\n1,Alice,Banana,1\n2,Bob,Apple,1\n")
+    assert list(read_orders(str(orders_file))) == [("Alice", [("Apple", 2), ("Banana", 1)]), ("Bob", [("Apple", 1)])]
+
+
+# Test Case 4: Applying saves the wallets and writes the units sold into the products file
+def test_replay_orders_apply(shop_files):
+    orders_file, products_file = shop_files
+    replay_orders(orders_file, products_file_name=products_file, max_workers=1, is_apply=True)
+    assert UserDataManager.load_users().find_user("Alice")["wallet"] == 5.0
+    assert [product.units for product in get_products(file_name=products_file)] == [8, 1]
+
+
+# Test Case 5: Sales still in the journal count against the stock and are kept when applying
+def test_replay_orders_apply_with_journal(shop_files):
+    orders_file, products_file = shop_files
+    InventoryJournal(csv_file_name=products_file).record({1: -2})
+    summary = replay_orders(orders_file, products_file_name=products_file, max_workers=1, is_apply=True)
+    assert summary["outcomes"]["out_of_stock"] == 2  # No Banana was left
+    assert summary["wallets"]["Alice"] == 4.0
+    assert [product.units for product in get_products(file_name=products_file)] == [7, 0]
+
+
+# Test Case 6: A product on several lines of a CSV order is bought in the units of all its lines
+def test_replay_orders_repeated_lines(shop_files, tmp_path):
+    _, products_file = shop_files
+    orders_file = tmp_path / "orders.csv"
+    orders_file.write_text("Order,Username,Product,Units\n1,Carol,Apple,2\n1,Carol,Apple,3\n")
+    summary = replay_orders(str(orders_file), products_file_name=products_file, max_workers=1)
+    assert summary["wallets"] == {"Carol": 90.0}
+    assert summary["unit_deltas"] == {"Apple": -5}
+
+
+# Invalid Test Case 1: Nothing is applied when products are oversold across shards
+def test_replay_orders_apply_oversold(shop_files):
+    orders_file, products_file = shop_files
+    with open(orders_file, "a") as file:
+        for username in ("Bob", "Carol"):
+            file.write(json.dumps({"username": username, "items": {"Banana": 2}}) + "\n")
+    summary = replay_orders(orders_file, products_file_name=products_file, max_workers=3, is_apply=True)
+    assert summary["oversold"] == ["Banana"]
+    assert not summary["is_applied"]
+    assert UserDataManager.load_users().find_user("Carol")["wallet"] == 100.0
+    assert [product.units for product in get_products(file_name=products_file)] == [10, 2]
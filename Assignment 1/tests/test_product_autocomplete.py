@@ -0,0 +1,103 @@
+import random
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_autocomplete import ProductAutocomplete
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from online_shopping_cart.product.product_inventory import ProductInventory
+
+
+@pytest.fixture
+def catalog():
+    return ProductCatalog([
+        Product(name="Apple", price=2.0, units=10),
+        Product(name="Apricot", price=3.0, units=20),
+        Product(name="apple juice", price=4.0, units=10),
+        Product(name="Avocado", price=1.5, units=0),
+        Product(name="Banana", price=1.0, units=15),
+        Product(name="Apple", price=9.0, units=99)
+    ])
+
+
+@pytest.fixture
+def autocomplete(catalog):
+    autocomplete = ProductAutocomplete(catalog)
+    yield autocomplete
+    autocomplete.close()
+
+
+# Test Case 1: Completions are ranked by units, then alphabetically, ignoring case
+def test_suggest_ranking(autocomplete):
+    assert autocomplete.suggest("a") == ["Apricot", "Apple", "apple juice", "Avocado"]
+    assert autocomplete.suggest("APP", k=1) == ["Apple"]
+    assert autocomplete.suggest("") == ["Apricot", "Banana", "Apple", "apple juice", "Avocado"]
+    assert len(autocomplete) == 5
+
+
+# Test Case 2: Stock changes re-rank the completions
+def test_suggest_follows_stock(catalog, autocomplete):
+    autocomplete.suggest("a")
+    inventory = ProductInventory(catalog=catalog)
+    for _ in range(15):
+        inventory.reserve("Alice", catalog[1])
+    assert autocomplete.suggest("ap") == ["Apple", "apple juice", "Apricot"]
+    inventory.release_all("Alice")
+    assert autocomplete.suggest("ap", k=2) == ["Apricot", "Apple"]
+
+
+# Test Case 3: Products added to the catalog are suggested
+def test_add_product(catalog, autocomplete):
+    autocomplete.suggest("a")
+    catalog.add_product(Product(name="Almond", price=5.0, units=50))
+    catalog.add_product(Product(name="Apple", price=1.0, units=80))
+    assert autocomplete.suggest("al") == ["Almond"]
+    assert autocomplete.suggest("a", k=1) == ["Almond"]
+
+
+# Test Case 4: Results match ranking every completion on a large catalog
+def test_suggest_matches_full_ranking():
+    rng = random.Random(7)
+    names = list({"".join(rng.choice("abc") for _ in range(rng.randint(1, 6))) for _ in range(2000)})
+    catalog = CompactProductCatalog([Product(name=name, price=1.0, units=rng.randint(0, 5)) for name in names])
+    autocomplete = ProductAutocomplete(catalog)
+    try:
+        for prefix in ["", "a", "ab", "cab", "bbb", "ccccc"]:
+            expected = sorted((name for name in names if name.startswith(prefix)),
+                              key=lambda name: (-catalog.get_product_by_name(name).units, name))[:7]
+            assert autocomplete.suggest(prefix, k=7) == expected
+    finally:
+        autocomplete.close()
+
+
+# Test Case 5: Products added in bulk are merged in as one batch, with one rebuild of the ranking
+def test_add_products_in_batch():
+    rng = random.Random(11)
+    names = sorted({"".join(rng.choice("abc") for _ in range(rng.randint(1, 6))) for _ in range(2000)})
+    rng.shuffle(names)
+    catalog = CompactProductCatalog([Product(name=name, price=1.0, units=rng.randint(0, 5)) for name in names[:500]])
+    autocomplete = ProductAutocomplete(catalog)
+    try:
+        autocomplete.suggest("a")
+        build_tree = ProductAutocomplete._ProductAutocomplete__build_tree
+        with patch.object(ProductAutocomplete, '_ProductAutocomplete__build_tree', autospec=True,
+                          side_effect=build_tree) as rebuilds:
+            for name in names[500:] + names[:10]:
+                catalog.add_product(Product(name=name, price=1.0, units=rng.randint(0, 5)))
+            expected = sorted((name for name in names if name.startswith("b")),
+                              key=lambda name: (-catalog.get_product_by_name(name).units, name))[:7]
+            assert autocomplete.suggest("b", k=7) == expected
+            catalog.add_product(Product(name=names[0], price=1.0, units=5))
+            assert autocomplete.suggest("b", k=7) == expected
+        assert rebuilds.call_count == 1
+        assert len(autocomplete) == len(names)
+    finally:
+        autocomplete.close()
+
+
+# Invalid Test Case 1: Unknown prefixes and empty catalogs have no completions
+def test_suggest_nothing(autocomplete):
+    assert autocomplete.suggest("laptop") == []
+    assert autocomplete.suggest("a", k=0) == []
+    empty = ProductAutocomplete(ProductCatalog())
+    assert empty.suggest("") == []
+    empty.close()
@@ -0,0 +1,90 @@
+import pytest
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+
+
+@pytest.fixture
+def catalog():
+    return ProductCatalog([
+        Product(name="Apple", price=2.0, units=10),
+        Product(name="Banana", price=1.0, units=15),
+        Product(name="Backpack", price=25.0, units=1),
+        Product(name="Backpack", price=15.0, units=1)
+    ])
+
+
+# Test Case 1: Products keep their display order
+def test_catalog_keeps_order(catalog):
+    assert len(catalog) == 4
+    assert [product.name for product in catalog] == ["Apple", "Banana", "Backpack", "Backpack"]
+    assert catalog[1].name == "Banana"
+
+
+# Test Case 2: Lookup by name returns the catalog product itself
+def test_catalog_lookup_by_name(catalog):
+    product = catalog.get_product_by_name("Banana")
+    assert product is catalog[1]
+    product.add_product_unit()
+    assert catalog[1].units == 16
+
+
+# Test Case 3: Duplicate names resolve to the first product in the file
+def test_catalog_duplicate_names(catalog):
+    assert catalog.get_product_by_name("Backpack").price == 25.0
+
+
+# Invalid Test Case 1: Unknown name
+def test_catalog_unknown_name(catalog):
+    assert catalog.get_product_by_name("Laptop") is None
+    assert "Laptop" not in catalog
+
+
+@pytest.fixture
+def compact_catalog(catalog):
+    return CompactProductCatalog(catalog)
+
+
+# Test Case 4: Compact catalog holds the same products in the same order
+def test_compact_catalog_keeps_order(catalog, compact_catalog):
+    assert len(compact_catalog) == len(catalog)
+    assert [str(product) for product in compact_catalog] == [str(product) for product in catalog]
+    assert compact_catalog[-1].price == 15.0
+
+
+# Test Case 5: Compact catalog views write through to the catalog
+def test_compact_catalog_views_write_through(compact_catalog):
+    product = compact_catalog.get_product_by_name("Apple")
+    assert isinstance(product, Product)
+    unit = product.get_product_unit()
+    assert (unit.name, unit.price, unit.units) == ("Apple", 2.0, 1)
+    assert compact_catalog[0].units == 9
+    compact_catalog[0].add_product_unit()
+    assert compact_catalog.get_product_by_name("Apple").units == 10
+
+
+# Test Case 6: Compact catalog index grows and keeps the first duplicate
+def test_compact_catalog_index_growth(compact_catalog):
+    for i in range(100):
+        compact_catalog.add_product(Product(name=f"Item {i}", price=1.0, units=i))
+    assert compact_catalog.get_product_by_name("Item 57").units == 57
+    assert compact_catalog.get_product_by_name("Backpack").price == 25.0
+    assert "Item 99" in compact_catalog
+
+
+# Test Case 7: Change listeners hear about the products of their own catalog only
+def test_change_listeners_per_catalog(catalog, compact_catalog):
+    changed = []
+    catalog.add_change_listener(changed.append)
+    compact_catalog.take_units(compact_catalog[0])
+    catalog.take_units(catalog[1])
+    catalog.remove_change_listener(changed.append)
+    catalog.return_units(catalog[1])
+    assert changed == [1]
+
+
+# Invalid Test Case 2: Unknown name and out of range position in the compact catalog
+def test_compact_catalog_unknown_name(compact_catalog):
+    assert compact_catalog.get_product_by_name("Laptop") is None
+    assert "Laptop" not in compact_catalog
+    with pytest.raises(IndexError):
+        compact_catalog[4]
@@ -0,0 +1,55 @@
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.product.product_catalog import CompactProductCatalog
+from online_shopping_cart.product.product_csv_loader import get_chunk_ranges, load_products_parallel, read_header
+from online_shopping_cart.product.product_data import get_products
+
+ROWS = "".join(f'Item {i},{i % 7 + 0.5},{i}\n' for i in range(500))
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "products.csv"
+    file_path.write_text('Product,Price,Units\n"Mouse, Gaming",25,3\n' + ROWS)
+    return str(file_path)
+
+
+# Test Case 1: Chunks cover the rows without gaps and end on line boundaries
+def test_chunk_ranges(csv_file):
+    header, start = read_header(csv_file)
+    assert (header, start) == (["Product", "Price", "Units"], 20)
+    chunk_ranges = get_chunk_ranges(csv_file, start=start, chunk_size=100)
+    with open(csv_file, "rb") as file:
+        contents = file.read()
+    assert chunk_ranges[0][0] == start and chunk_ranges[-1][1] == len(contents)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(chunk_ranges, chunk_ranges[1:]))
+    assert all(contents[end - 1:end] == b"\n" for _, end in chunk_ranges)
+
+
+# Test Case 2: The parallel load matches the single-core load in file order
+def test_parallel_load_matches_sequential(csv_file):
+    products = load_products_parallel(csv_file, max_workers=2, chunk_size=256)
+    assert isinstance(products, CompactProductCatalog)
+    expected = list(get_products(file_name=csv_file, is_stream=True))
+    assert [str(product) for product in products] == [str(product) for product in expected]
+    assert products.get_product_by_name("Mouse, Gaming").price == 25.0
+
+
+# Test Case 3: Files above the size threshold are loaded in parallel
+def test_get_products_uses_parallel_load(csv_file):
+    with patch("online_shopping_cart.product.product_data.PARALLEL_LOAD_MINIMUM_SIZE", 0), \
+            patch("online_shopping_cart.product.product_data.load_products_parallel",
+                  wraps=load_products_parallel) as mock_load:
+        products = get_products(file_name=csv_file)
+    mock_load.assert_called_once()
+    assert len(products) == 501
+
+
+# Invalid Test Case 1: A header without the product columns and an empty file
+def test_parallel_load_invalid(tmp_path):
+    file_path = tmp_path / "products.csv"
+    file_path.write_text("Name,Cost\nApple,2\n")
+    with pytest.raises(ValueError):
+        load_products_parallel(str(file_path))
+    file_path.write_text("Product,Price,Units\n")
+    assert len(load_products_parallel(str(file_path))) == 0
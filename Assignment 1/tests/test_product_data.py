@@ -0,0 +1,47 @@
+import pytest
+from types import GeneratorType
+from online_shopping_cart.product.product_data import get_csv_data, get_products
+from online_shopping_cart.product.product_catalog import ProductCatalog
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "products.csv"
+    file_path.write_text("Product,Price,Units\nApple,2,10\nBanana,1.5,15\n")
+    return str(file_path)
+
+
+# Test Case 1: Streaming rows as lists yields the header up front
+def test_stream_csv_rows(csv_file):
+    header, rows = get_csv_data(csv_file_name=csv_file, is_stream=True)
+    assert header == ["Product", "Price", "Units"]
+    assert isinstance(rows, GeneratorType)
+    assert list(rows) == [["Apple", "2", "10"], ["Banana", "1.5", "15"]]
+
+
+# Test Case 2: Streaming rows as dicts matches the eager mode
+def test_stream_csv_dicts(csv_file):
+    rows = get_csv_data(csv_file_name=csv_file, is_dict=True, is_stream=True)
+    assert list(rows) == get_csv_data(csv_file_name=csv_file, is_dict=True)
+
+
+# Test Case 3: Streaming products yields them lazily
+def test_stream_products(csv_file):
+    products = get_products(file_name=csv_file, is_stream=True)
+    assert isinstance(products, GeneratorType)
+    first_product = next(products)
+    assert (first_product.name, first_product.price, first_product.units) == ("Apple", 2.0, 10)
+    assert [product.name for product in products] == ["Banana"]
+
+
+# Test Case 4: Eager mode still returns a full catalog
+def test_get_products_catalog(csv_file):
+    products = get_products(file_name=csv_file)
+    assert isinstance(products, ProductCatalog)
+    assert products.get_product_by_name("Banana").price == 1.5
+
+
+# Invalid Test Case 1: Missing file is reported when streaming starts
+def test_stream_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        get_csv_data(csv_file_name=str(tmp_path / "missing.csv"), is_stream=True)
@@ -0,0 +1,150 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from online_shopping_cart.product.product_inventory import ProductInventory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def catalog():
+    return ProductCatalog([
+        Product(name="Apple", price=2.0, units=3),
+        Product(name="Banana", price=1.0, units=1)
+    ])
+
+
+@pytest.fixture
+def inventory(catalog, clock):
+    return ProductInventory(catalog=catalog, reservation_ttl=60, clock=clock)
+
+
+# Test Case 1: Reserving takes units out of the catalog until it runs out
+def test_reserve_until_out_of_stock(catalog, inventory):
+    units = [inventory.reserve("Alice", catalog[1]), inventory.reserve("Bob", catalog[1])]
+    assert (units[0].name, units[0].units) == ("Banana", 1)
+    assert units[1] is None
+    assert catalog[1].units == 0
+    assert inventory.get_reserved_units("Alice", "Banana") == 1
+
+
+# Test Case 2: Concurrent shoppers never oversell
+def test_concurrent_reservations_do_not_oversell():
+    catalog = CompactProductCatalog([Product(name="Apple", price=2.0, units=500)])
+    inventory = ProductInventory(catalog=catalog)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        units = list(executor.map(lambda i: inventory.reserve(f"user{i % 16}", catalog[0]), range(800)))
+    assert sum(unit is not None for unit in units) == 500
+    assert catalog[0].units == 0
+    assert sum(inventory.get_reserved_units(f"user{i}", "Apple") for i in range(16)) == 500
+
+
+# Test Case 3: Released and logged out reservations go back to the catalog
+def test_release_reservations(catalog, inventory):
+    for _ in range(3):
+        inventory.reserve("Alice", catalog[0])
+    inventory.reserve("Alice", catalog[1])
+    assert inventory.release("Alice", "Apple") == 1
+    assert catalog[0].units == 1
+    assert inventory.release_all("Alice") == 3
+    assert (catalog[0].units, catalog[1].units) == (3, 1)
+    assert inventory.release("Alice", "Apple") == 0
+    assert catalog[0].units == 3
+
+
+# Test Case 4: Reservations expire after their TTL
+def test_reservations_expire(catalog, inventory, clock):
+    inventory.reserve("Alice", catalog[1])
+    clock.now = 30
+    assert inventory.reserve("Bob", catalog[1]) is None
+    clock.now = 61
+    assert inventory.reserve("Bob", catalog[1]) is not None
+    assert inventory.get_reserved_units("Alice", "Banana") == 0
+    assert catalog[1].units == 0
+
+
+# Test Case 5: Committing turns reservations into sales and takes expired units again
+def test_commit_reservations(catalog, inventory, clock):
+    cart_items = [inventory.reserve("Alice", catalog[0])]
+    inventory.reserve("Alice", catalog[0])
+    cart_items[0].units = 2
+    clock.now = 61
+    inventory.expire_reservations()
+    assert catalog[0].units == 3
+    assert inventory.commit("Alice", cart_items + [Product(name="Laptop", price=1.0, units=1)])
+    assert catalog[0].units == 1
+    assert inventory.get_reserved_units("Alice", "Apple") == 0
+    assert inventory.release_all("Alice") == 0
+
+
+# Invalid Test Case 1: Nothing is committed when expired units were sold in the meantime
+def test_commit_out_of_stock(catalog, inventory, clock):
+    cart_items = [inventory.reserve("Alice", catalog[0]), inventory.reserve("Alice", catalog[1])]
+    clock.now = 61
+    inventory.reserve("Bob", catalog[1])
+    assert not inventory.commit("Alice", cart_items)
+    assert (catalog[0].units, catalog[1].units) == (3, 0)
+
+
+# Test Case 6: Logging out with a full cart returns its units to the catalog
+def test_logout_releases_reservations(catalog):
+    from unittest.mock import patch
+    from online_shopping_cart.checkout.checkout_process import checkout_and_payment
+
+    with patch('online_shopping_cart.checkout.checkout_process.global_products', catalog), \
+            patch('online_shopping_cart.user.user_interface.UserInterface.get_user_input',
+                  side_effect=["1", "1", "2", "l", "y"]), \
+            patch('builtins.print') as mock_print, pytest.raises(SystemExit):
+        checkout_and_payment({"username": "Alice", "wallet": 10.0})
+    mock_print.assert_any_call("Banana added to your cart.")
+    assert (catalog[0].units, catalog[1].units) == (3, 1)
+
+
+# Test Case 7: Units go back to the product they were reserved from when names are shared
+def test_release_duplicate_names(clock):
+    catalog = ProductCatalog([
+        Product(name="Backpack", price=25.0, units=1),
+        Product(name="Backpack", price=15.0, units=5)
+    ])
+    inventory = ProductInventory(catalog=catalog, reservation_ttl=60, clock=clock)
+    for _ in range(2):
+        inventory.reserve("Alice", catalog[1])
+    inventory.reserve("Alice", catalog[0])
+    assert inventory.release("Alice", "Backpack") == 1
+    assert (catalog[0].units, catalog[1].units) == (1, 3)
+    clock.now = 61
+    inventory.expire_reservations()
+    assert (catalog[0].units, catalog[1].units) == (1, 5)
+
+
+# Test Case 8: Checking out sells from the given inventory, and loads nothing when there is none
+def test_complete_purchase_inventory(catalog, inventory):
+    from unittest.mock import patch
+    from online_shopping_cart.checkout import checkout_process
+    from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+    from online_shopping_cart.user.user import User
+
+    cart = ShoppingCart()
+    cart.add_item(inventory.reserve("Alice", catalog[0]))
+    outcome = checkout_process.complete_purchase(User(name="Alice", wallet=10.0), cart, inventory=inventory)
+    assert outcome == checkout_process.CHECKOUT_COMPLETED
+    assert inventory.release_all("Alice") == 0
+
+    cart.add_item(Product(name="Apple", price=2.0, units=1))
+    with patch('online_shopping_cart.checkout.checkout_process.global_products', None), \
+            patch('online_shopping_cart.checkout.checkout_process.get_global_products') as get_global_products:
+        outcome = checkout_process.complete_purchase(User(name="Alice", wallet=10.0), cart)
+    assert outcome == checkout_process.CHECKOUT_COMPLETED
+    get_global_products.assert_not_called()
@@ -0,0 +1,138 @@
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.product.product_catalog import CompactProductCatalog
+from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.product.product_inventory import ProductInventory
+from online_shopping_cart.product.product_journal import InventoryJournal
+
+CSV_CONTENT = "Product,Price,Units\r\nApple,2,10\r\nBanana,1.5,15\r\nApple,3,4\r\n"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "products.csv"
+    file_path.write_bytes(CSV_CONTENT.encode())
+    return file_path
+
+
+# Test Case 1: Purchases go to the journal and are replayed over a fresh load
+def test_record_and_replay(csv_file):
+    journal = InventoryJournal(csv_file_name=str(csv_file))
+    journal.record({0: -2})
+    journal.record({0: -1, 1: -5})
+    assert csv_file.read_bytes() == CSV_CONTENT.encode()
+
+    catalog = get_products(file_name=str(csv_file))
+    assert InventoryJournal(csv_file_name=str(csv_file)).replay(catalog) == 2
+    assert [product.units for product in catalog] == [7, 10, 4]
+
+
+# Test Case 2: Deltas are written into the CSV file once enough purchases are recorded
+def test_flush_on_count(csv_file):
+    journal = InventoryJournal(csv_file_name=str(csv_file), flush_count=2)
+    journal.record({0: -2})
+    journal.record({1: -5})
+    assert journal.wait_for_flush(timeout=5)
+    assert csv_file.read_bytes() == CSV_CONTENT.replace("10\r\nBanana,1.5,15", "8\r\nBanana,1.5,10").encode()
+
+    catalog = get_products(file_name=str(csv_file))
+    assert InventoryJournal(csv_file_name=str(csv_file)).replay(catalog) == 0
+    assert [product.units for product in catalog] == [8, 10, 4]
+
+
+# Test Case 3: Deltas are written into the CSV file once enough time went by
+def test_flush_on_interval(csv_file):
+    clock = FakeClock()
+    journal = InventoryJournal(csv_file_name=str(csv_file), flush_interval=30, clock=clock)
+    journal.record({0: -2})
+    clock.now = 31
+    journal.record({0: -1})
+    assert journal.wait_for_flush(timeout=5)
+    assert b"Apple,2,7" in csv_file.read_bytes()
+
+
+# Test Case 4: Checkouts record the units sold, not the units still reserved
+def test_inventory_records_sales(csv_file):
+    catalog = get_products(file_name=str(csv_file))
+    journal = InventoryJournal(csv_file_name=str(csv_file))
+    journal.replay(catalog)
+    inventory = ProductInventory(catalog=catalog, journal=journal)
+    apple = inventory.reserve("Alice", catalog[0])
+    inventory.reserve("Alice", catalog[0])
+    apple.units = 2
+    inventory.reserve("Alice", catalog[1])
+    assert inventory.commit("Alice", [apple])
+    journal.flush()
+    assert [product.units for product in get_products(file_name=str(csv_file))] == [8, 15, 4]
+
+
+# Test Case 5: Purchases recorded while the CSV file is written stay in the journal, and closing writes them
+def test_record_while_flushing(csv_file):
+    journal = InventoryJournal(csv_file_name=str(csv_file))
+    journal.record({0: -2})
+    write_csv = InventoryJournal._InventoryJournal__write_csv
+
+    def record_then_write_csv(self, deltas):
+        journal.record({1: -1})
+        return write_csv(self, deltas)
+
+    with patch.object(InventoryJournal, '_InventoryJournal__write_csv', record_then_write_csv):
+        journal.flush()
+    assert b"Apple,2,8\r\nBanana,1.5,15" in csv_file.read_bytes()
+
+    catalog = get_products(file_name=str(csv_file))
+    assert InventoryJournal(csv_file_name=str(csv_file)).replay(catalog) == 1
+    assert [product.units for product in catalog] == [8, 14, 4]
+    journal.close()
+    assert b"Apple,2,8\r\nBanana,1.5,14" in csv_file.read_bytes()
+
+
+# Test Case 6: Products sharing a name are journaled and written into their own rows
+def test_duplicate_names(csv_file):
+    catalog = get_products(file_name=str(csv_file))
+    journal = InventoryJournal(csv_file_name=str(csv_file))
+    journal.replay(catalog)
+    inventory = ProductInventory(catalog=catalog, journal=journal)
+    inventory.reserve("Alice", catalog[0])
+    apple = inventory.reserve("Alice", catalog[2])
+    apple.units = 2
+    assert inventory.commit("Alice", [apple])
+
+    replayed = get_products(file_name=str(csv_file))
+    assert InventoryJournal(csv_file_name=str(csv_file)).replay(replayed) == 1
+    assert [product.units for product in replayed] == [9, 15, 3]
+    journal.close()
+    assert b"Apple,2,9\r\nBanana,1.5,15\r\nApple,3,3" in csv_file.read_bytes()
+
+
+# Test Case 7: A journal written by product name is replayed over the first product of each name
+def test_replay_by_name(csv_file):
+    journal_file = csv_file.parent / "products.csv.journal"
+    InventoryJournal(csv_file_name=str(csv_file)).record({0: -2})
+    header = journal_file.read_bytes().splitlines(keepends=True)[0]
+    journal_file.write_bytes(header + b'{"deltas": {"Apple": -2, "Banana": -1}}\n')
+
+    catalog = get_products(file_name=str(csv_file))
+    assert InventoryJournal(csv_file_name=str(csv_file)).replay(catalog) == 1
+    assert [product.units for product in catalog] == [8, 14, 4]
+
+
+# Invalid Test Case 1: A journal left over from before a rewrite of the CSV file is not applied again
+def test_stale_journal_ignored(csv_file):
+    journal = InventoryJournal(csv_file_name=str(csv_file))
+    journal.record({0: -2})
+    stale_journal = (csv_file.parent / "products.csv.journal").read_bytes()
+    journal.flush()
+    (csv_file.parent / "products.csv.journal").write_bytes(stale_journal)
+
+    catalog = CompactProductCatalog(get_products(file_name=str(csv_file), is_stream=True))
+    assert InventoryJournal(csv_file_name=str(csv_file)).replay(catalog) == 0
+    assert catalog[0].units == 8
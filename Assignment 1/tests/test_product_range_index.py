@@ -0,0 +1,116 @@
+import random
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog, CompactProductCatalog
+from online_shopping_cart.product.product_inventory import ProductInventory
+from online_shopping_cart.product.product_range_index import ProductRangeIndex, SortedKeyList
+
+
+@pytest.fixture
+def catalog():
+    return ProductCatalog([
+        Product(name="Apple", price=2.0, units=10),
+        Product(name="Banana", price=1.0, units=15),
+        Product(name="Backpack", price=25.0, units=1),
+        Product(name="Cherry", price=3.0, units=4),
+        Product(name="Date", price=2.0, units=0)
+    ])
+
+
+@pytest.fixture
+def range_index(catalog):
+    range_index = ProductRangeIndex(catalog)
+    yield range_index
+    range_index.close()
+
+
+def get_names(products):
+    return [product.name for product in products]
+
+
+# Test Case 1: Sorted key lists stay sorted across bucket splits and removals
+def test_sorted_key_list():
+    keys = list(range(100))
+    random.Random(7).shuffle(keys)
+    with patch('online_shopping_cart.product.product_range_index.BUCKET_SIZE', 4):
+        sorted_keys = SortedKeyList(keys=keys[:50])
+        for key in keys[50:]:
+            sorted_keys.add(key)
+        for key in range(0, 100, 3):
+            sorted_keys.remove(key)
+    assert len(sorted_keys) == 66
+    assert list(sorted_keys.irange(low=-1, high=100)) == [key for key in range(100) if key % 3]
+    assert list(sorted_keys.irange(low=10, high=20)) == [10, 11, 13, 14, 16, 17, 19, 20]
+
+
+# Test Case 2: Price and units ranges include both bounds and come in value order
+def test_range_queries(range_index):
+    assert get_names(range_index.get_products_by_price(low=1, high=3)) == ["Banana", "Apple", "Date", "Cherry"]
+    assert get_names(range_index.get_products_by_units(high=4)) == ["Date", "Backpack", "Cherry"]
+    assert get_names(range_index.get_products_by_price(low=20)) == ["Backpack"]
+
+
+# Test Case 3: Stock moves and added products are reflected in the ranges
+def test_range_index_follows_changes(catalog, range_index):
+    inventory = ProductInventory(catalog=catalog)
+    for _ in range(8):
+        assert inventory.reserve(owner="Samantha", product=catalog[0])
+    assert get_names(range_index.get_products_by_units(high=4)) == ["Date", "Backpack", "Apple", "Cherry"]
+    inventory.release_all(owner="Samantha")
+    assert get_names(range_index.get_products_by_units(low=10)) == ["Apple", "Banana"]
+
+    catalog.add_product(Product(name="Eggplant", price=2.5, units=3))
+    assert get_names(range_index.get_products_by_price(low=2.1, high=2.9)) == ["Eggplant"]
+
+
+# Test Case 4: Compact catalogs match a full scan over random changes
+def test_compact_range_index_matches_scan():
+    generator = random.Random(11)
+    catalog = CompactProductCatalog(
+        Product(name=f"Item {i}", price=float(generator.randint(1, 50)), units=generator.randint(0, 20))
+        for i in range(300)
+    )
+    range_index = ProductRangeIndex(catalog)
+    try:
+        for _ in range(500):
+            product = catalog[generator.randrange(len(catalog))]
+            if product.units and generator.random() < 0.5:
+                product.get_product_unit()
+            else:
+                product.add_product_unit()
+        low, high = 5, 12
+        assert get_names(range_index.get_products_by_units(low=low, high=high)) == get_names(sorted(
+            (product for product in catalog if low <= product.units <= high),
+            key=lambda product: (product.units, catalog.get_position_by_name(product.name))
+        ))
+    finally:
+        range_index.close()
+
+
+# Test Case 5: Products sharing a name and direct unit changes move their own keys
+def test_range_index_duplicate_names():
+    catalog = ProductCatalog([
+        Product(name="Backpack", price=25.0, units=1),
+        Product(name="Backpack", price=15.0, units=5)
+    ])
+    range_index = ProductRangeIndex(catalog)
+    try:
+        inventory = ProductInventory(catalog=catalog)
+        for _ in range(3):
+            inventory.reserve(owner="Samantha", product=catalog[1])
+        assert [product.price for product in range_index.get_products_by_units(high=2)] == [25.0, 15.0]
+        catalog[1].add_product_unit()
+        catalog[0].get_product_unit()
+        assert [product.units for product in range_index.get_products_by_units()] == [0, 3]
+    finally:
+        range_index.close()
+
+
+# Invalid Test Case 1: Empty ranges, unknown products and missing keys
+def test_range_index_invalid(range_index):
+    assert range_index.get_products_by_price(low=5, high=1) == []
+    assert range_index.get_products_by_units(low=100) == []
+    range_index.refresh_product(99)
+    with pytest.raises(ValueError):
+        SortedKeyList(keys=[1, 2]).remove(3)
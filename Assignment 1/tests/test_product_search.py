@@ -0,0 +1,124 @@
+import pytest
+from re import search, IGNORECASE
+from unittest.mock import patch
+from online_shopping_cart.product.product_search import display_filtered_table
+from online_shopping_cart.product.product_index import ProductSearchIndex, get_search_index
+
+CSV_DATA = ("Product,Price,Units\nApple,2,10\nBanana,1,15\nGreen Apple,2.5,4\nTV,500,1\n"
+            "Ice Cream,4,6\nC++ Primer,30,2\nTea,2,10\n")
+
+
+def regex_filter(rows, search_target):
+    # Reference behaviour: every product name is used as a pattern over the search target
+    return [row for row in rows if search(pattern=row[0], string=search_target.capitalize(), flags=IGNORECASE)]
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "products.csv"
+    file_path.write_text(CSV_DATA)
+    return str(file_path)
+
+
+@pytest.fixture
+def search_index():
+    header, *rows = [line.split(',') for line in CSV_DATA.splitlines()]
+    return ProductSearchIndex(header=header, rows=rows)
+
+
+# Test Case 1: Results match the regex filter for a range of targets
+@pytest.mark.parametrize("search_target", [
+    "apple", "green apple", "APPLE PIE", "banana split", "tv", "a tv stand", "ice cream", "tea time",
+    "steam", "c++ primer", "app", "", "xyz"
+])
+def test_index_matches_regex_filter(search_index, search_target):
+    assert search_index.search(search_target) == regex_filter(search_index.rows, search_target)
+
+
+# Test Case 2: Results come back in file order
+def test_index_keeps_file_order(search_index):
+    assert [row[0] for row in search_index.search("green apple")] == ["Apple", "Green Apple"]
+
+
+# Test Case 3: The displayed table is unchanged
+def test_display_filtered_table(csv_file):
+    with patch("builtins.print") as mock_print:
+        display_filtered_table(csv_file_name=csv_file, search_target="apple")
+    assert [call.args[0] for call in mock_print.call_args_list] == [
+        "\n['Product', 'Price', 'Units']", ['Apple', '2', '10']
+    ]
+
+
+# Test Case 4: The index is reused until the file changes
+def test_index_rebuilt_on_file_change(csv_file):
+    search_index = get_search_index(csv_file_name=csv_file)
+    assert get_search_index(csv_file_name=csv_file) is search_index
+    with open(csv_file, 'a') as file:
+        file.write("Pineapple,3,2\n")
+    rebuilt_index = get_search_index(csv_file_name=csv_file)
+    assert rebuilt_index is not search_index
+    assert [row[0] for row in rebuilt_index.search("pineapple")] == ["Apple", "Pineapple"]
+
+
+# Invalid Test Case 1: Missing file
+def test_index_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        get_search_index(csv_file_name=str(tmp_path / "missing.csv"))
+
+
+@pytest.fixture
+def search_cache():
+    from online_shopping_cart.product.product_search import search_result_cache
+    search_result_cache.clear()
+    with patch.object(search_result_cache, "capacity", 2):
+        yield search_result_cache
+
+
+# Test Case 5: Repeated searches are served from the cache without searching again
+def test_search_cache_hits(csv_file, search_cache):
+    with patch("builtins.print"):
+        display_filtered_table(csv_file_name=csv_file, search_target="Apple")
+        with patch.object(ProductSearchIndex, "search") as mock_search:
+            display_filtered_table(csv_file_name=csv_file, search_target="apple")
+            mock_search.assert_not_called()
+    stats = search_cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+# Test Case 6: The least recently used search is evicted
+def test_search_cache_eviction(csv_file, search_cache):
+    with patch("builtins.print"):
+        for search_target in ("apple", "tea", "apple", "tv", "tea"):
+            display_filtered_table(csv_file_name=csv_file, search_target=search_target)
+    stats = search_cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 4, 2)
+
+
+# Test Case 7: Stock changes in a catalog keep the cached searches of the CSV file
+def test_search_cache_kept_on_stock_change(csv_file, search_cache):
+    from online_shopping_cart.product.product import Product
+    from online_shopping_cart.product.product_catalog import ProductCatalog
+    from online_shopping_cart.product.product_inventory import ProductInventory
+    from online_shopping_cart.product.product_search import display_csv_as_table
+
+    catalog = ProductCatalog([Product(name="Tea", price=2.0, units=10)])
+    with patch("builtins.print"), patch.object(search_cache, "capacity", 8):
+        display_filtered_table(csv_file_name=csv_file, search_target="tea time")
+        display_csv_as_table(csv_file_name=csv_file)
+        ProductInventory(catalog=catalog).reserve("Alice", catalog[0])
+        assert len(search_cache) == 2
+        display_csv_as_table(csv_file_name=csv_file)
+    assert search_cache.get_stats()["invalidations"] == 0
+    assert search_cache.get_stats()["hits"] == 1
+
+
+# Invalid Test Case 2: Cached results are not served once the file changed
+def test_search_cache_file_change(csv_file, search_cache):
+    with patch("builtins.print"):
+        display_filtered_table(csv_file_name=csv_file, search_target="pineapple")
+    with open(csv_file, 'a') as file:
+        file.write("Pineapple,3,2\n")
+    with patch("builtins.print") as mock_print:
+        display_filtered_table(csv_file_name=csv_file, search_target="pineapple")
+    assert mock_print.call_args_list[-1].args[0] == ["Pineapple", "3", "2"]
+    assert search_cache.get_stats()["hits"] == 0
@@ -0,0 +1,106 @@
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.product.product_inventory import ProductInventory
+from online_shopping_cart.product.product_journal import InventoryJournal
+from online_shopping_cart.product.product_range_index import ProductRangeIndex
+from online_shopping_cart.product.product_shared_memory import SharedProductCatalog
+
+
+@pytest.fixture
+def shared_catalog():
+    shared_catalog = SharedProductCatalog.create(ProductCatalog([
+        Product(name="Apple", price=2.0, units=100),
+        Product(name="Crème brûlée", price=4.5, units=3),
+        Product(name="Banana", price=1.0, units=0)
+    ]), lock_count=2)
+    yield shared_catalog
+    shared_catalog.close()
+    shared_catalog.unlink()
+
+
+def sell_apples(attempts):
+    inventory = checkout_process.get_global_inventory()
+    sold = 0
+    for attempt in range(attempts):
+        owner = f"Shopper {attempt}"
+        if inventory.reserve(owner=owner, product=checkout_process.get_global_products()[0]) is not None:
+            sold += inventory.commit(owner=owner, items=[Product(name="Apple", price=2.0, units=1)])
+    return sold
+
+
+# Test Case 1: The shared catalog holds the same products and takes units under its locks
+def test_shared_catalog_contents(shared_catalog):
+    assert [str(product) for product in shared_catalog] == [
+        "Apple - $2.0 - Units: 100", "Crème brûlée - $4.5 - Units: 3", "Banana - $1.0 - Units: 0"
+    ]
+    inventory = ProductInventory(catalog=shared_catalog)
+    assert inventory.reserve(owner="Samantha", product=shared_catalog.get_product_by_name("Crème brûlée"))
+    assert inventory.reserve(owner="Samantha", product=shared_catalog[2]) is None
+    assert inventory.commit(owner="Samantha", items=[Product(name="Crème brûlée", price=4.5, units=3)])
+    assert shared_catalog[1].units == 0
+    assert not inventory.commit(owner="Samantha", items=[Product(name="Crème brûlée", price=4.5, units=1)])
+
+
+# Test Case 2: Worker processes sell from one stock and never oversell it
+def test_workers_share_stock(shared_catalog):
+    with ProcessPoolExecutor(max_workers=4, initializer=checkout_process.use_global_products,
+                             initargs=(shared_catalog,)) as executor:
+        sold = sum(executor.map(sell_apples, [40] * 4))
+    assert sold == 100
+    assert shared_catalog[0].units == 0
+
+
+def sell_apple_units(units):
+    for _ in range(units):
+        checkout_process.get_global_products()[0].get_product_unit()
+    return len(checkout_process.get_global_range_index().get_products_by_units(high=90))
+
+
+# Test Case 3: Units sold in worker processes are journaled by the creating process
+def test_workers_sales_journaled(tmp_path):
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text("Product,Price,Units\nApple,2,100\nBanana,1,5\n")
+    journal = InventoryJournal(csv_file_name=str(csv_file))
+    catalog = get_products(file_name=str(csv_file))
+    journal.replay(catalog)
+    shared_catalog = SharedProductCatalog.create(catalog, lock_count=2, journal=journal)
+    try:
+        with ProcessPoolExecutor(max_workers=2, initializer=checkout_process.use_global_products,
+                                 initargs=(shared_catalog,)) as executor:
+            assert sum(executor.map(sell_apples, [30] * 2)) == 60
+    finally:
+        shared_catalog.close()
+        shared_catalog.unlink()
+    reloaded = get_products(file_name=str(csv_file))
+    InventoryJournal(csv_file_name=str(csv_file)).replay(reloaded)
+    assert [product.units for product in reloaded] == [40, 5]
+
+
+# Test Case 4: Indexes tell when other processes changed the stock, and views change units under the locks
+def test_foreign_changes(shared_catalog):
+    range_index = ProductRangeIndex(shared_catalog)
+    try:
+        shared_catalog[1].units = 1
+        assert not range_index.is_outdated()
+        assert [product.name for product in range_index.get_products_by_units(high=1)] == ["Banana", "Crème brûlée"]
+        with ProcessPoolExecutor(max_workers=1, initializer=checkout_process.use_global_products,
+                                 initargs=(shared_catalog,)) as executor:
+            assert executor.submit(sell_apple_units, 20).result() == 3
+        assert shared_catalog[0].units == 80
+        assert shared_catalog.get_foreign_change_count() == 20
+        assert range_index.is_outdated()
+    finally:
+        range_index.close()
+
+
+# Invalid Test Case 1: The set of products and the names are fixed
+def test_shared_catalog_is_fixed(shared_catalog):
+    with pytest.raises(TypeError):
+        shared_catalog.add_product(Product(name="Cherry", price=3.0, units=1))
+    with pytest.raises(KeyError):
+        shared_catalog.take_units(Product(name="Cherry", price=3.0, units=1))
+    assert shared_catalog.get_product_by_name("Cherry") is None
@@ -0,0 +1,52 @@
+import os
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.product.product_snapshot import get_snapshot_file_name, get_csv_signature, read_snapshot
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "products.csv"
+    file_path.write_text("Product,Price,Units\nApple,2,10\nCafé Latte,3.5,4\nBackpack,25,1\nBackpack,15,1\n")
+    return str(file_path)
+
+
+def product_fields(products):
+    return [(product.name, product.price, product.units) for product in products]
+
+
+# Test Case 1: A full load writes a snapshot matching the CSV file
+def test_snapshot_written_after_load(csv_file):
+    products = get_products(file_name=csv_file)
+    assert os.path.exists(get_snapshot_file_name(csv_file))
+    snapshot_products = read_snapshot(csv_file, get_csv_signature(csv_file))
+    assert product_fields(snapshot_products) == product_fields(products)
+
+
+# Test Case 2: Later loads are served from the snapshot without parsing the CSV file
+def test_snapshot_used_when_unchanged(csv_file):
+    expected = product_fields(get_products(file_name=csv_file))
+    with patch("online_shopping_cart.product.product_data._stream_products") as mock_stream:
+        products = get_products(file_name=csv_file)
+        mock_stream.assert_not_called()
+    assert product_fields(products) == expected
+    assert products.get_product_by_name("Backpack").price == 25.0
+
+
+# Test Case 3: Changing the CSV file invalidates the snapshot
+def test_snapshot_invalidated_on_change(csv_file):
+    get_products(file_name=csv_file)
+    with open(csv_file, 'a') as file:
+        file.write("Tea,2,10\n")
+    assert read_snapshot(csv_file, get_csv_signature(csv_file)) is None
+    assert product_fields(get_products(file_name=csv_file))[-1] == ("Tea", 2.0, 10)
+
+
+# Invalid Test Case 1: A corrupt snapshot falls back to the CSV file
+def test_corrupt_snapshot_ignored(csv_file):
+    expected = product_fields(get_products(file_name=csv_file))
+    with open(get_snapshot_file_name(csv_file), 'r+b') as snapshot_file:
+        snapshot_file.truncate(40)
+    assert read_snapshot(csv_file, get_csv_signature(csv_file)) is None
+    assert product_fields(get_products(file_name=csv_file)) == expected
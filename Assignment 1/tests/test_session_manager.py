@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.checkout.checkout_process import checkout_and_payment
+from online_shopping_cart.checkout.session_manager import SessionManager
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+# Test Case 1: Every user gets their own cart and user
+def test_sessions_have_own_carts(clock):
+    session_manager = SessionManager(clock=clock)
+    alice = session_manager.open_session({"username": "Alice", "wallet": 10.0})
+    bob = session_manager.open_session({"username": "Bob", "wallet": 20.0})
+    alice.cart.add_item(Product(name="Apple", price=2.0, units=1))
+    assert bob.cart.is_empty()
+    assert (bob.user.name, bob.user.wallet) == ("Bob", 20.0)
+    assert session_manager.open_session({"username": "Alice", "wallet": 10.0}) is alice
+    assert len(session_manager) == 2
+
+
+# Test Case 2: Idle sessions are evicted
+def test_idle_sessions_evicted(clock):
+    evicted = []
+    session_manager = SessionManager(idle_timeout=60, on_evict=evicted.append, clock=clock)
+    alice = session_manager.open_session({"username": "Alice", "wallet": 10.0})
+    clock.now = 30
+    session_manager.open_session({"username": "Bob", "wallet": 20.0})
+    clock.now = 61
+    assert session_manager.get_session("Alice") is None
+    assert session_manager.get_session("Bob") is not None
+    assert evicted == [alice]
+
+
+# Test Case 3: The least recently used session goes first when over the caps
+def test_least_recently_used_evicted(clock):
+    session_manager = SessionManager(max_sessions=2, clock=clock)
+    session_manager.open_session({"username": "Alice", "wallet": 10.0})
+    session_manager.open_session({"username": "Bob", "wallet": 20.0})
+    session_manager.get_session("Alice")
+    session_manager.open_session({"username": "Carol", "wallet": 30.0})
+    assert session_manager.get_session("Bob") is None
+    assert session_manager.get_session("Alice") is not None
+
+    session_manager = SessionManager(max_cart_lines=2, clock=clock)
+    alice = session_manager.open_session({"username": "Alice", "wallet": 10.0})
+    alice.cart.add_item(Product(name="Apple", price=2.0, units=1))
+    alice.cart.add_item(Product(name="Banana", price=1.0, units=1))
+    bob = session_manager.open_session({"username": "Bob", "wallet": 20.0})
+    bob.cart.add_item(Product(name="Apple", price=2.0, units=1))
+    session_manager.evict_idle_sessions()
+    assert session_manager.get_session("Alice") is None
+    assert session_manager.get_session("Bob") is bob
+
+
+# Test Case 4: Cart lines are counted as carts change, and the retrieved session is kept when over the caps
+def test_cart_lines_counted(clock):
+    session_manager = SessionManager(max_cart_lines=2, clock=clock)
+    alice = session_manager.open_session({"username": "Alice", "wallet": 10.0})
+    bob = session_manager.open_session({"username": "Bob", "wallet": 20.0})
+    alice.cart.add_item(Product(name="Apple", price=2.0, units=1))
+    alice.cart.add_item(Product(name="Apple", price=2.0, units=1))
+    bob.cart.add_item(Product(name="Banana", price=1.0, units=1))
+    assert session_manager.cart_lines == 2
+    alice.cart.add_item(Product(name="Cherry", price=3.0, units=1))
+    assert session_manager.get_session("Alice") is alice
+    assert session_manager.get_session("Bob") is None
+    assert session_manager.cart_lines == 2
+    alice.cart.clear_items()
+    assert session_manager.cart_lines == 0
+    bob.cart.add_item(Product(name="Apple", price=2.0, units=1))  # Evicted carts no longer count
+    assert session_manager.cart_lines == 0
+
+
+# Test Case 5: Checkout uses the cart and wallet of the session, not the global cart
+def test_checkout_uses_session_cart(clock):
+    products = ProductCatalog([Product(name="Apple", price=2.0, units=5)])
+    session_manager = SessionManager(clock=clock)
+    session = session_manager.open_session({"username": "Alice", "wallet": 10.0})
+    global_cart = ShoppingCart()
+    with patch('online_shopping_cart.checkout.checkout_process.global_products', products), \
+            patch('online_shopping_cart.checkout.checkout_process.global_cart', global_cart), \
+            patch('online_shopping_cart.user.user_interface.UserInterface.get_user_input',
+                  side_effect=["1", "c", "y", "l", "y"]), \
+            patch('online_shopping_cart.checkout.checkout_process.UserDataManager.update_wallet') as update_wallet, \
+            patch('builtins.print'), pytest.raises(SystemExit):
+        checkout_and_payment({"username": "Alice", "wallet": 10.0}, session=session)
+    assert global_cart.is_empty()
+    assert session.user.wallet == 8.0
+    update_wallet.assert_called_once_with("Alice", 8.0)
+
+
+# Invalid Test Case 1: Closing an unknown session is harmless
+def test_close_unknown_session(clock):
+    session_manager = SessionManager(clock=clock)
+    session_manager.close_session("Nobody")
+    assert session_manager.get_session("Nobody") is None
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import pytest
+import threading
+from unittest.mock import patch
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.checkout.session_manager import SessionManager
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_inventory import ProductInventory
+from online_shopping_cart.server.shop_client import ShopClient, parse_command
+from online_shopping_cart.server.shop_server import ShopServer
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_json_stream import iter_users
+
+USERS = [
+    {"username": "Ramanathan", "password": "Notaproblem23*", "wallet": 80, "credit_cards": []},
+    {"username": "Samantha", "password": "SecurePass123/^", "wallet": 150.0, "credit_cards": []}
+]
+
+
+@pytest.fixture
+def shop(tmp_path):
+    users_file = tmp_path / "users.json"
+    users_file.write_text(json.dumps(USERS))
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text("Product,Price,Units\nApple,2,3\nBanana,1,1\n")
+    catalog = ProductCatalog([Product(name="Apple", price=2.0, units=3), Product(name="Banana", price=1.0, units=1)])
+    with patch.object(UserDataManager, 'USER_FILE_PATHNAME', str(users_file)), \
+            patch('online_shopping_cart.checkout.checkout_process.global_products', catalog):
+        yield ShopServer(session_manager=SessionManager(), csv_file_name=str(csv_file)), catalog
+
+
+def run_with_server(shop_server, scenario):
+    async def main():
+        server = await shop_server.start(port=0)
+        async with server:
+            return await scenario(server.sockets[0].getsockname()[1])
+    return asyncio.run(main())
+
+
+# Test Case 1: A client logs in, searches, fills its cart and checks out
+def test_shopping_session(shop):
+    shop_server, catalog = shop
+
+    async def scenario(port):
+        async with await ShopClient.connect(port=port) as client:
+            responses = [
+                await client.request("login", username="samantha", password="securepass123/^"),
+                await client.request("search", query="Apple pie"),
+                await client.request("add", name="Apple"),
+                await client.request("add", name="Apple"),
+                await client.request("add", name="Banana"),
+                await client.request("remove", name="Apple"),
+                await client.request("cart"),
+                await client.request("checkout"),
+                await client.request("logout")
+            ]
+        return responses
+
+    login, search, *_, cart, checkout, logout = run_with_server(shop_server, scenario)
+    assert login == {"ok": True, "username": "Samantha", "wallet": 150.0}
+    assert search == {"ok": True, "header": ["Product", "Price", "Units"], "rows": [["Apple", "2", "3"]]}
+    assert cart["items"] == [{"name": "Apple", "price": 2.0, "units": 1}, {"name": "Banana", "price": 1.0, "units": 1}]
+    assert checkout == {"ok": True, "wallet": 147.0}
+    assert logout == {"ok": True}
+    assert (catalog[0].units, catalog[1].units) == (2, 0)
+    assert UserDataManager.load_users().find_user("Samantha")["wallet"] == 147.0
+
+
+# Test Case 2: Concurrent clients cannot take the same last unit
+def test_concurrent_clients(shop):
+    shop_server, catalog = shop
+
+    async def shopper(port, username, password):
+        async with await ShopClient.connect(port=port) as client:
+            await client.request("login", username=username, password=password)
+            return await client.request("add", name="Banana")
+
+    async def scenario(port):
+        return await asyncio.gather(
+            shopper(port, "Ramanathan", "Notaproblem23*"),
+            shopper(port, "Samantha", "SecurePass123/^")
+        )
+
+    responses = run_with_server(shop_server, scenario)
+    assert sorted(response["ok"] for response in responses) == [False, True]
+    assert catalog[1].units == 0
+
+
+# Test Case 3: Commands of the bundled client are parsed into fields
+def test_parse_command():
+    assert parse_command('add name="Gaming Mouse"') == ("add", {"name": "Gaming Mouse"})
+    with pytest.raises(ValueError):
+        parse_command("add Apple")
+
+
+# Invalid Test Case 1: Bad requests are answered with errors and the connection stays usable
+def test_invalid_requests(shop):
+    shop_server, _ = shop
+
+    async def scenario(port):
+        reader, writer = await asyncio.open_connection(port=port)
+        writer.write(b"not json\n")
+        responses = [json.loads(await reader.readline())]
+        writer.close()
+        async with await ShopClient.connect(port=port) as client:
+            responses += [
+                await client.request("add", name="Apple"),
+                await client.request("fly"),
+                await client.request("login", username="Samantha", password="wrong"),
+                await client.request("login", username="Samantha", password="SecurePass123/^"),
+                await client.request("add", name="Laptop"),
+                await client.request("checkout")
+            ]
+        return responses
+
+    responses = run_with_server(shop_server, scenario)
+    assert [response["ok"] for response in responses] == [False, False, False, False, True, False, False]
+    assert responses[1]["error"] == "Please log in first."
+    assert responses[6]["error"] == "Checkout failed: empty_cart."
+
+
+# Test Case 4: Products can be filtered by price and units ranges
+def test_products_ranges(shop):
+    shop_server, _ = shop
+
+    async def scenario(port):
+        async with await ShopClient.connect(port=port) as client:
+            return [
+                await client.request("products", min_price="1.5"),
+                await client.request("products", max_units=1),
+                await client.request("products", min_price=0, max_price=5, min_units=2),
+                await client.request("products", min_price="cheap")
+            ]
+
+    by_price, by_units, by_both, invalid = run_with_server(shop_server, scenario)
+    assert [product["name"] for product in by_price["products"]] == ["Apple"]
+    assert [product["name"] for product in by_units["products"]] == ["Banana"]
+    assert [product["name"] for product in by_both["products"]] == ["Apple"]
+    assert invalid == {"ok": False, "error": "Invalid price range."}
+
+
+# Test Case 5: Connections logged in as the same user keep their own sessions and reservations
+def test_sessions_per_connection(shop):
+    shop_server, catalog = shop
+
+    async def scenario(port):
+        async with await ShopClient.connect(port=port) as first, await ShopClient.connect(port=port) as second:
+            await first.request("login", username="Samantha", password="SecurePass123/^")
+            await second.request("login", username="Samantha", password="SecurePass123/^")
+            await first.request("add", name="Apple")
+            await second.request("add", name="Apple")
+            await first.request("logout")
+            return await second.request("cart")
+
+    cart = run_with_server(shop_server, scenario)
+    assert cart["items"] == [{"name": "Apple", "price": 2.0, "units": 1}]
+    assert len(shop_server.session_manager) == 0
+
+
+# Test Case 6: Logins look users up in the store loaded once, not by reading the users file
+def test_logins_use_user_store(shop):
+    shop_server, _ = shop
+
+    async def scenario(port):
+        async with await ShopClient.connect(port=port) as client:
+            return [
+                await client.request("login", username="Samantha", password="SecurePass123/^"),
+                await client.request("login", username="Ramanathan", password="Notaproblem23*")
+            ]
+
+    with patch('online_shopping_cart.user.user_data.iter_users', wraps=iter_users) as stream_users:
+        logins = run_with_server(shop_server, scenario)
+    assert [login["ok"] for login in logins] == [True, True]
+    assert stream_users.call_count <= 1
+
+
+# Test Case 7: Adding, removing and checking out take inventory locks and write files off the event loop
+def test_cart_changes_off_event_loop(shop):
+    shop_server, _ = shop
+    callers = []
+
+    def record_caller(function):
+        def call(*args, **kwargs):
+            callers.append((function.__name__, threading.current_thread() is threading.main_thread()))
+            return function(*args, **kwargs)
+        return call
+
+    async def scenario(port):
+        async with await ShopClient.connect(port=port) as client:
+            await client.request("login", username="Samantha", password="SecurePass123/^")
+            await client.request("add", name="Apple")
+            await client.request("add", name="Banana")
+            await client.request("remove", name="Banana")
+            return await client.request("checkout")
+
+    with patch.object(ProductInventory, 'reserve', record_caller(ProductInventory.reserve)), \
+            patch.object(ProductInventory, 'release', record_caller(ProductInventory.release)), \
+            patch.object(checkout_process, 'complete_purchase', record_caller(checkout_process.complete_purchase)):
+        checkout = run_with_server(shop_server, scenario)
+    assert checkout == {"ok": True, "wallet": 148.0}
+    assert callers == [
+        ("reserve", False), ("reserve", False), ("release", False), ("complete_purchase", False)
+    ]
+
+
+# Invalid Test Case 2: Unexpected failures, even exiting, are answered with errors and the server keeps serving
+def test_internal_errors(shop):
+    shop_server, _ = shop
+
+    async def scenario(port):
+        async with await ShopClient.connect(port=port) as client:
+            with patch.object(UserDataManager, 'load_users', side_effect=SystemExit(1)):
+                failed = await client.request("login", username="Samantha", password="SecurePass123/^")
+            return failed, await client.request("login", username="Samantha", password="SecurePass123/^")
+
+    failed, login = run_with_server(shop_server, scenario)
+    assert failed == {"ok": False, "error": "The shop could not handle the request."}
+    assert login["ok"]
@@ -0,0 +1,88 @@
+import pytest
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+
+
+# Test Case 1: Items keep insertion order and repeated adds increment units
+def test_cart_add_keeps_order():
+    cart = ShoppingCart()
+    cart.add_item(Product(name="Milk", price=3.0, units=1))
+    cart.add_item(Product(name="Bread", price=2.0, units=1))
+    cart.add_item(Product(name="Milk", price=3.0, units=1))
+    assert [item.name for item in cart.retrieve_items()] == ["Milk", "Bread"]
+    assert cart.retrieve_items()[0].units == 2
+    assert cart.get_total_price() == 8.0
+
+
+# Test Case 2: Running total follows removals
+def test_cart_remove_updates_total():
+    cart = ShoppingCart()
+    cart.add_item(Product(name="Eggs", price=2.0, units=3))
+    cart.add_item(Product(name="Tea", price=2.5, units=1))
+    cart.remove_item(Product(name="Eggs", price=2.0, units=1))
+    assert cart.get_total_price() == 6.5
+    cart.remove_item(cart.retrieve_items()[1])
+    assert [item.name for item in cart.retrieve_items()] == ["Eggs"]
+    assert cart.get_total_price() == 4.0
+
+
+# Test Case 3: Removing the last unit empties the cart and resets the total
+def test_cart_remove_last_unit():
+    cart = ShoppingCart()
+    cart.add_item(Product(name="Pens", price=0.1, units=1))
+    cart.add_item(Product(name="Pens", price=0.1, units=1))
+    cart.remove_item(Product(name="Pens", price=0.1, units=1))
+    cart.remove_item(Product(name="Pens", price=0.1, units=1))
+    assert cart.is_empty()
+    assert cart.get_total_price() == 0
+
+
+# Test Case 4: Clearing the cart
+def test_cart_clear_items():
+    cart = ShoppingCart()
+    cart.add_item(Product(name="Soap", price=1.0, units=2))
+    cart.clear_items()
+    assert cart.is_empty()
+    assert cart.retrieve_items() == []
+    assert cart.get_total_price() == 0
+
+
+# Test Case 5: Items are a live view, and changing what was read or added leaves the total alone
+def test_cart_items_view():
+    cart = ShoppingCart()
+    items = cart.retrieve_items()
+    milk = Product(name="Milk", price=3.0, units=1)
+    cart.add_item(milk)
+    cart.add_item(Product(name="Bread", price=2.0, units=1))
+    assert len(items) == 2 and items[-1].name == "Bread"
+    milk.units = 10
+    items[0].units = 10
+    assert cart.get_total_price() == 5.0
+    assert [item.units for item in cart.items] == [1, 1]
+    cart.clear_items()
+    assert items == []
+
+
+# Test Case 6: Reads by position list the lines once until lines are added or removed
+def test_cart_items_by_position():
+    cart = ShoppingCart()
+    for number in range(1000):
+        cart.add_item(Product(name=f"Item {number}", price=1.0, units=1))
+    items = cart.retrieve_items()
+    assert [items[position].name for position in range(len(items))] == [f"Item {n}" for n in range(1000)]
+    lines = items._CartItems__lines
+    assert [item.name for item in items[-2:]] == ["Item 998", "Item 999"]
+    cart.add_item(items[5])
+    assert items[5].units == 2
+    assert items._CartItems__lines is lines
+    cart.remove_item(items[0])
+    assert items[0].name == "Item 1" and len(items) == 999
+    assert items._CartItems__lines is not lines
+
+
+# Invalid Test Case 1: Out of range positions in the items view
+def test_cart_items_view_out_of_range():
+    cart = ShoppingCart()
+    cart.add_item(Product(name="Milk", price=3.0, units=1))
+    with pytest.raises(IndexError):
+        cart.retrieve_items()[1]
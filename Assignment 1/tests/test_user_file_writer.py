@@ -0,0 +1,92 @@
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest.mock import patch
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_file_writer import GroupCommitWriter
+
+
+# Test Case 1: Concurrent requests share one write of the latest contents
+def test_concurrent_requests_coalesce(tmp_path):
+    file_path = tmp_path / "users.json"
+    writer = GroupCommitWriter(file_name=str(file_path), commit_window=0.05)
+    written = []
+    barrier = Barrier(8)
+
+    def get_contents(i):
+        written.append(i)
+        return str(i).encode()
+
+    def submit(i):
+        barrier.wait()
+        return writer.submit(get_contents=lambda: get_contents(i), source="users")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = list(executor.map(submit, range(8)))
+    for future in futures:
+        assert future.result(timeout=5) is None
+    assert len(written) < 8
+    assert file_path.read_text() == str(written[-1])
+    assert [path.name for path in tmp_path.iterdir()] == ["users.json"]
+
+
+# Test Case 2: The commit callback runs once the file is replaced
+def test_commit_callback(tmp_path):
+    file_path = tmp_path / "users.json"
+    writer = GroupCommitWriter(file_name=str(file_path), commit_window=0)
+    contents_on_commit = []
+    writer.submit(get_contents=lambda: b"[]",
+                  on_commit=lambda: contents_on_commit.append(file_path.read_bytes())).result(timeout=5)
+    assert contents_on_commit == [b"[]"]
+
+
+# Test Case 3: Concurrent registrations are all saved
+def test_concurrent_save_users(tmp_path):
+    file_path = tmp_path / "users.json"
+    file_path.write_text("[]")
+    with patch.object(UserDataManager, 'USER_FILE_PATHNAME', str(file_path)):
+        user_store = UserDataManager.load_users()
+
+        def register(i):
+            user_store.append({"username": f"user{i}", "password": "x", "wallet": 0.0})
+            UserDataManager.save_users(user_store)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(register, range(32)))
+        assert len(json.loads(file_path.read_text())) == 32
+        assert UserDataManager.load_users() is user_store
+
+
+# Test Case 4: Requests from different sources are all written, in order, and never superseded
+def test_sources_not_superseded(tmp_path):
+    file_path = tmp_path / "users.json"
+    writer = GroupCommitWriter(file_name=str(file_path), commit_window=0.05)
+    written = []
+
+    def get_contents(contents):
+        written.append(contents)
+        return contents
+
+    futures = [writer.submit(get_contents=lambda contents=contents: get_contents(contents))
+               for contents in (b"[1]", b"[2]", b"[3]")]
+    for future in futures:
+        assert future.result(timeout=5) is None
+    assert written == [b"[1]", b"[2]", b"[3]"]
+    assert file_path.read_bytes() == b"[3]"
+
+
+# Invalid Test Case 1: A failed write reaches every waiting caller and leaves the file as it was
+def test_failed_write(tmp_path):
+    file_path = tmp_path / "users.json"
+    file_path.write_text("[]")
+    writer = GroupCommitWriter(file_name=str(file_path), commit_window=0)
+
+    def get_contents():
+        raise ValueError("not serializable")
+
+    with pytest.raises(ValueError):
+        writer.submit(get_contents=get_contents).result()
+    assert file_path.read_text() == "[]"
+    writer.submit(get_contents=lambda: b"[1]").result()
+    assert file_path.read_text() == "[1]"
@@ -0,0 +1,53 @@
+import json
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.user.user_input_source import InputSource, StdinInputSource, IteratorInputSource, \
+    ScriptInputSource
+from online_shopping_cart.user.user_interface import UserInterface
+
+
+@pytest.fixture
+def restore_input_source():
+    input_source = UserInterface.input_source
+    yield
+    UserInterface.set_input_source(input_source)
+
+
+# Test Case 1: Stdin source asks input() with the prompt
+def test_stdin_input_source():
+    with patch("builtins.input", return_value="y") as mock_input:
+        assert StdinInputSource().read("Ready? ") == "y"
+        mock_input.assert_called_once_with("Ready? ")
+
+
+# Test Case 2: Iterator source answers in order and counts the answers
+def test_iterator_input_source(restore_input_source):
+    input_source = IteratorInputSource(["apple", "y"])
+    UserInterface.set_input_source(input_source)
+    assert UserInterface.get_user_input(prompt="Search: ") == "apple"
+    assert UserInterface.get_user_input(prompt="Ready? ") == "y"
+    assert input_source.read_count == 2
+
+
+# Test Case 3: Script source reads single answers and lists of answers
+def test_script_input_source(tmp_path):
+    script_file = tmp_path / "session.jsonl"
+    script_file.write_text(json.dumps("Samantha") + "\n\n" + json.dumps(["apple", "y", 1]) + "\n")
+    input_source = ScriptInputSource(str(script_file))
+    assert [input_source.read("> ") for _ in range(4)] == ["Samantha", "apple", "y", "1"]
+
+
+# Invalid Test Case 1: Running out of answers behaves like the end of stdin
+def test_input_source_exhausted():
+    input_source = IteratorInputSource([])
+    with pytest.raises(EOFError):
+        input_source.read("> ")
+
+
+# Invalid Test Case 2: An input source that does not answer prompts cannot be created
+def test_input_source_without_read():
+    class SilentInputSource(InputSource):
+        pass
+
+    with pytest.raises(TypeError):
+        SilentInputSource()
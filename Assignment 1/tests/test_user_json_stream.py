@@ -0,0 +1,53 @@
+import io
+import json
+import pytest
+from online_shopping_cart.user.user_json_stream import JSONArrayStream, iter_users
+
+USERS = [
+    {"username": "Ramanathan", "password": "Notaproblem23*", "wallet": 80, "credit_cards": []},
+    {"username": "Samantha", "password": "SecurePass123/^", "wallet": 150.5, "credit_cards": [
+        {"card_number": "1234 5678", "expiry_date": "12/30", "name_on_card": "Samantha Åberg", "cvv": "123"}
+    ]},
+    {"username": "Luna", "password": "Moonlight!23", "wallet": 12}
+]
+
+
+@pytest.fixture
+def users_file(tmp_path):
+    file_path = tmp_path / "users.json"
+    file_path.write_text(json.dumps(USERS, indent=2), encoding="utf-8")
+    return file_path
+
+
+# Test Case 1: Records are decoded one at a time across chunk boundaries
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_iter_users_matches_json_load(users_file, chunk_size):
+    assert list(iter_users(str(users_file), chunk_size=chunk_size)) == USERS
+
+
+# Test Case 2: Numbers split at the end of a chunk are read whole
+def test_numbers_across_chunks():
+    assert list(JSONArrayStream(io.StringIO("[1234567, 89,\n [] ]"), chunk_size=3)) == [1234567, 89, []]
+    assert list(JSONArrayStream(io.StringIO("  [ ]  "))) == []
+
+
+# Test Case 3: Records are read from the file only as far as they are asked for
+def test_stream_stops_early(users_file):
+    reads = []
+    with open(users_file, encoding="utf-8") as file:
+        original_read = file.read
+
+        def read(size):
+            reads.append(size)
+            return original_read(size)
+        file.read = read
+        stream = iter(JSONArrayStream(file, chunk_size=16))
+        assert next(stream)["username"] == "Ramanathan"
+        assert sum(reads) < users_file.stat().st_size / 2
+
+
+# Invalid Test Case 1: Malformed files are reported
+@pytest.mark.parametrize("contents", ['{"username": "Luna"}', '[{"username": "Luna"} {}]', '[{"username": "Lu'])
+def test_malformed_file(contents):
+    with pytest.raises(json.JSONDecodeError):
+        list(JSONArrayStream(io.StringIO(contents), chunk_size=4))
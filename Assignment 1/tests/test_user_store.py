@@ -0,0 +1,142 @@
+import json
+import pytest
+from unittest.mock import patch
+from online_shopping_cart.user.user_authentication import UserAuthenticator
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_store import UserStore
+
+USERS = [
+    {"username": "Ramanathan", "password": "Notaproblem23*", "wallet": 80, "credit_cards": []},
+    {"username": "Samantha", "password": "SecurePass123/^", "wallet": 150.0, "credit_cards": []}
+]
+
+
+@pytest.fixture
+def users_file(tmp_path):
+    file_path = tmp_path / "users.json"
+    file_path.write_text(json.dumps(USERS, indent=2))
+    with patch.object(UserDataManager, 'USER_FILE_PATHNAME', str(file_path)):
+        yield file_path
+
+
+# Test Case 1: Lookups ignore the case of the username
+def test_store_find_user():
+    user_store = UserStore(users=USERS)
+    assert user_store.find_user("samantha") is user_store[1]
+    assert user_store.find_user("Nobody") is None
+    assert user_store == USERS
+
+
+# Test Case 2: Appended users are indexed
+def test_store_append_user():
+    user_store = UserStore(users=USERS)
+    user_store.append({"username": "Luna", "password": "Moonlight!23", "wallet": 0.0})
+    assert user_store.find_user("LUNA")["wallet"] == 0.0
+
+
+# Test Case 3: The file is parsed once while it is unchanged
+def test_load_users_reuses_store(users_file):
+    user_store = UserDataManager.load_users()
+    assert isinstance(user_store, UserStore)
+    with patch("json.load") as mock_json_load:
+        assert UserDataManager.load_users() is user_store
+        mock_json_load.assert_not_called()
+
+
+# Test Case 4: The store is reloaded when the file changes
+def test_load_users_reloads_changed_file(users_file):
+    user_store = UserDataManager.load_users()
+    users_file.write_text(json.dumps(USERS + [{"username": "Felix", "password": "x", "wallet": 1.0}], indent=4))
+    reloaded_store = UserDataManager.load_users()
+    assert reloaded_store is not user_store
+    assert reloaded_store.find_user("felix") is not None
+
+
+# Test Case 5: Login, registration and wallet updates go through the store
+def test_store_login_register_update_wallet(users_file):
+    with patch("builtins.print"):
+        assert UserAuthenticator.login("ramanathan", "Notaproblem23*", UserDataManager.load_users()) == {
+            "username": "Ramanathan", "wallet": 80
+        }
+        UserAuthenticator.register("samantha", "Another!Pass1", UserDataManager.load_users())
+    assert len(UserDataManager.load_users()) == 2
+
+    UserDataManager.update_wallet("Samantha", 42.5)
+    assert UserDataManager.load_users().find_user("Samantha")["wallet"] == 42.5
+
+
+# Test Case 6: Wallet updates are appended to the ledger instead of rewriting the user file
+def test_update_wallet_appends_to_ledger(users_file):
+    users_before = users_file.read_text()
+    UserDataManager.update_wallet("Samantha", 42.5)
+    UserDataManager.update_wallet("Ramanathan", 10)
+    UserDataManager.update_wallet("Samantha", 40.0)
+    assert users_file.read_text() == users_before
+
+    # A fresh process replays the ledger over the user file
+    with patch.object(UserDataManager, '_UserDataManager__user_store', None):
+        user_store = UserDataManager.load_users()
+        assert user_store.find_user("Samantha")["wallet"] == 40.0
+        assert user_store.find_user("Ramanathan")["wallet"] == 10
+
+
+# Test Case 7: The ledger is folded back into the user file once it grows too large
+def test_wallet_ledger_compaction(users_file):
+    with patch.object(UserDataManager, 'WALLET_LEDGER_COMPACTION_SIZE', 200):
+        for wallet in range(10):
+            UserDataManager.update_wallet("Samantha", float(wallet))
+    assert json.loads(users_file.read_text())[1]["wallet"] >= 3.0
+    assert UserDataManager.load_users().find_user("Samantha")["wallet"] == 9.0
+    with patch.object(UserDataManager, '_UserDataManager__user_store', None):
+        assert UserDataManager.load_users().find_user("Samantha")["wallet"] == 9.0
+
+
+# Test Case 8: Wallet updates match the username regardless of case, as logins do
+def test_update_wallet_ignores_case(users_file):
+    UserDataManager.update_wallet("samantha", 1.0)
+    assert UserDataManager.load_users().find_user("Samantha")["wallet"] == 1.0
+    with patch.object(UserDataManager, '_UserDataManager__user_store', None):
+        assert UserDataManager.load_users().find_user("SAMANTHA")["wallet"] == 1.0
+
+
+# Test Case 9: The store can only grow through append and extend, which keep the index in step
+def test_store_is_read_only_sequence():
+    user_store = UserStore(users=USERS)
+    with pytest.raises(TypeError):
+        user_store[0] = {"username": "Luna"}
+    with pytest.raises(AttributeError):
+        user_store.pop()
+    assert [user["username"] for user in user_store[::-1]] == ["Samantha", "Ramanathan"]
+    assert user_store.to_list() == USERS and user_store.to_list() is not user_store.to_list()
+
+
+# Invalid Test Case 1: Unknown users are not recorded
+def test_update_wallet_unknown_user(users_file):
+    UserDataManager.update_wallet("Nobody", 1.0)
+    assert not (users_file.parent / "users.json.ledger").exists()
+    assert UserDataManager.load_users().find_user("Samantha")["wallet"] == 150.0
+
+
+# Invalid Test Case 2: Torn or malformed ledger lines are skipped instead of failing the load
+def test_wallet_ledger_skips_bad_lines(users_file, caplog):
+    ledger_file = users_file.parent / "users.json.ledger"
+    ledger_file.write_bytes(b'{"username": "Samantha", "wallet": 12.5}\nnot json\n{"username": "Ramanathan", "wal')
+    UserDataManager.update_wallet("Ramanathan", 7.0)
+    assert ledger_file.read_bytes().count(b"\n") == 4  # The torn update was left on a line of its own
+    with patch.object(UserDataManager, '_UserDataManager__user_store', None):
+        user_store = UserDataManager.load_users()
+        assert user_store.find_user("Samantha")["wallet"] == 12.5
+        assert user_store.find_user("Ramanathan")["wallet"] == 7.0
+    assert "malformed wallet ledger line" in caplog.text
+
+
+# Test Case 10: Compaction keeps the ledger when an update was appended after the user file was written
+def test_wallet_ledger_clear_keeps_late_updates(tmp_path):
+    from online_shopping_cart.user.user_wallet_ledger import WalletLedger
+    wallet_ledger = WalletLedger(file_name=str(tmp_path / "users.json.ledger"))
+    written_size = wallet_ledger.record(username="Samantha", wallet=1.0)
+    wallet_ledger.record(username="Samantha", wallet=2.0)
+    assert not wallet_ledger.clear(size=written_size)
+    assert wallet_ledger.find_wallet(username="samantha") == 2.0
+    assert wallet_ledger.clear(size=wallet_ledger.get_size())
+    assert wallet_ledger.get_size() == 0